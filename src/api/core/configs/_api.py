@@ -23,6 +23,8 @@ class ApiConfig(BaseConfig):
     version: constr(strip_whitespace=True) = Field(..., min_length=1, max_length=16)  # type: ignore
     prefix: constr(strip_whitespace=True) = Field(..., max_length=128)  # type: ignore
     gzip_min_size: int = Field(..., ge=0, le=10_485_760)  # 512 bytes
+    fast_render: bool = Field(default=True)
+    strict_validation: bool = Field(default=True)
     behind_proxy: bool = Field(...)
     behind_cf_proxy: bool = Field(...)
     dev: DevConfig = Field(...)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from urllib.parse import quote_plus
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import Field, conint, constr, SecretStr, model_validator
 from pydantic_settings import SettingsConfigDict
@@ -34,6 +34,17 @@ class DbConfig(BaseConfig):
         constr(strip_whitespace=True, min_length=2, max_length=128)  # type: ignore
     ] = Field(default=None)
     read_dsn_url: Optional[SecretStr] = Field(default=None)
+    read_dsn_urls: Optional[List[SecretStr]] = Field(default=None)
+    read_balance: Literal["round_robin", "least_connections"] = Field(
+        default="round_robin"
+    )
+    read_max_lag: float = Field(default=5.0, ge=0, le=3600)  # 0 means disabled
+    read_check_interval: int = Field(default=10, ge=1, le=3600)  # 10 seconds
+    read_pin_window: int = Field(default=5, ge=0, le=3600)  # 0 means disabled
+    read_failure_threshold: int = Field(default=3, ge=1, le=1000)
+    read_reset_timeout: int = Field(default=30, ge=1, le=3600)  # 30 seconds
+    read_fallback_limit: int = Field(default=10, ge=0, le=10000)  # 0 means disabled
+    read_fallback_timeout: float = Field(default=5.0, ge=0, le=300)  # 5 seconds
 
     connect_args: Optional[Dict[str, Any]] = Field(default=None)
     prefix: constr(strip_whitespace=True) = Field(..., max_length=16)  # type: ignore
@@ -52,6 +63,23 @@ class DbConfig(BaseConfig):
     select_limit: int = Field(..., ge=1, le=100_000)
     select_max_limit: int = Field(..., ge=1, le=10_000_000)
     select_is_desc: bool = Field(...)
+    stream_yield_per: int = Field(default=1000, ge=1, le=100_000)
+    copy_chunk_size: int = Field(default=10_000, ge=1, le=10_000_000)
+    bulk_max_params: int = Field(default=65_535, ge=1, le=1_000_000)
+    stmt_cache_size: int = Field(default=512, ge=0, le=100_000)  # 0 means disabled
+    count_estimate_threshold: int = Field(
+        default=100_000, ge=0, le=1_000_000_000
+    )  # 0 means disabled
+    result_cache_backend: Literal["memory", "redis"] = Field(default="memory")
+    result_cache_size: int = Field(
+        default=10_000, ge=0, le=10_000_000
+    )  # 0 means disabled
+    result_cache_ttl: int = Field(default=60, ge=1, le=86_400)  # 1 minute
+    result_cache_redis_url: Optional[SecretStr] = Field(default=None)
+    row_count_cache_ttl: int = Field(default=5, ge=0, le=3600)  # 0 means disabled
+    row_count_cache_listen: bool = Field(default=False)
+    id_strategy: Literal["unique", "uuid7"] = Field(default="unique")
+    id_node: Optional[conint(ge=0, le=1023)] = Field(default=None)  # type: ignore
 
     model_config = SettingsConfigDict(env_prefix=ENV_PREFIX_DB)
 
@@ -102,6 +130,16 @@ class FrozenDbConfig(DbConfig):
                 database=values["read_database"] or values["database"],
             )
 
+        if not values.get("read_dsn_urls"):
+            values["read_dsn_urls"] = [values["read_dsn_url"]]
+
+        if (values.get("result_cache_backend") == "redis") and (
+            not values.get("result_cache_redis_url")
+        ):
+            raise ValueError(
+                "'result_cache_redis_url' is required for 'redis' result cache backend!"
+            )
+
         return values
 
     model_config = SettingsConfigDict(frozen=True)
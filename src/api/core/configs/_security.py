@@ -85,6 +85,18 @@ class JWTConfig(FrozenBaseConfig):
     model_config = SettingsConfigDict(env_prefix=f"{_ENV_PREFIX_SECURITY}JWT_")
 
 
+class CursorConfig(FrozenBaseConfig):
+    secret: SecretStr = Field(..., min_length=8, max_length=64)
+
+    model_config = SettingsConfigDict(env_prefix=f"{_ENV_PREFIX_SECURITY}CURSOR_")
+
+
+class ReadPinConfig(FrozenBaseConfig):
+    secret: SecretStr = Field(..., min_length=8, max_length=64)
+
+    model_config = SettingsConfigDict(env_prefix=f"{_ENV_PREFIX_SECURITY}READ_PIN_")
+
+
 class PasswordConfig(FrozenBaseConfig):
     pepper: SecretStr = Field(..., min_length=8, max_length=32)
     min_length: int = Field(..., ge=8, le=128)
@@ -114,6 +126,8 @@ class SecurityConfig(FrozenBaseConfig):
     ssl: SSLConfig = Field(...)
     asymmetric: AsymmetricConfig = Field(...)
     jwt: JWTConfig = Field(...)
+    cursor: CursorConfig = Field(...)
+    read_pin: ReadPinConfig = Field(...)
     password: PasswordConfig = Field(default_factory=PasswordConfig)
 
     model_config = SettingsConfigDict(env_prefix=_ENV_PREFIX_SECURITY)
@@ -126,5 +140,7 @@ __all__ = [
     "SSLConfig",
     "AsymmetricConfig",
     "JWTConfig",
+    "CursorConfig",
+    "ReadPinConfig",
     "PasswordConfig",
 ]
@@ -51,6 +51,11 @@ class HTTPSchemeEnum(str, Enum):
     https = "https"
 
 
+class ExportFormatEnum(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
 __all__ = [
     "ENV_PREFIX",
     "ENV_PREFIX_API",
@@ -61,4 +66,5 @@ __all__ = [
     "CurrencyEnum",
     "HashAlgoEnum",
     "HTTPSchemeEnum",
+    "ExportFormatEnum",
 ]
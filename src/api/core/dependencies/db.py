@@ -1,20 +1,33 @@
 # -*- coding: utf-8 -*-
 
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-# from sqlalchemy.orm import Session
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.config import config
+from api.core.constants import ErrorCodeEnum
+from api.core.exceptions import BaseHTTPException
+from api.core.models.mixins import DataLoader
 from api.databases.rdb import (
     AsyncWriteSession,
-    AsyncReadSession,
+    ReadUnavailableError,
+    read_router,
     # WriteSession,
     # ReadSession,
 )
 
+_REQUEST_STATE_KEY = "request_state"
 
-async def async_get_write() -> AsyncGenerator[AsyncSession, None]:
-    """Get write async database session.
+
+async def async_get_write(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Get write async database session, commits mark the request for read-your-writes pinning.
+
+    Args:
+        request (Request, required): The FastAPI request object.
 
     Yields:
         AsyncGenerator[AsyncSession, None]: SQLAlchemy async session.
@@ -24,27 +37,75 @@ async def async_get_write() -> AsyncGenerator[AsyncSession, None]:
     #     yield _async_write_session
 
     _async_write_session: AsyncSession = AsyncWriteSession()
+    _async_write_session.info[_REQUEST_STATE_KEY] = request.state
     try:
         yield _async_write_session
     finally:
+        _async_write_session.info.pop(_REQUEST_STATE_KEY, None)
         await _async_write_session.close()
 
 
-async def async_get_read() -> AsyncGenerator[AsyncSession, None]:
-    """Get read async database session.
+@asynccontextmanager
+async def async_open_read(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Open routed read async database session of the request.
+    Session is routed to an available read replica, or to the primary if the client is pinned
+    after its write (`ReadPinMiddleware`). Unreachable replicas fall back to the primary within
+    limited concurrency budget, beyond it the request fails with 503.
+    Also used directly where session outlives dependencies (e.g. streaming responses).
+
+    Args:
+        request (Request, required): The FastAPI request object.
+
+    Raises:
+        BaseHTTPException: If no read replica is available and primary fallback limit is reached.
 
     Yields:
         AsyncGenerator[AsyncSession, None]: SQLAlchemy async session.
     """
 
-    # async with AsyncReadSession() as _async_read_session:
-    #     yield _async_read_session
-
-    _async_read_session: AsyncSession = AsyncReadSession()
     try:
-        yield _async_read_session
-    finally:
-        await _async_read_session.close()
+        async with read_router.async_session(
+            use_primary=getattr(request.state, "read_pinned", False)
+        ) as _async_read_session:
+            yield _async_read_session
+    except ReadUnavailableError as err:
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.DB_CONNECT_ERROR,
+            message="Read database is unavailable, please try again later.",
+            headers={"Retry-After": str(config.db.read_reset_timeout)},
+        ) from err
+
+
+async def async_get_read(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Get routed read async database session (see `async_open_read()`) with request scoped `DataLoader`.
+
+    Args:
+        request (Request, required): The FastAPI request object.
+
+    Raises:
+        BaseHTTPException: If no read replica is available and primary fallback limit is reached.
+
+    Yields:
+        AsyncGenerator[AsyncSession, None]: SQLAlchemy async session.
+    """
+
+    async with async_open_read(request=request) as _async_read_session:
+        _async_read_session.info[DataLoader.SESSION_INFO_KEY] = DataLoader(
+            async_session=_async_read_session
+        )
+        try:
+            yield _async_read_session
+        finally:
+            _async_read_session.info.pop(DataLoader.SESSION_INFO_KEY, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_request_written(session: Session) -> None:
+    _request_state = session.info.get(_REQUEST_STATE_KEY)
+    if _request_state is not None:
+        _request_state.db_written = True
+
+    return
 
 
 # def get_write() -> Session:
@@ -83,6 +144,7 @@ async def async_get_read() -> AsyncGenerator[AsyncSession, None]:
 
 __all__ = [
     "async_get_write",
+    "async_open_read",
     "async_get_read",
     # "get_write",
     # "get_read",
@@ -119,6 +119,16 @@ class CheckConstraintError(ValueError):
     pass
 
 
+class CursorError(ValueError):
+    """Class for catching invalid or mismatched pagination cursor errors.
+
+    Inherits:
+        ValueError: ValueError class from Python.
+    """
+
+    pass
+
+
 __all__ = [
     "BaseHTTPException",
     "EmptyValueError",
@@ -127,4 +137,5 @@ __all__ = [
     "NullConstraintError",
     "ForeignKeyError",
     "CheckConstraintError",
+    "CursorError",
 ]
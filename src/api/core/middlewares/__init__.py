@@ -2,3 +2,4 @@
 
 from ._process_time import *
 from ._request_id import *
+from ._read_pin import *
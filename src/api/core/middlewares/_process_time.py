@@ -1,27 +1,42 @@
 # -*- coding: utf-8 -*-
 
 import time
-from typing import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import Request, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from starlette.datastructures import MutableHeaders
 
 
-class ProcessTimeMiddleware(BaseHTTPMiddleware):
+class ProcessTimeMiddleware:
     """Calculate process time of each request and add it to response 'X-Process-Time' header.
-
-    Inherits:
-        BaseHTTPMiddleware: Base HTTP middleware from Starlette.
+    Pure ASGI middleware, process time is measured until response start is sent.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        """Constructor method for ProcessTimeMiddleware class.
+
+        Args:
+            app (ASGIApp, required): Next ASGI application.
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         _start_time: int = time.perf_counter_ns()
-        response: Response = await call_next(request)
-        _end_time: int = time.perf_counter_ns()
-        _response_time: float = round((_end_time - _start_time) / 1_000_000, 1)
-        response.headers["X-Process-Time"] = str(_response_time)
 
-        return response
+        async def _send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                _end_time: int = time.perf_counter_ns()
+                _response_time: float = round((_end_time - _start_time) / 1_000_000, 1)
+                MutableHeaders(scope=message)["X-Process-Time"] = str(_response_time)
+
+            await send(message)
+
+        await self.app(scope, receive, _send)
+        return
 
 
 __all__ = ["ProcessTimeMiddleware"]
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from starlette.requests import cookie_parser
+from starlette.datastructures import Headers, MutableHeaders
+
+from api.core import utils
+
+
+class ReadPinMiddleware:
+    """Read-your-writes: pin client reads to the primary database for `window` seconds after its write.
+    Committed write session sets `request.state.db_written`, then response carries signed (HMAC-SHA256)
+    pin expiry token in 'X-Read-Pin' header and cookie. Requests with valid and unexpired pin (cookie
+    or header) get `request.state.read_pinned = True`. Pure ASGI middleware, headers are injected by wrapping `send`.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        secret: str,
+        window: int = 5,
+        cookie_name: str = "read_pin",
+        header_name: str = "X-Read-Pin",
+    ):
+        """Constructor method for ReadPinMiddleware class.
+
+        Args:
+            app         (ASGIApp, required): Next ASGI application.
+            secret      (str    , required): Secret key to sign pin tokens with.
+            window      (int    , optional): Pin window in seconds, 0 means disabled. Defaults to 5.
+            cookie_name (str    , optional): Name of pin cookie. Defaults to "read_pin".
+            header_name (str    , optional): Name of pin header. Defaults to "X-Read-Pin".
+        """
+
+        self.app = app
+        self.secret = secret
+        self.window = window
+        self.cookie_name = cookie_name
+        self.header_name = header_name
+
+    def _is_pinned(self, value: Optional[str]) -> bool:
+        if not value:
+            return False
+
+        try:
+            _payload = utils.decode_cursor(cursor=value, key=self.secret)
+            _until = float(_payload["read_pin"])
+        except (ValueError, TypeError, KeyError):
+            # Unsigned, tampered or other (e.g. cursor) tokens:
+            return False
+
+        _now = time.time()
+        # Pins longer than window are not issued by this middleware:
+        return _now < _until <= (_now + self.window + 1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (scope["type"] != "http") or (self.window <= 0):
+            await self.app(scope, receive, send)
+            return
+
+        _headers = Headers(scope=scope)
+        _value = _headers.get(self.header_name)
+        if (not _value) and ("cookie" in _headers):
+            _value = cookie_parser(_headers["cookie"]).get(self.cookie_name)
+
+        _state = scope.setdefault("state", {})
+        _state["read_pinned"] = self._is_pinned(value=_value)
+
+        async def _send(message: Message) -> None:
+            if (message["type"] == "http.response.start") and _state.get("db_written"):
+                _token = utils.encode_cursor(
+                    payload={"read_pin": round(time.time() + self.window, 3)},
+                    key=self.secret,
+                )
+                _response_headers = MutableHeaders(scope=message)
+                _response_headers[self.header_name] = _token
+                _response_headers.append(
+                    "Set-Cookie",
+                    f"{self.cookie_name}={_token}; Max-Age={self.window}; Path=/; HttpOnly; SameSite=Lax",
+                )
+
+            await send(message)
+
+        await self.app(scope, receive, _send)
+        return
+
+
+__all__ = ["ReadPinMiddleware"]
@@ -1,32 +1,47 @@
 # -*- coding: utf-8 -*-
 
 from uuid import uuid4
-from typing import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import Request, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from starlette.datastructures import Headers, MutableHeaders
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
+class RequestIdMiddleware:
     """Get 'X-Request-ID' or 'X-Correlation-ID' from request header or generate a new one.
     Then add it to `request.state.request_id` and response 'X-Request-ID' header.
-
-    Inherits:
-        BaseHTTPMiddleware: Base HTTP middleware from Starlette.
+    Pure ASGI middleware, header is injected by wrapping `send`.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        _request_id: str = uuid4().hex
-        if "X-Request-ID" in request.headers:
-            _request_id: str = request.headers.get("X-Request-ID")
-        elif "X-Correlation-ID" in request.headers:
-            _request_id: str = request.headers.get("X-Correlation-ID")
+    def __init__(self, app: ASGIApp):
+        """Constructor method for RequestIdMiddleware class.
+
+        Args:
+            app (ASGIApp, required): Next ASGI application.
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        _headers = Headers(scope=scope)
+        _request_id: str = (
+            _headers.get("X-Request-ID")
+            or _headers.get("X-Correlation-ID")
+            or uuid4().hex
+        )
+        scope.setdefault("state", {})["request_id"] = _request_id
+
+        async def _send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = _request_id
 
-        request.state.request_id = _request_id
-        response: Response = await call_next(request)
-        response.headers["X-Request-ID"] = _request_id
+            await send(message)
 
-        return response
+        await self.app(scope, receive, _send)
+        return
 
 
 __all__ = ["RequestIdMiddleware"]
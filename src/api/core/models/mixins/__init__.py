@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
 
+from ._stmt_cache import *
+from ._cache_backend import *
+from ._result_cache import *
+from ._loader import *
 from ._base import *
 from ._crud import *
@@ -1,12 +1,26 @@
 # -*- coding: utf-8 -*-
 
+import re
 import json
+from operator import itemgetter
+from dataclasses import make_dataclass
 from uuid import UUID
-from datetime import datetime
-from typing import Union, List, Dict, Any, Optional, Sequence
+from datetime import datetime, date, time
+from typing import (
+    Union,
+    List,
+    Dict,
+    Any,
+    Optional,
+    Sequence,
+    Tuple,
+    ClassVar,
+    Callable,
+)
 
-from pydantic import validate_call
+import orjson
 from sqlalchemy import (
+    Column,
     BigInteger,
     Uuid,
     String,
@@ -21,21 +35,62 @@ from sqlalchemy import (
     Update,
     Delete,
     Subquery,
+    tuple_,
+    bindparam,
+    cast,
+    literal_column,
+    table,
+    column,
+    values,
+    update,
+    delete as delete_,
+    event,
 )
 from sqlalchemy.orm import (
+    Mapper,
     DeclarativeBase,
     declarative_mixin,
     Mapped,
     mapped_column,
     joinedload,
+    make_transient_to_detached,
 )
-from sqlalchemy.util import ReadOnlyProperties
+from sqlalchemy.engine import Dialect
+from sqlalchemy.dialects import postgresql, mysql, sqlite
+from sqlalchemy.dialects.postgresql import REGCLASS
+from sqlalchemy.sql.elements import ClauseElement
 
 from api.core.constants import WarnEnum
 from api.core import utils
 from api.config import config
+from api.core.exceptions import CursorError
+from api.core.utils import validate_internal_call
 from api.logger import logger
 
+from ._stmt_cache import stmt_cache
+from ._result_cache import result_cache
+
+_WHERE_OPS = {
+    "eq": "eq",
+    "equal": "eq",
+    "=": "eq",
+    "==": "eq",
+    "ne": "ne",
+    "not_equal": "ne",
+    "!=": "ne",
+    "like": "like",
+    "gt": "gt",
+    ">": "gt",
+    "ge": "ge",
+    ">=": "ge",
+    "lt": "lt",
+    "<": "lt",
+    "le": "le",
+    "<=": "le",
+    "between": "between",
+    "in": "in",
+}
+
 
 @declarative_mixin
 class IdStrMixin:
@@ -80,6 +135,12 @@ class TimestampMixin:
 
 @declarative_mixin
 class BaseMixin(TimestampMixin, IdStrMixin):
+    # Opt-in read-through result cache for `async_get()` and `async_get_by_ids()`:
+    __result_cache__: ClassVar[bool] = False
+    # Strategy of string IDs: "unique" or "uuid7", None means `config.db.id_strategy`.
+    # UUID and BIGINT ID columns (`IdUUIDMixin`, `IdIntMixin`) always get time-ordered IDs:
+    __id_strategy__: ClassVar[Optional[str]] = None
+
     def __init__(self, warn_mode: WarnEnum = WarnEnum.ALWAYS, **kwargs):
         if "id" not in kwargs:
             kwargs["id"] = self.__class__.gen_unique_id()
@@ -101,39 +162,126 @@ class BaseMixin(TimestampMixin, IdStrMixin):
         super().__init__()
 
     @classmethod
-    def gen_unique_id(cls) -> str:
-        """Generate unique ID for ORM object.
+    def gen_unique_id(cls) -> Any:
+        """Generate unique ID for ORM object by ID strategy of ORM class.
 
         Returns:
-            str: Unique ID.
+            Any: Unique ID, string, UUID or integer by ID column type.
         """
 
-        _prefix = cls.__name__[0:3]
-        _id = utils.gen_unique_id(prefix=_prefix)
+        _id = cls.gen_unique_ids(count=1)[0]
         return _id
 
-    @validate_call
-    def to_dict(
-        self,
-        excludes: Optional[List[str]] = None,
-        load_relations: Optional[List[str]] = None,
-    ) -> Dict[str, Any]:
-        """Convert ORM object to dictionary.
+    @classmethod
+    def gen_unique_ids(cls, count: int) -> List[Any]:
+        """Generate batch of unique IDs for ORM objects by ID strategy of ORM class.
+        Time-ordered IDs of a batch are reserved from per-process counter at once.
 
         Args:
-            excludes       (Optional[List[str]], optional): List of attributes to exclude. Defaults to None.
-            load_relations (Optional[List[str]], optional): List of relationships to include. Defaults to None.
+            count (int, required): Number of IDs.
 
         Returns:
-            Dict[str, Any]: Dictionary of ORM object.
+            List[Any]: List of unique IDs.
         """
 
-        _dict = {}
-        _columns: ReadOnlyProperties = inspect(self).mapper.column_attrs
-        for _column in _columns:
-            _column_name = _column.key
-            if (not excludes) or (_column_name not in excludes):
-                _dict[_column_name] = getattr(self, _column_name)
+        _strategy = _ID_STRATEGIES.get(cls)
+        if _strategy is None:
+            _strategy = cls._get_id_strategy()
+            _ID_STRATEGIES[cls] = _strategy
+
+        _prefix = cls.__name__[0:3].lower()
+        if _strategy == "uuid":
+            _ids = [
+                UUID(int=_int)
+                for _int in utils.id_generator.gen_uuid7_ints(count=count)
+            ]
+        elif _strategy == "int":
+            _ids = utils.id_generator.gen_int_ids(count=count)
+        elif _strategy == "uuid7":
+            _ids = utils.id_generator.gen_uuid7_hex(prefix=_prefix, count=count)
+        else:
+            _ids = [utils.gen_unique_id(prefix=_prefix) for _ in range(count)]
+
+        return _ids
+
+    @classmethod
+    def _get_id_strategy(cls) -> str:
+        _python_type = None
+        try:
+            _python_type = cls.__table__.c.id.type.python_type
+        except (AttributeError, NotImplementedError):
+            pass
+
+        if _python_type is UUID:
+            return "uuid"
+        elif _python_type is int:
+            return "int"
+
+        _strategy = cls.__id_strategy__ or config.db.id_strategy
+        if _strategy not in ("unique", "uuid7"):
+            raise ValueError(
+                f"Unknown ID strategy '{_strategy}' of `{cls.__name__}` class!"
+            )
+
+        return _strategy
+
+    @classmethod
+    def _has_server_id(cls) -> bool:
+        """Check if database fills missing ID of inserted rows (column default or trigger).
+
+        Returns:
+            bool: True if ID is generated by database.
+        """
+
+        _id_column = cls.__table__.c.id
+        if (_id_column.server_default is not None) or (
+            cls.__table__.autoincrement_column is _id_column
+        ):
+            return True
+
+        # `fn_tr__generate_pk` trigger of migrations fills string IDs on PostgreSQL:
+        return (config.db.dialect == "postgresql") and (
+            cls._get_id_strategy() not in ("uuid", "int")
+        )
+
+    @classmethod
+    def _get_column_plan(cls) -> Tuple[Tuple[str, ...], Callable[[Any], Any]]:
+        """Get column keys and accessor of ORM class, prepared once at mapper configuration.
+
+        Returns:
+            Tuple[Tuple[str, ...],
+                  Callable[[Any], Any]]: Column keys and getter of column values from instance dictionary.
+        """
+
+        _plan = _COLUMN_PLANS.get(cls)
+        if _plan is None:
+            _plan = _build_column_plan(cls)
+            _COLUMN_PLANS[cls] = _plan
+
+        return _plan
+
+    def _to_dict(
+        self,
+        excludes: Optional[List[str]] = None,
+        load_relations: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        # Internal (validation-free) path of `to_dict()`, used for lists of ORM objects.
+        _keys, _getter = self.__class__._get_column_plan()
+        if excludes:
+            # Excluded (maybe unloaded) attributes must not be accessed:
+            _dict = {
+                _key: getattr(self, _key) for _key in _keys if _key not in excludes
+            }
+        else:
+            try:
+                # Loaded column values are read directly from instance state dictionary:
+                _values = _getter(self.__dict__)
+                if len(_keys) == 1:
+                    _values = (_values,)
+            except KeyError:
+                _values = tuple(getattr(self, _key) for _key in _keys)
+
+            _dict = dict(zip(_keys, _values))
 
         if load_relations:
             for _relation in load_relations:
@@ -142,42 +290,65 @@ class BaseMixin(TimestampMixin, IdStrMixin):
                     if (not isinstance(_attr, str)) and isinstance(_attr, Sequence):
                         _dict[_relation] = []
                         for _item in _attr:
-                            if isinstance(_item, DeclarativeBase):
+                            if isinstance(_item, BaseMixin):
+                                _dict[_relation].append(_item._to_dict())
+                            elif isinstance(_item, DeclarativeBase):
                                 _dict[_relation].append(_item.to_dict())
+                    elif isinstance(_attr, BaseMixin):
+                        _dict[_relation] = _attr._to_dict()
                     elif isinstance(_attr, DeclarativeBase):
                         _dict[_relation] = _attr.to_dict()
                     elif _attr is None:
                         _dict[_relation] = None
                     else:
-                        logger.warning(f"Can't include '{_relation}' relationship!")
+                        logger.warning("Can't include '{}' relationship!", _relation)
+
+        return _dict
+
+    @validate_internal_call
+    def to_dict(
+        self,
+        excludes: Optional[List[str]] = None,
+        load_relations: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Convert ORM object to dictionary.
+
+        Args:
+            excludes       (Optional[List[str]], optional): List of attributes to exclude. Defaults to None.
+            load_relations (Optional[List[str]], optional): List of relationships to include. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: Dictionary of ORM object.
+        """
 
+        _dict = self._to_dict(excludes=excludes, load_relations=load_relations)
         return _dict
 
-    @validate_call
+    @validate_internal_call
     def to_json(
         self,
         excludes: Optional[List[str]] = None,
         load_relations: Optional[List[str]] = None,
-    ) -> str:
-        """Convert ORM object to JSON string.
+        as_bytes: bool = False,
+    ) -> Union[str, bytes]:
+        """Convert ORM object to JSON string (or UTF-8 bytes).
 
         Args:
             excludes       (Optional[List[str]], optional): List of attributes to exclude. Defaults to None.
             load_relations (Optional[List[str]], optional): List of relationships to include. Defaults to None.
+            as_bytes       (bool               , optional): Return UTF-8 encoded bytes. Defaults to False.
 
         Returns:
-            str: JSON string of ORM object.
+            Union[str, bytes]: JSON string or bytes of ORM object.
         """
 
-        _json = json.dumps(
-            self.to_dict(excludes=excludes, load_relations=load_relations),
-            default=str,
-            ensure_ascii=False,
+        _json = _dumps_json(
+            self._to_dict(excludes=excludes, load_relations=load_relations),
+            as_bytes=as_bytes,
         )
         return _json
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
     def to_dict_list(
         cls,
         orm_objects: List[DeclarativeBase],
@@ -185,6 +356,7 @@ class BaseMixin(TimestampMixin, IdStrMixin):
         load_relations: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Convert list of ORM objects to list of dictionaries.
+        Not validated per call (hot path of list responses), items are expected to be `BaseMixin` objects.
 
         Args:
             orm_objects    (List[DeclarativeBase], required): List of ORM objects.
@@ -195,16 +367,44 @@ class BaseMixin(TimestampMixin, IdStrMixin):
             List[Dict[str, Any]]: List of dictionaries from ORM objects.
         """
 
-        _dict_list = []
-        for _orm_object in orm_objects:
-            _dict_list.append(
-                _orm_object.to_dict(excludes=excludes, load_relations=load_relations)
-            )
-
+        _dict_list = [
+            _orm_object._to_dict(excludes=excludes, load_relations=load_relations)
+            for _orm_object in orm_objects
+        ]
         return _dict_list
 
     @classmethod
-    @validate_call
+    def to_json_list(
+        cls,
+        orm_objects: List[DeclarativeBase],
+        excludes: Optional[List[str]] = None,
+        load_relations: Optional[List[str]] = None,
+        as_bytes: bool = True,
+    ) -> Union[bytes, str]:
+        """Convert list of ORM objects to JSON array bytes (or string).
+        Not validated per call (hot path of list responses), items are expected to be `BaseMixin` objects.
+
+        Args:
+            orm_objects    (List[DeclarativeBase], required): List of ORM objects.
+            excludes       (Optional[List[str]]  , optional): List of attributes to exclude. Defaults to None.
+            load_relations (Optional[List[str]]  , optional): List of relationships to include. Defaults to None.
+            as_bytes       (bool                 , optional): Return UTF-8 encoded bytes. Defaults to True.
+
+        Returns:
+            Union[bytes, str]: JSON array bytes or string of ORM objects.
+        """
+
+        _json = _dumps_json(
+            [
+                _orm_object._to_dict(excludes=excludes, load_relations=load_relations)
+                for _orm_object in orm_objects
+            ],
+            as_bytes=as_bytes,
+        )
+        return _json
+
+    @classmethod
+    @validate_internal_call
     def from_json(cls, json_str: str) -> DeclarativeBase:
         """Convert JSON string to ORM object.
 
@@ -230,73 +430,271 @@ class BaseMixin(TimestampMixin, IdStrMixin):
         return _str
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
-    def _build_where(
+    def _get_keyset_columns(
+        cls, order_by: Union[List[str], str, None] = None
+    ) -> List[str]:
+        """Get list of column names used as keyset (cursor) for pagination.
+
+        Args:
+            order_by (Union[List[str], str, None], optional): List of order by columns. Defaults to None.
+
+        Returns:
+            List[str]: List of valid order by column names with `id` as the last tie-breaker.
+        """
+
+        if isinstance(order_by, str):
+            order_by = [order_by]
+
+        _columns = []
+        if order_by:
+            for _order_by in order_by:
+                # `id` is unique, so columns after it never affect the order:
+                if _order_by == "id":
+                    break
+
+                if hasattr(cls, _order_by) and (_order_by not in _columns):
+                    _columns.append(_order_by)
+
+        _columns.append("id")
+        return _columns
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
+    def encode_cursor(
         cls,
-        stmt: Union[Select, Insert, Update, Delete],
-        where: Union[List[Dict[str, Any]], Dict[str, Any]],
-    ) -> Union[Select, Insert, Update, Delete]:
-        """Build SQLAlchemy SQL statement with `where` filter conditions.
+        orm_object: Any,
+        order_by: Union[List[str], str, None] = None,
+        is_desc: bool = True,
+        is_prev: bool = False,
+    ) -> str:
+        """Encode keyset values of ORM object (or row) into signed cursor token.
+
+        Args:
+            orm_object (Any                        , required): ORM object or row to build cursor from.
+            order_by   (Union[List[str], str, None], optional): List of order by columns. Defaults to None.
+            is_desc    (bool                       , optional): Is sort descending or ascending. Defaults to True.
+            is_prev    (bool                       , optional): Is cursor for previous page. Defaults to False.
+
+        Returns:
+            str: Opaque cursor token.
+        """
+
+        _columns = cls._get_keyset_columns(order_by=order_by)
+        _values = [getattr(orm_object, _column) for _column in _columns]
+        _payload = {"c": _columns, "v": _values, "d": is_desc, "p": is_prev}
+
+        _cursor = utils.encode_cursor(
+            payload=_payload,
+            key=config.api.security.cursor.secret.get_secret_value(),
+        )
+        return _cursor
+
+    @classmethod
+    def _coerce_column_value(cls, column: str, value: Any) -> Any:
+        """Coerce JSON decoded value into python type of the column.
+
+        Args:
+            column (str, required): Column name.
+            value  (Any, required): JSON decoded value.
+
+        Raises:
+            TypeError : If value can't be converted to column type.
+            ValueError: If value can't be converted to column type.
+
+        Returns:
+            Any: Value as python type of the column.
+        """
+
+        if value is None:
+            return value
+
+        try:
+            _python_type = getattr(cls, column).type.python_type
+        except NotImplementedError:
+            return value
+
+        if isinstance(value, _python_type):
+            return value
+
+        if _python_type in (datetime, date, time):
+            return _python_type.fromisoformat(value)
+
+        return _python_type(value)
+
+    @classmethod
+    @validate_internal_call
+    def decode_cursor(
+        cls,
+        cursor: str,
+        order_by: Union[List[str], str, None] = None,
+        is_desc: bool = True,
+    ) -> Tuple[List[Any], bool]:
+        """Decode and verify cursor token into keyset values.
+
+        Args:
+            cursor   (str                        , required): Cursor token to decode.
+            order_by (Union[List[str], str, None], optional): List of order by columns. Defaults to None.
+            is_desc  (bool                       , optional): Is sort descending or ascending. Defaults to True.
+
+        Raises:
+            CursorError: If cursor is invalid or doesn't match current sort order.
+
+        Returns:
+            Tuple[List[Any], bool]: List of keyset values and is previous page flag as tuple.
+        """
+
+        try:
+            _payload: Dict[str, Any] = utils.decode_cursor(
+                cursor=cursor,
+                key=config.api.security.cursor.secret.get_secret_value(),
+            )
+        except ValueError as err:
+            raise CursorError(str(err))
+
+        _columns = cls._get_keyset_columns(order_by=order_by)
+        _values = _payload.get("v")
+        if (
+            (_payload.get("c") != _columns)
+            or (_payload.get("d") != is_desc)
+            or (not isinstance(_values, list))
+            or (len(_values) != len(_columns))
+        ):
+            raise CursorError("Cursor doesn't match current sort order!")
+
+        for _i, _column in enumerate(_columns):
+            try:
+                _values[_i] = cls._coerce_column_value(
+                    column=_column, value=_values[_i]
+                )
+            except (TypeError, ValueError):
+                raise CursorError(f"Invalid cursor value for '{_column}' column!")
+
+        return _values, bool(_payload.get("p"))
+
+    @classmethod
+    @validate_internal_call
+    def _get_where_params(
+        cls, where: Union[List[Dict[str, Any]], Dict[str, Any]]
+    ) -> Tuple[Tuple[Tuple[str, Optional[str]], ...], Dict[str, Any]]:
+        """Split `where` filter conditions into statement shape signature and bind parameters.
 
         Args:
-            stmt  (Union[Select, Insert, Update, Delete], required): SQLAlchemy SQL statement.
             where (Union[List[Dict[str, Any]],
-                              Dict[str, Any]]           , required): List of filter conditions
+                              Dict[str, Any]], required): List of filter conditions.
 
         Raises:
             ValueError: If `column` or `value` key doesn't exist in `where` filter.
 
         Returns:
-            Union[Select, Insert, Update, Delete]: Built SQLAlchemy SQL statement.
+            Tuple[Tuple[Tuple[str, Optional[str]], ...],
+                  Dict[str, Any]]: Tuple of (column, operator) signature and bind parameters.
         """
 
         if isinstance(where, dict):
             where = [where]
 
-        for _where in where:
+        _signature = []
+        _params = {}
+        for _i, _where in enumerate(where):
             if "column" not in _where:
                 raise ValueError("Not found 'column' key in 'where'!")
 
             if "value" not in _where:
                 raise ValueError("Not found 'value' key in 'where'!")
 
-            if (
-                ("op" not in _where)
-                or (_where["op"] == "eq")
-                or (_where["op"] == "equal")
-                or (_where["op"] == "=")
-                or (_where["op"] == "==")
-            ):
-                stmt = stmt.where(getattr(cls, _where["column"]) == _where["value"])
-            elif (
-                (_where["op"] == "ne")
-                or (_where["op"] == "not_equal")
-                or (_where["op"] == "!=")
-            ):
-                stmt = stmt.where(getattr(cls, _where["column"]) != _where["value"])
-            elif _where["op"] == "like":
+            _op: Optional[str] = _WHERE_OPS.get(_where.get("op", "eq"))
+            _value = _where["value"]
+            if (_op == "eq") and (_value is None):
+                _op = "is"
+            elif (_op == "ne") and (_value is None):
+                _op = "is_not"
+            elif _op == "like":
+                _params[f"w_{_i}"] = f"%{_value}%"
+            elif _op == "between":
+                _params[f"w_{_i}_0"] = _value[0]
+                _params[f"w_{_i}_1"] = _value[1]
+            elif _op:
+                _params[f"w_{_i}"] = _value
+
+            _signature.append((_where["column"], _op))
+
+        return tuple(_signature), _params
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
+    def _build_where(
+        cls,
+        stmt: Union[Select, Insert, Update, Delete],
+        where: Union[List[Dict[str, Any]], Dict[str, Any]],
+    ) -> Union[Select, Insert, Update, Delete]:
+        """Build SQLAlchemy SQL statement with `where` filter conditions.
+        Values are bound as named parameters (`w_<index>`), so built statement can be cached and reused.
+
+        Args:
+            stmt  (Union[Select, Insert, Update, Delete], required): SQLAlchemy SQL statement.
+            where (Union[List[Dict[str, Any]],
+                              Dict[str, Any]]           , required): List of filter conditions
+
+        Raises:
+            ValueError: If `column` or `value` key doesn't exist in `where` filter.
+
+        Returns:
+            Union[Select, Insert, Update, Delete]: Built SQLAlchemy SQL statement.
+        """
+
+        _signature, _params = cls._get_where_params(where=where)
+        for _i, (_column_name, _op) in enumerate(_signature):
+            if not _op:
+                continue
+
+            _column = getattr(cls, _column_name)
+            if _op == "is":
+                stmt = stmt.where(_column.is_(None))
+            elif _op == "is_not":
+                stmt = stmt.where(_column.is_not(None))
+            elif _op == "in":
                 stmt = stmt.where(
-                    getattr(cls, _where["column"]).like(f'%{_where["value"]}%')
+                    _column.in_(
+                        bindparam(
+                            f"w_{_i}",
+                            _params[f"w_{_i}"],
+                            type_=_column.type,
+                            expanding=True,
+                        )
+                    )
                 )
-            elif (_where["op"] == "gt") or (_where["op"] == ">"):
-                stmt = stmt.where(getattr(cls, _where["column"]) > _where["value"])
-            elif (_where["op"] == "ge") or (_where["op"] == ">="):
-                stmt = stmt.where(getattr(cls, _where["column"]) >= _where["value"])
-            elif (_where["op"] == "lt") or (_where["op"] == "<"):
-                stmt = stmt.where(getattr(cls, _where["column"]) < _where["value"])
-            elif (_where["op"] == "le") or (_where["op"] == "<="):
-                stmt = stmt.where(getattr(cls, _where["column"]) <= _where["value"])
-            elif _where["op"] == "between":
+            elif _op == "between":
                 stmt = stmt.where(
-                    getattr(cls, _where["column"]).between(
-                        _where["value"][0], _where["value"][1]
+                    _column.between(
+                        bindparam(
+                            f"w_{_i}_0", _params[f"w_{_i}_0"], type_=_column.type
+                        ),
+                        bindparam(
+                            f"w_{_i}_1", _params[f"w_{_i}_1"], type_=_column.type
+                        ),
                     )
                 )
+            else:
+                _param = bindparam(f"w_{_i}", _params[f"w_{_i}"], type_=_column.type)
+                if _op == "eq":
+                    stmt = stmt.where(_column == _param)
+                elif _op == "ne":
+                    stmt = stmt.where(_column != _param)
+                elif _op == "like":
+                    stmt = stmt.where(_column.like(_param))
+                elif _op == "gt":
+                    stmt = stmt.where(_column > _param)
+                elif _op == "ge":
+                    stmt = stmt.where(_column >= _param)
+                elif _op == "lt":
+                    stmt = stmt.where(_column < _param)
+                elif _op == "le":
+                    stmt = stmt.where(_column <= _param)
 
         return stmt
 
     @classmethod
-    @validate_call
+    @validate_internal_call
     def _build_select(
         cls,
         where: Union[List[Dict[str, Any]], Dict[str, Any], None] = None,
@@ -306,6 +704,9 @@ class BaseMixin(TimestampMixin, IdStrMixin):
         is_desc: bool = True,
         joins: Optional[List[str]] = None,
         disable_limit: bool = False,
+        cursor: Optional[str] = None,
+        with_count: bool = False,
+        columns: Optional[Tuple[str, ...]] = None,
     ) -> Select:
         """Build SQLAlchemy select statement for ORM object.
 
@@ -318,42 +719,98 @@ class BaseMixin(TimestampMixin, IdStrMixin):
             is_desc        (bool                       , optional): Is sort descending or ascending. Defaults to True.
             joins          (Optional[List[str]]        , optional): List of joinable relationships. Defaults to None.
             disable_limit  (bool                       , optional): Disable select limit. Defaults to False.
+            cursor         (Optional[str]              , optional): Keyset pagination cursor, `offset` is ignored. Defaults to None.
+            with_count     (bool                       , optional): Also select count of all filtered rows as last column. Defaults to False.
+            columns        (Optional[Tuple[str, ...]]  , optional): Select only these columns instead of ORM objects. Defaults to None.
+
+        Raises:
+            CursorError: If `cursor` is invalid or doesn't match current sort order.
 
         Returns:
             Select: Built SQLAlchemy select statement.
         """
 
+        if isinstance(order_by, str):
+            order_by = [order_by]
+
         _sort_direct = desc
         if not is_desc:
             _sort_direct = asc
 
+        _cursor_values: Optional[List[Any]] = None
+        _is_prev = False
+        if cursor:
+            _cursor_values, _is_prev = cls.decode_cursor(
+                cursor=cursor, order_by=order_by, is_desc=is_desc
+            )
+            offset = 0
+
+        # Previous page is selected by reversed order, main query restores the order:
+        _sub_sort_direct = _sort_direct
+        if _is_prev:
+            _sub_sort_direct = asc if is_desc else desc
+
         ## Deffered join to improve performance:
         # Subquery:
         _sub_query: Select = select(cls.id)
+        if with_count:
+            # Uncorrelated count subquery is evaluated only once (InitPlan) in the same statement:
+            _count_stmt: Select = select(func.count()).select_from(cls)
+            if where:
+                _count_stmt = cls._build_where(stmt=_count_stmt, where=where)
+
+            _sub_query = _sub_query.add_columns(
+                _count_stmt.correlate(None).scalar_subquery().label("all_count_")
+            )
+
         if where:
             _sub_query = cls._build_where(stmt=_sub_query, where=where)
 
-        if order_by:
-            if isinstance(order_by, str):
-                order_by = [order_by]
+        if _cursor_values:
+            _columns = [
+                getattr(cls, _column)
+                for _column in cls._get_keyset_columns(order_by=order_by)
+            ]
+            _keyset_columns = tuple_(*_columns)
+            _keyset_values = tuple_(
+                *[
+                    bindparam(f"k_{_i}", _cursor_values[_i], type_=_column.type)
+                    for _i, _column in enumerate(_columns)
+                ]
+            )
+            if _sub_sort_direct is desc:
+                _sub_query = _sub_query.where(_keyset_columns < _keyset_values)
+            else:
+                _sub_query = _sub_query.where(_keyset_columns > _keyset_values)
 
-            if isinstance(order_by, list):
-                for _order_by in order_by:
-                    if hasattr(cls, _order_by):
-                        _sub_query = _sub_query.order_by(
-                            _sort_direct(getattr(cls, _order_by))
-                        )
+        if order_by:
+            for _order_by in order_by:
+                if hasattr(cls, _order_by):
+                    _sub_query = _sub_query.order_by(
+                        _sub_sort_direct(getattr(cls, _order_by))
+                    )
 
-        _sub_query: Select = _sub_query.order_by(_sort_direct(cls.id))
+        _sub_query: Select = _sub_query.order_by(_sub_sort_direct(cls.id))
 
         if not disable_limit:
-            _sub_query = _sub_query.limit(limit).offset(offset)
+            _sub_query = _sub_query.limit(bindparam("limit_", limit)).offset(
+                bindparam("offset_", offset)
+            )
 
         # Make into subquery:
         _sub_query: Subquery = _sub_query.subquery()
 
         # Main query:
-        _stmt: Select = select(cls).join(_sub_query, cls.id == _sub_query.c.id)
+        if columns:
+            # Read-only projection, rows don't go through identity map:
+            _stmt: Select = select(*[getattr(cls, _column) for _column in columns])
+            _stmt = _stmt.join(_sub_query, cls.id == _sub_query.c.id)
+            joins = None
+        else:
+            _stmt: Select = select(cls).join(_sub_query, cls.id == _sub_query.c.id)
+
+        if with_count:
+            _stmt = _stmt.add_columns(_sub_query.c.all_count_)
 
         if joins:
             for _join in joins:
@@ -368,6 +825,728 @@ class BaseMixin(TimestampMixin, IdStrMixin):
         _stmt = _stmt.order_by(_sort_direct(cls.id))
         return _stmt
 
+    @classmethod
+    def get_row_class(cls, columns: List[str]) -> Tuple[Tuple[str, ...], type]:
+        """Get normalized column names (`id` first) and cached read-only `__slots__` dataclass
+        for projection rows of ORM class.
+
+        Args:
+            columns (List[str], required): Column names to select.
+
+        Raises:
+            ValueError: If column doesn't exist in ORM class.
+
+        Returns:
+            Tuple[Tuple[str, ...], type]: Column names and row dataclass as tuple.
+        """
+
+        _columns = ("id", *[_column for _column in columns if _column != "id"])
+        _key = (cls, _columns)
+        _row_class = _ROW_CLASSES.get(_key)
+        if _row_class is None:
+            _keys, _ = cls._get_column_plan()
+            for _column in _columns:
+                if _column not in _keys:
+                    raise ValueError(
+                        f"Not found '{_column}' column in `{cls.__name__}` class!"
+                    )
+
+            _row_class = make_dataclass(
+                f"{cls.__name__}Row",
+                [(_column, Any) for _column in _columns],
+                frozen=True,
+                slots=True,
+            )
+            _ROW_CLASSES[_key] = _row_class
+
+        return _columns, _row_class
+
+    @classmethod
+    def _is_result_cached(cls) -> bool:
+        """Check if ORM model opted in (`__result_cache__`) and result cache is enabled.
+
+        Returns:
+            bool: True if ORM objects of the model are cached.
+        """
+
+        return cls.__result_cache__ and result_cache.is_enabled
+
+    @classmethod
+    def _get_cache_key(cls, id: Any) -> str:
+        """Get result cache key of ORM object by ID.
+
+        Args:
+            id (Any, required): ID of ORM object.
+
+        Returns:
+            str: Result cache key.
+        """
+
+        return f"{cls.__tablename__}:{id}"
+
+    def _to_cache_dict(self) -> Optional[Dict[str, Any]]:
+        """Get column values of ORM object to store in result cache.
+
+        Returns:
+            Optional[Dict[str, Any]]: Dictionary of column values, None if some columns aren't loaded.
+        """
+
+        _state = inspect(self)
+        _column_keys = [_column.key for _column in _state.mapper.column_attrs]
+        if _state.unloaded.intersection(_column_keys):
+            return None
+
+        _dict = {_key: _state.dict[_key] for _key in _column_keys}
+        return _dict
+
+    @classmethod
+    def _from_cache_dict(cls, data: Dict[str, Any]) -> DeclarativeBase:
+        """Build detached ORM object (as if loaded from database) from result cache values.
+
+        Args:
+            data (Dict[str, Any], required): Dictionary of column values.
+
+        Returns:
+            DeclarativeBase: Detached ORM object.
+        """
+
+        _orm_object = cls.__mapper__.class_manager.new_instance()
+        for _key, _val in data.items():
+            setattr(
+                _orm_object, _key, cls._coerce_column_value(column=_key, value=_val)
+            )
+
+        make_transient_to_detached(_orm_object)
+        return _orm_object
+
+    @classmethod
+    def get_result_cache_stats(cls) -> Dict[str, Any]:
+        """Get statistics of the shared result cache.
+
+        Returns:
+            Dict[str, Any]: Backend, size, hits, misses, sets, invalidations, errors and hit ratio of result cache.
+        """
+
+        return result_cache.get_stats()
+
+    @classmethod
+    def get_stmt_cache_stats(cls) -> Dict[str, Any]:
+        """Get statistics of the shared statement shape cache.
+
+        Returns:
+            Dict[str, Any]: Size, max size, hits, misses and hit ratio of statement cache.
+        """
+
+        return stmt_cache.get_stats()
+
+    @classmethod
+    def _get_select_stmt(
+        cls,
+        where: Union[List[Dict[str, Any]], Dict[str, Any], None] = None,
+        offset: int = 0,
+        limit: int = config.db.select_limit,
+        order_by: Union[List[str], str, None] = None,
+        is_desc: bool = True,
+        joins: Optional[List[str]] = None,
+        disable_limit: bool = False,
+        cursor: Optional[str] = None,
+        with_count: bool = False,
+        columns: Optional[Tuple[str, ...]] = None,
+    ) -> Tuple[Select, Dict[str, Any]]:
+        """Get cached (by statement shape) select statement and its bind parameters.
+        Arguments are the same as `_build_select()`.
+
+        Raises:
+            CursorError: If `cursor` is invalid or doesn't match current sort order.
+
+        Returns:
+            Tuple[Select, Dict[str, Any]]: Select statement and bind parameters as tuple.
+        """
+
+        if isinstance(order_by, str):
+            order_by = [order_by]
+
+        _signature, _params = cls._get_where_params(where=where or [])
+
+        _is_prev: Optional[bool] = None
+        if cursor:
+            _cursor_values, _is_prev = cls.decode_cursor(
+                cursor=cursor, order_by=order_by, is_desc=is_desc
+            )
+            for _i, _value in enumerate(_cursor_values):
+                _params[f"k_{_i}"] = _value
+            offset = 0
+
+        if not disable_limit:
+            _params["limit_"] = limit
+            _params["offset_"] = offset
+
+        _key = (
+            cls,
+            "select",
+            _signature,
+            tuple(order_by) if order_by else None,
+            is_desc,
+            tuple(joins) if joins else None,
+            disable_limit,
+            _is_prev,
+            with_count,
+            columns,
+        )
+        _stmt: Select = stmt_cache.get_or_build(
+            key=_key,
+            build=lambda: cls._build_select(
+                where=where,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                is_desc=is_desc,
+                joins=joins,
+                disable_limit=disable_limit,
+                cursor=cursor,
+                with_count=with_count,
+                columns=columns,
+            ),
+        )
+        return _stmt, _params
+
+    @classmethod
+    def _get_count_stmt(
+        cls, where: Union[List[Dict[str, Any]], Dict[str, Any], None] = None
+    ) -> Tuple[Select, Dict[str, Any]]:
+        """Get cached (by statement shape) count statement and its bind parameters.
+
+        Args:
+            where (Union[List[Dict[str, Any]],
+                         Dict[str, Any], None], optional): List of filter conditions. Defaults to None.
+
+        Returns:
+            Tuple[Select, Dict[str, Any]]: Count statement and bind parameters as tuple.
+        """
+
+        _signature, _params = cls._get_where_params(where=where or [])
+
+        def _build() -> Select:
+            _stmt: Select = select(func.count()).select_from(cls)
+            if where:
+                _stmt = cls._build_where(stmt=_stmt, where=where)
+            return _stmt
+
+        _stmt: Select = stmt_cache.get_or_build(
+            key=(cls, "count", _signature), build=_build
+        )
+        return _stmt, _params
+
+    @classmethod
+    def _get_stream_stmt(
+        cls,
+        where: Union[List[Dict[str, Any]], Dict[str, Any], None] = None,
+        order_by: Union[List[str], str, None] = None,
+        is_desc: bool = True,
+    ) -> Tuple[Select, Dict[str, Any]]:
+        """Get cached (by statement shape) unlimited select statement for streaming and its bind parameters.
+
+        Args:
+            where    (Union[List[Dict[str, Any]],
+                            Dict[str, Any], None], optional): List of filter conditions. Defaults to None.
+            order_by (Union[List[str], str, None], optional): List of order by columns. Defaults to None.
+            is_desc  (bool                       , optional): Is sort descending or ascending. Defaults to True.
+
+        Returns:
+            Tuple[Select, Dict[str, Any]]: Select statement and bind parameters as tuple.
+        """
+
+        if isinstance(order_by, str):
+            order_by = [order_by]
+
+        _signature, _params = cls._get_where_params(where=where or [])
+
+        def _build() -> Select:
+            _sort_direct = desc if is_desc else asc
+            _stmt: Select = select(cls)
+            if where:
+                _stmt = cls._build_where(stmt=_stmt, where=where)
+
+            if order_by:
+                for _order_by in order_by:
+                    if hasattr(cls, _order_by):
+                        _stmt = _stmt.order_by(_sort_direct(getattr(cls, _order_by)))
+
+            _stmt = _stmt.order_by(_sort_direct(cls.id))
+            return _stmt
+
+        _stmt: Select = stmt_cache.get_or_build(
+            key=(
+                cls,
+                "stream",
+                _signature,
+                tuple(order_by) if order_by else None,
+                is_desc,
+            ),
+            build=_build,
+        )
+        return _stmt, _params
+
+    @classmethod
+    def _get_estimate_stmt(
+        cls,
+        where: Union[List[Dict[str, Any]], Dict[str, Any], None],
+        dialect: Dialect,
+    ) -> Tuple[Union[Select, str], Dict[str, Any]]:
+        """Get PostgreSQL row count estimate statement and its parameters.
+        Without filter conditions it reads `pg_class.reltuples` of the table, otherwise it returns
+        raw driver SQL of `EXPLAIN (FORMAT JSON)` for the filtered select.
+
+        Args:
+            where   (Union[List[Dict[str, Any]],
+                           Dict[str, Any], None], required): List of filter conditions.
+            dialect (Dialect                    , required): SQLAlchemy dialect of the session connection.
+
+        Returns:
+            Tuple[Union[Select, str],
+                  Dict[str, Any]]: Select statement or raw EXPLAIN SQL and parameters as tuple.
+        """
+
+        if not where:
+            _stmt: Select = stmt_cache.get_or_build(
+                key=(cls, "reltuples"),
+                build=lambda: select(cast(literal_column("reltuples"), BigInteger))
+                .select_from(table("pg_class"))
+                .where(
+                    literal_column("oid")
+                    == cast(bindparam("table_name_", type_=String), REGCLASS)
+                ),
+            )
+            _table_name: str = cls.__table__.fullname
+            return _stmt, {"table_name_": _table_name}
+
+        _signature, _params = cls._get_where_params(where=where)
+        _stmt: Select = stmt_cache.get_or_build(
+            key=(cls, "estimate", _signature),
+            build=lambda: cls._build_where(stmt=select(cls.id), where=where),
+        )
+        # Expanding (`in`/`not_in`) parameters are rendered into raw SQL with their values:
+        _compiled = _stmt.params(_params).compile(
+            dialect=dialect, compile_kwargs={"render_postcompile": True}
+        )
+        _sql = f"EXPLAIN (FORMAT JSON) {_compiled.string}"
+        return _sql, _compiled.construct_params()
+
+    @classmethod
+    def _parse_estimate(cls, value: Any) -> Optional[int]:
+        """Parse estimated row count from `reltuples` or `EXPLAIN (FORMAT JSON)` result value.
+
+        Args:
+            value (Any, required): `reltuples` number or EXPLAIN JSON plan.
+
+        Returns:
+            Optional[int]: Estimated row count, None if table is never analyzed or value is unknown.
+        """
+
+        if value is None:
+            return None
+
+        if isinstance(value, str):
+            value = json.loads(value)
+
+        if isinstance(value, list):
+            value = value[0]["Plan"]["Plan Rows"]
+
+        _estimate = int(value)
+        # `reltuples` is -1 for never vacuumed/analyzed tables:
+        if _estimate < 0:
+            return None
+
+        return _estimate
+
+    @classmethod
+    def _get_update_stmt(
+        cls,
+        where: Union[List[Dict[str, Any]], Dict[str, Any]],
+        values: Dict[str, Any],
+        returning: bool = False,
+    ) -> Tuple[Update, Dict[str, Any]]:
+        """Get cached (by statement shape) update statement and its bind parameters.
+        Values are bound as named parameters (`v_<column>`).
+
+        Args:
+            where     (Union[List[Dict[str, Any]],
+                             Dict[str, Any]]      , required): List of filter conditions.
+            values    (Dict[str, Any]             , required): Dictionary of update data.
+            returning (bool                       , optional): Return updated ORM objects. Defaults to False.
+
+        Returns:
+            Tuple[Update, Dict[str, Any]]: Update statement and bind parameters as tuple.
+        """
+
+        _signature, _params = cls._get_where_params(where=where)
+        for _key, _val in values.items():
+            _params[f"v_{_key}"] = _val
+
+        def _build() -> Update:
+            _stmt: Update = cls._build_where(stmt=update(cls), where=where)
+            _stmt = _stmt.values(
+                {
+                    _key: bindparam(f"v_{_key}", _val, type_=getattr(cls, _key).type)
+                    for _key, _val in values.items()
+                }
+            )
+            if returning:
+                _stmt = _stmt.returning(cls)
+
+            # Cached statement is executed with new parameters, so in-session objects
+            # can't be evaluated by the embedded bind values:
+            _stmt = _stmt.execution_options(synchronize_session="fetch")
+            return _stmt
+
+        # SQL expression values (e.g. `func.now()`) can't be bound as parameters:
+        if any(isinstance(_val, ClauseElement) for _val in values.values()):
+            _stmt: Update = cls._build_where(stmt=update(cls), where=where)
+            _stmt = _stmt.values(**values)
+            if returning:
+                _stmt = _stmt.returning(cls)
+
+            _params = {
+                _key: _val for _key, _val in _params.items() if _key.startswith("w_")
+            }
+            return _stmt, _params
+
+        _stmt: Update = stmt_cache.get_or_build(
+            key=(cls, "update", _signature, tuple(values.keys()), returning),
+            build=_build,
+        )
+        return _stmt, _params
+
+    @classmethod
+    def _get_delete_stmt(
+        cls, where: Union[List[Dict[str, Any]], Dict[str, Any]]
+    ) -> Tuple[Delete, Dict[str, Any]]:
+        """Get cached (by statement shape) delete statement and its bind parameters.
+
+        Args:
+            where (Union[List[Dict[str, Any]],
+                         Dict[str, Any]], required): List of filter conditions.
+
+        Returns:
+            Tuple[Delete, Dict[str, Any]]: Delete statement and bind parameters as tuple.
+        """
+
+        _signature, _params = cls._get_where_params(where=where)
+
+        def _build() -> Delete:
+            _stmt: Delete = cls._build_where(stmt=delete_(cls), where=where)
+            _stmt = _stmt.execution_options(synchronize_session="fetch")
+            return _stmt
+
+        _stmt: Delete = stmt_cache.get_or_build(
+            key=(cls, "delete", _signature), build=_build
+        )
+        return _stmt, _params
+
+    @classmethod
+    def _get_values_update_stmt(
+        cls,
+        rows: List[Dict[str, Any]],
+        columns: List[str],
+        returning: bool = False,
+    ) -> Update:
+        """Get PostgreSQL `UPDATE ... FROM (VALUES ...)` statement with different values per row,
+        joined by ID. Returned ORM objects overwrite (refresh) objects of the session identity map.
+
+        Args:
+            rows      (List[Dict[str, Any]], required): List of dictionary data with `id` and `columns` keys.
+            columns   (List[str]           , required): Column names to update.
+            returning (bool                , optional): Return updated ORM objects. Defaults to False.
+
+        Returns:
+            Update: Update statement.
+        """
+
+        _keys = ["id", *columns]
+        _values = values(
+            *[column(_key, getattr(cls, _key).type) for _key in _keys], name="values_"
+        ).data([tuple(_row[_key] for _key in _keys) for _row in rows])
+
+        _stmt: Update = (
+            update(cls)
+            .where(cls.id == cast(_values.c.id, cls.id.type))
+            .values(
+                {
+                    _key: cast(_values.c[_key], getattr(cls, _key).type)
+                    for _key in columns
+                }
+            )
+        )
+        if returning:
+            _stmt = _stmt.returning(cls)
+
+        _stmt = _stmt.execution_options(
+            synchronize_session=False, populate_existing=True
+        )
+        return _stmt
+
+    @classmethod
+    def _get_rows_update_stmt(cls, columns: List[str]) -> Update:
+        """Get cached (by statement shape) update by ID statement for executemany with different
+        values per row. Parameters are `w_id` for ID and `v_<column>` for values.
+
+        Args:
+            columns (List[str], required): Column names to update.
+
+        Returns:
+            Update: Update statement.
+        """
+
+        def _build() -> Update:
+            _table = cls.__table__
+            _stmt: Update = (
+                update(_table)
+                .where(_table.c.id == bindparam("w_id", type_=_table.c.id.type))
+                .values(
+                    {
+                        _key: bindparam(f"v_{_key}", type_=_table.c[_key].type)
+                        for _key in columns
+                    }
+                )
+            )
+            return _stmt
+
+        _stmt: Update = stmt_cache.get_or_build(
+            key=(cls, "update_rows", tuple(columns)), build=_build
+        )
+        return _stmt
+
+    @classmethod
+    def _get_upsert_stmt(
+        cls,
+        columns: List[str],
+        conflict_columns: Optional[List[str]] = None,
+        constraint: Optional[str] = None,
+        update_columns: Optional[List[str]] = None,
+        returning: bool = False,
+        dialect: Optional[str] = None,
+    ) -> Insert:
+        """Get cached (by statement shape) dialect specific upsert statement for executemany.
+        PostgreSQL and SQLite use `ON CONFLICT`, MySQL and MariaDB use `ON DUPLICATE KEY UPDATE`
+        (conflict target is any unique key). Without columns to update, conflicting rows are skipped.
+
+        Args:
+            columns          (List[str]          , required): Column names of inserted data.
+            conflict_columns (Optional[List[str]], optional): Conflict target columns. Defaults to None (["id"]).
+            constraint       (Optional[str]      , optional): Conflict target constraint name (PostgreSQL only). Defaults to None.
+            update_columns   (Optional[List[str]], optional): Whitelist of columns to update on conflict, None means all. Defaults to None.
+            returning        (bool               , optional): Return upserted ORM objects (PostgreSQL and SQLite only). Defaults to False.
+            dialect          (Optional[str]      , optional): Database dialect name. Defaults to None (`config.db.dialect`).
+
+        Raises:
+            ValueError: If database dialect doesn't support upsert.
+
+        Returns:
+            Insert: Upsert statement.
+        """
+
+        if not conflict_columns:
+            conflict_columns = ["id"]
+
+        if not dialect:
+            dialect = config.db.dialect
+
+        _primary_keys = [_column.key for _column in cls.__table__.primary_key.columns]
+        _set_columns = [
+            _column
+            for _column in columns
+            if (_column not in conflict_columns)
+            and (_column not in _primary_keys)
+            and ((update_columns is None) or (_column in update_columns))
+        ]
+
+        def _build() -> Insert:
+            if dialect in ("postgresql", "sqlite"):
+                _dialect_module = postgresql
+                if dialect == "sqlite":
+                    _dialect_module = sqlite
+
+                _stmt = _dialect_module.insert(cls)
+                _target = {"index_elements": conflict_columns}
+                if constraint and (dialect == "postgresql"):
+                    _target = {"constraint": constraint}
+
+                if _set_columns:
+                    _stmt = _stmt.on_conflict_do_update(
+                        **_target,
+                        set_={
+                            _column: _stmt.excluded[_column] for _column in _set_columns
+                        },
+                    )
+                else:
+                    _stmt = _stmt.on_conflict_do_nothing(**_target)
+            elif (dialect == "mysql") or (dialect == "mariadb"):
+                _stmt = mysql.insert(cls)
+                if _set_columns:
+                    _stmt = _stmt.on_duplicate_key_update(
+                        {_column: _stmt.inserted[_column] for _column in _set_columns}
+                    )
+                else:
+                    _stmt = _stmt.prefix_with("IGNORE")
+            else:
+                raise ValueError(f"Upsert is not supported for '{dialect}' database!")
+
+            # MySQL and MariaDB don't support `RETURNING`, see `_get_upserted_stmt()`:
+            if returning and (dialect in ("postgresql", "sqlite")):
+                _stmt = _stmt.returning(cls)
+
+            return _stmt
+
+        _stmt: Insert = stmt_cache.get_or_build(
+            key=(
+                cls,
+                "upsert",
+                dialect,
+                tuple(columns),
+                tuple(conflict_columns),
+                constraint,
+                tuple(_set_columns),
+                returning,
+            ),
+            build=_build,
+        )
+        return _stmt
+
+    @classmethod
+    def _get_upserted_stmt(
+        cls,
+        raw_data: List[Dict[str, Any]],
+        conflict_columns: Optional[List[str]] = None,
+    ) -> Tuple[Select, Dict[str, Any]]:
+        """Get select statement of upserted rows by their conflict target values, for databases
+        without `RETURNING` (MySQL and MariaDB). Rows matched by other unique keys are not selected.
+
+        Args:
+            raw_data         (List[Dict[str, Any]], required): List of upserted dictionary object data.
+            conflict_columns (Optional[List[str]] , optional): Conflict target columns. Defaults to None (["id"]).
+
+        Raises:
+            ValueError: If conflict target column doesn't exist in data.
+
+        Returns:
+            Tuple[Select, Dict[str, Any]]: Select statement and parameters as tuple.
+        """
+
+        if not conflict_columns:
+            conflict_columns = ["id"]
+
+        if any(_column not in raw_data[0] for _column in conflict_columns):
+            raise ValueError(
+                f"Not found conflict target columns {conflict_columns} in data to select upserted rows!"
+            )
+
+        def _build() -> Select:
+            _target = tuple_(
+                *[cls.__table__.c[_column] for _column in conflict_columns]
+            )
+            if len(conflict_columns) == 1:
+                _target = cls.__table__.c[conflict_columns[0]]
+
+            return select(cls).where(
+                _target.in_(bindparam("conflict_keys_", expanding=True))
+            )
+
+        _stmt: Select = stmt_cache.get_or_build(
+            key=(cls, "upserted", tuple(conflict_columns)), build=_build
+        )
+        _get_key = itemgetter(*conflict_columns)
+        _params = {"conflict_keys_": [_get_key(_data) for _data in raw_data]}
+        return _stmt, _params
+
+    @classmethod
+    def _get_bulk_batch_size(cls, num_columns: int) -> int:
+        """Get number of rows per statement within database bind parameters limit.
+
+        Args:
+            num_columns (int, required): Number of columns per row.
+
+        Returns:
+            int: Number of rows per batch.
+        """
+
+        return max(1, config.db.bulk_max_params // max(1, num_columns))
+
+    @classmethod
+    def _get_copy_plan(
+        cls, raw_data: List[Dict[str, Any]], dialect: Dialect
+    ) -> Tuple[List[Column], List[str], List[Tuple[Any, ...]]]:
+        """Get table columns, database type names and row tuples for binary `COPY`.
+        Only columns present in data are copied (others get their server defaults), missing values
+        of a copied column are filled with the scalar column default or NULL.
+
+        Args:
+            raw_data (List[Dict[str, Any]], required): List of dictionary object data.
+            dialect  (Dialect             , required): SQLAlchemy dialect of the session connection.
+
+        Returns:
+            Tuple[List[Column],
+                  List[str],
+                  List[Tuple[Any, ...]]]: Table columns, type names and rows as tuple.
+        """
+
+        _keys = set()
+        for _data in raw_data:
+            _keys.update(_data.keys())
+
+        _columns = [
+            _column for _column in cls.__table__.columns if _column.key in _keys
+        ]
+
+        _types: List[str] = []
+        _defaults: List[Any] = []
+        for _column in _columns:
+            # e.g. "VARCHAR(64)" -> "varchar", "TIMESTAMP WITH TIME ZONE" -> "timestamp with time zone":
+            _type_name = _column.type.compile(dialect=dialect)
+            _types.append(re.sub(r"\(.*?\)", "", _type_name).strip().lower())
+
+            _default = None
+            if (_column.default is not None) and _column.default.is_scalar:
+                _default = _column.default.arg
+            _defaults.append(_default)
+
+        _rows = [
+            tuple(
+                _data.get(_column.key, _default)
+                for _column, _default in zip(_columns, _defaults)
+            )
+            for _data in raw_data
+        ]
+        return _columns, _types, _rows
+
+
+_COLUMN_PLANS: Dict[type, Tuple[Tuple[str, ...], Callable[[Any], Any]]] = {}
+_ROW_CLASSES: Dict[Tuple[type, Tuple[str, ...]], type] = {}
+_ID_STRATEGIES: Dict[type, str] = {}
+
+if config.db.id_node is not None:
+    utils.id_generator.set_node_id(config.db.id_node)
+
+
+def _build_column_plan(
+    orm_class: type,
+) -> Tuple[Tuple[str, ...], Callable[[Any], Any]]:
+    _keys = tuple(_column.key for _column in inspect(orm_class).column_attrs)
+    return _keys, itemgetter(*_keys)
+
+
+@event.listens_for(Mapper, "mapper_configured")
+def _prepare_column_plan(mapper: Mapper, orm_class: type) -> None:
+    if issubclass(orm_class, BaseMixin):
+        _COLUMN_PLANS[orm_class] = _build_column_plan(orm_class)
+
+    return
+
+
+def _dumps_json(obj: Any, as_bytes: bool = False) -> Union[str, bytes]:
+    # Datetimes are passed to `str()` as before (space separator instead of ISO 8601 `T`):
+    _json = orjson.dumps(obj, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    return _json if as_bytes else _json.decode("utf-8")
+
 
 __all__ = [
     "IdStrMixin",
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class BaseCacheBackend(ABC):
+    """Base class for result cache backends, values are dictionaries of ORM column values."""
+
+    name = "base"
+
+    @abstractmethod
+    async def async_get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def async_set_many(self, items: Dict[str, Dict[str, Any]], ttl: int) -> None:
+        pass
+
+    @abstractmethod
+    async def async_delete_many(self, keys: List[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def async_delete_prefix(self, prefix: str) -> None:
+        pass
+
+    def get_size(self) -> Optional[int]:
+        return None
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """In-process LRU cache backend with TTL and size bound."""
+
+    name = "memory"
+
+    def __init__(self, max_size: int = 10_000):
+        """Constructor method for MemoryCacheBackend class.
+
+        Args:
+            max_size (int, optional): Maximum number of cached items. Defaults to 10_000.
+        """
+
+        self.max_size = max_size
+        self._items: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def async_get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        _now = time.monotonic()
+        _found = {}
+        with self._lock:
+            for _key in keys:
+                _item = self._items.get(_key)
+                if _item is None:
+                    continue
+
+                _expires_at, _value = _item
+                if _expires_at <= _now:
+                    del self._items[_key]
+                    continue
+
+                self._items.move_to_end(_key)
+                _found[_key] = dict(_value)
+
+        return _found
+
+    async def async_set_many(self, items: Dict[str, Dict[str, Any]], ttl: int) -> None:
+        _expires_at = time.monotonic() + ttl
+        with self._lock:
+            for _key, _value in items.items():
+                self._items[_key] = (_expires_at, dict(_value))
+                self._items.move_to_end(_key)
+
+            while self.max_size < len(self._items):
+                self._items.popitem(last=False)
+
+        return
+
+    async def async_delete_many(self, keys: List[str]) -> None:
+        with self._lock:
+            for _key in keys:
+                self._items.pop(_key, None)
+
+        return
+
+    async def async_delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for _key in [_key for _key in self._items if _key.startswith(prefix)]:
+                del self._items[_key]
+
+        return
+
+    def get_size(self) -> Optional[int]:
+        return len(self._items)
+
+
+__all__ = [
+    "BaseCacheBackend",
+    "MemoryCacheBackend",
+]
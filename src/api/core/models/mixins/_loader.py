@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.constants import WarnEnum
+
+
+class DataLoader:
+    """Request scoped loader of ORM objects by ID.
+    Concurrent `load()` calls issued in the same event-loop tick are coalesced into one
+    `async_get_by_ids()` query per ORM class, and results are memoized for the loader lifetime.
+    Queries of different ORM classes run one after another in a single dispatch task.
+    """
+
+    SESSION_INFO_KEY = "data_loader"
+
+    def __init__(self, async_session: AsyncSession):
+        """Constructor method for DataLoader class.
+
+        Args:
+            async_session (AsyncSession, required): SQLAlchemy async_session to load objects with.
+        """
+
+        self.async_session = async_session
+        self.batches = 0
+        self.loads = 0
+        self.memo_hits = 0
+        self._results: Dict[Tuple[Type[DeclarativeBase], Any], Any] = {}
+        self._pending: Dict[Type[DeclarativeBase], Dict[Any, asyncio.Future]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def load(
+        self, orm_class: Type[DeclarativeBase], id: Any
+    ) -> Union[DeclarativeBase, None]:
+        """Load ORM object by ID, batched with other loads of the same event-loop tick.
+
+        Args:
+            orm_class (Type[DeclarativeBase], required): ORM class to load.
+            id        (Any                  , required): ID of ORM object.
+
+        Raises:
+            Exception: Any exception from `async_get_by_ids()` of the batch.
+
+        Returns:
+            Union[DeclarativeBase, None]: ORM object or None if not found.
+        """
+
+        self.loads += 1
+        _key = (orm_class, id)
+        if _key in self._results:
+            self.memo_hits += 1
+            return self._results[_key]
+
+        _loop = asyncio.get_running_loop()
+        if (not self._pending) and (self._task is None):
+            _loop.call_soon(self._dispatch)
+
+        _futures = self._pending.setdefault(orm_class, {})
+        _future = _futures.get(id)
+        if _future is None:
+            _future = _loop.create_future()
+            _futures[id] = _future
+
+        return await _future
+
+    def _dispatch(self) -> None:
+        if (not self._pending) or (self._task is not None):
+            return
+
+        self._task = asyncio.get_running_loop().create_task(self._async_load_all())
+        return
+
+    async def _async_load_all(self) -> None:
+        # Session doesn't allow concurrent operations, so batches run one after another.
+        # Loads issued while a batch is running are collected into the next batches:
+        _pending: Dict[Type[DeclarativeBase], Dict[Any, asyncio.Future]] = {}
+        try:
+            while self._pending:
+                _pending = self._pending
+                self._pending = {}
+                for _orm_class, _futures in _pending.items():
+                    await self._async_load_batch(orm_class=_orm_class, futures=_futures)
+        except BaseException:
+            for _futures in [*_pending.values(), *self._pending.values()]:
+                for _future in _futures.values():
+                    if not _future.done():
+                        _future.cancel()
+
+            self._pending = {}
+            raise
+        finally:
+            self._task = None
+
+        return
+
+    async def _async_load_batch(
+        self,
+        orm_class: Type[DeclarativeBase],
+        futures: Dict[Any, asyncio.Future],
+    ) -> None:
+        self.batches += 1
+        _orm_objects: List[DeclarativeBase] = []
+        try:
+            _orm_objects = await orm_class.async_get_by_ids(
+                async_session=self.async_session,
+                ids=list(futures.keys()),
+                warn_mode=WarnEnum.IGNORE,
+            )
+        except NoResultFound:
+            pass
+        except Exception as err:
+            for _future in futures.values():
+                if not _future.done():
+                    _future.set_exception(err)
+
+            return
+
+        _found = {_orm_object.id: _orm_object for _orm_object in _orm_objects}
+        for _id, _future in futures.items():
+            _orm_object = _found.get(_id)
+            self._results[(orm_class, _id)] = _orm_object
+            if not _future.done():
+                _future.set_result(_orm_object)
+
+        return
+
+    def clear(self) -> None:
+        """Clear memoized results."""
+
+        self._results.clear()
+        return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get loader statistics.
+
+        Returns:
+            Dict[str, Any]: Number of loads, batch queries and memoized hits.
+        """
+
+        _stats = {
+            "loads": self.loads,
+            "batches": self.batches,
+            "memo_hits": self.memo_hits,
+        }
+        return _stats
+
+
+__all__ = ["DataLoader"]
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Union
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from api.config import config
+from api.logger import logger
+
+from ._cache_backend import BaseCacheBackend, MemoryCacheBackend
+
+
+_SESSION_INFO_KEY = "result_cache_invalidations"
+
+
+class ResultCache:
+    """Read-through cache of ORM objects by ID with pluggable backend and statistics."""
+
+    def __init__(self, backend: Optional[BaseCacheBackend] = None):
+        """Constructor method for ResultCache class.
+
+        Args:
+            backend (Optional[BaseCacheBackend], optional): Cache backend, None means disabled. Defaults to None.
+        """
+
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.backend is not None
+
+    async def async_get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get cached values by keys, backend errors are counted and treated as misses.
+
+        Args:
+            keys (List[str], required): List of cache keys.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Found values by cache key.
+        """
+
+        _found = {}
+        try:
+            _found = await self.backend.async_get_many(keys=keys)
+        except Exception as err:
+            self.errors += 1
+            logger.debug("Failed to get items from result cache: {}", err)
+
+        self.hits += len(_found)
+        self.misses += len(keys) - len(_found)
+        return _found
+
+    async def async_set_many(self, items: Dict[str, Dict[str, Any]], ttl: int) -> None:
+        """Set values into cache, backend errors are counted and ignored.
+
+        Args:
+            items (Dict[str, Dict[str, Any]], required): Values by cache key.
+            ttl   (int                      , required): Time to live in seconds.
+        """
+
+        if not items:
+            return
+
+        try:
+            await self.backend.async_set_many(items=items, ttl=ttl)
+            self.sets += len(items)
+        except Exception as err:
+            self.errors += 1
+            logger.debug("Failed to set items into result cache: {}", err)
+
+        return
+
+    async def async_invalidate(self, keys: Union[List[str], str]) -> None:
+        """Invalidate cached values by list of keys or by key prefix (string).
+
+        Args:
+            keys (Union[List[str], str], required): List of cache keys or key prefix.
+        """
+
+        try:
+            if isinstance(keys, str):
+                await self.backend.async_delete_prefix(prefix=keys)
+            else:
+                await self.backend.async_delete_many(keys=keys)
+
+            self.invalidations += 1
+        except Exception as err:
+            self.errors += 1
+            logger.warning("Failed to invalidate result cache: {}", err)
+
+        return
+
+    def invalidate_after_commit(
+        self, session: Session, keys: Union[List[str], str]
+    ) -> None:
+        """Register keys (or key prefix) to invalidate once more after session commit.
+
+        Args:
+            session (Session              , required): SQLAlchemy session of the write.
+            keys    (Union[List[str], str], required): List of cache keys or key prefix.
+        """
+
+        session.info.setdefault(_SESSION_INFO_KEY, []).append(keys)
+        return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get result cache statistics.
+
+        Returns:
+            Dict[str, Any]: Backend, size, hits, misses, sets, invalidations, errors and hit ratio of cache.
+        """
+
+        _total = self.hits + self.misses
+        _stats = {
+            "backend": self.backend.name if self.backend else None,
+            "size": self.backend.get_size() if self.backend else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+            "hit_ratio": round(self.hits / _total, 4) if _total else 0.0,
+        }
+        return _stats
+
+
+def _create_backend() -> Optional[BaseCacheBackend]:
+    if config.db.result_cache_size <= 0:
+        return None
+
+    if config.db.result_cache_backend == "redis":
+        from api.externals.redis import RedisCacheBackend
+
+        return RedisCacheBackend(
+            url=config.db.result_cache_redis_url.get_secret_value()
+        )
+
+    return MemoryCacheBackend(max_size=config.db.result_cache_size)
+
+
+result_cache = ResultCache(backend=_create_backend())
+
+
+# Writes are invalidated immediately and once more after commit, so rows re-cached
+# by concurrent readers before the commit don't stay stale until TTL:
+_pending_tasks: Set[asyncio.Task] = set()
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    _keys: List[Union[List[str], str]] = session.info.pop(_SESSION_INFO_KEY, None)
+    if (not _keys) or (not result_cache.is_enabled):
+        return
+
+    try:
+        _loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    for _key in _keys:
+        _task = _loop.create_task(result_cache.async_invalidate(keys=_key))
+        _pending_tasks.add(_task)
+        _task.add_done_callback(_pending_tasks.discard)
+
+    return
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_SESSION_INFO_KEY, None)
+    return
+
+
+__all__ = [
+    "ResultCache",
+    "result_cache",
+]
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+from sqlalchemy import Executable
+
+from api.config import config
+
+
+class StmtCache:
+    """Size bounded LRU cache of prebuilt SQLAlchemy statements by statement shape.
+    Cached statements use named bind parameters, so callers only pass new parameter values.
+    """
+
+    def __init__(self, max_size: int = 512):
+        """Constructor method for StmtCache class.
+
+        Args:
+            max_size (int, optional): Maximum number of cached statements, 0 means disabled. Defaults to 512.
+        """
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._stmts: OrderedDict[Hashable, Executable] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self, key: Hashable, build: Callable[[], Executable]
+    ) -> Executable:
+        """Get cached statement by shape key or build and cache a new one.
+
+        Args:
+            key   (Hashable                , required): Statement shape key.
+            build (Callable[[], Executable], required): Function to build statement on cache miss.
+
+        Returns:
+            Executable: Cached or newly built SQLAlchemy statement.
+        """
+
+        if self.max_size <= 0:
+            return build()
+
+        with self._lock:
+            _stmt = self._stmts.get(key)
+            if _stmt is not None:
+                self.hits += 1
+                self._stmts.move_to_end(key)
+                return _stmt
+
+            self.misses += 1
+
+        _stmt = build()
+        with self._lock:
+            self._stmts[key] = _stmt
+            while self.max_size < len(self._stmts):
+                self._stmts.popitem(last=False)
+
+        return _stmt
+
+    def clear(self) -> None:
+        """Clear all cached statements and reset counters."""
+
+        with self._lock:
+            self._stmts.clear()
+            self.hits = 0
+            self.misses = 0
+
+        return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statement cache statistics.
+
+        Returns:
+            Dict[str, Any]: Size, max size, hits, misses and hit ratio of cache.
+        """
+
+        _total = self.hits + self.misses
+        _stats = {
+            "size": len(self._stmts),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / _total, 4) if _total else 0.0,
+        }
+        return _stats
+
+
+stmt_cache = StmtCache(max_size=config.db.stmt_cache_size)
+
+
+__all__ = [
+    "StmtCache",
+    "stmt_cache",
+]
@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict, Union, List
+from uuid import uuid4
+from typing import Any, Dict, Union, List, Literal, Optional, Tuple
 
-from pydantic import validate_call
-from sqlalchemy import Result
+from sqlalchemy import Result, Select, select, table, column, text
 from sqlalchemy.orm import DeclarativeBase, declarative_mixin
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.constants import WarnEnum
+from api.core.utils import validate_internal_call
 from api.config import config
 
 if config.db.dialect == "postgresql":
@@ -18,6 +19,7 @@ if config.db.dialect == "postgresql":
         UniqueViolation,
         ForeignKeyViolation,
         CheckViolation,
+        IntegrityError as PsycopgIntegrityError,
     )
 elif (config.db.dialect == "mysql") or (config.db.dialect == "mariadb"):
     from sqlalchemy.dialects.mysql import Insert, insert
@@ -39,7 +41,7 @@ from ._update import AsyncUpdateMixin
 @declarative_mixin
 class AsyncCreateMixin(AsyncUpdateMixin):
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_insert(
         cls,
         async_session: AsyncSession,
@@ -138,7 +140,7 @@ class AsyncCreateMixin(AsyncUpdateMixin):
 
         return _orm_object
 
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_save(
         self,
         async_session: AsyncSession,
@@ -180,6 +182,10 @@ class AsyncCreateMixin(AsyncUpdateMixin):
             if not _orm_object:
                 async_session.add(self)
 
+            await self.__class__._async_invalidate_cache(
+                async_session=async_session, ids=[self.id]
+            )
+
             if auto_commit:
                 await async_session.commit()
 
@@ -223,7 +229,7 @@ class AsyncCreateMixin(AsyncUpdateMixin):
         return self
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_upsert(
         cls,
         async_session: AsyncSession,
@@ -306,6 +312,9 @@ class AsyncCreateMixin(AsyncUpdateMixin):
                     _stmt = _stmt.returning(cls)
 
                 _result: Result = await async_session.execute(_stmt)
+                await cls._async_invalidate_cache(
+                    async_session=async_session, ids=[kwargs["id"]]
+                )
                 if returning:
                     _orm_object: cls = _result.scalars().one()
 
@@ -346,26 +355,42 @@ class AsyncCreateMixin(AsyncUpdateMixin):
         return _orm_object
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_bulk_insert(
         cls,
         async_session: AsyncSession,
         raw_data: List[Dict[str, Any]],
         returning: bool = True,
+        method: Literal["insert", "copy"] = "insert",
+        chunk_size: int = config.db.copy_chunk_size,
+        on_conflict: Optional[Literal["nothing", "update"]] = None,
+        id_source: Literal["client", "server"] = "client",
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> List[DeclarativeBase]:
         """Bulk insert data into database.
+        The `copy` method (PostgreSQL only) streams rows by binary `COPY ... FROM STDIN` in chunks,
+        with `on_conflict` rows are copied into a temporary staging table and merged by
+        `INSERT ... SELECT ... ON CONFLICT (id)`.
+        With `server` ID source rows without `id` are inserted without it, so the database fills it
+        (`fn_tr__generate_pk` trigger or column default) and IDs come back by `RETURNING`,
+        order of returned objects is not guaranteed.
 
         Args:
-            async_session (AsyncSession        , required): SQLAlchemy async_session for database connection.
-            raw_data      (List[Dict[str, Any]], required): List of dictionary object data.
-            returning     (bool                , optional): Return inserted ORM objects from database. Defaults to True.
-            auto_commit   (bool                , optional): Auto commit. Defaults to False.
-            warn_mode     (WarnEnum            , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+            async_session (AsyncSession                         , required): SQLAlchemy async_session for database connection.
+            raw_data      (List[Dict[str, Any]]                 , required): List of dictionary object data.
+            returning     (bool                                 , optional): Return inserted ORM objects from database. Defaults to True.
+            method        (Literal["insert", "copy"]            , optional): Bulk insert method. Defaults to "insert".
+            chunk_size    (int                                  , optional): Number of rows per `COPY` chunk. Defaults to `config.db.copy_chunk_size`.
+            on_conflict   (Optional[Literal["nothing", "update"]], optional): Merge action on ID conflict for `copy` method. Defaults to None.
+            id_source     (Literal["client", "server"]          , optional): Generator of missing IDs. Defaults to "client".
+            auto_commit   (bool                                 , optional): Auto commit. Defaults to False.
+            warn_mode     (WarnEnum                             , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
             EmptyValueError     : If no data provided to bulk insert.
+            ValueError          : If `copy` method is used with non-PostgreSQL database.
+            ValueError          : If `server` ID source is used with `copy` method or without database ID generation.
             NullConstraintError : If null constraint error occurred.
             PrimaryKeyError     : If ID (PK) already exists in database.
             UniqueKeyError      : If unique constraint error occurred.
@@ -380,19 +405,54 @@ class AsyncCreateMixin(AsyncUpdateMixin):
         if not raw_data:
             raise EmptyValueError("No data provided to bulk insert!")
 
-        for _data in raw_data:
-            if "id" not in _data:
-                _data["id"] = cls.gen_unique_id()
+        if (method == "copy") and (config.db.dialect != "postgresql"):
+            raise ValueError(
+                "`copy` bulk insert method is only supported for PostgreSQL!"
+            )
+
+        _no_id_data = [_data for _data in raw_data if "id" not in _data]
+        _batches = [raw_data]
+        if id_source == "server":
+            if method == "copy":
+                raise ValueError(
+                    "`server` ID source is only supported by `insert` bulk method!"
+                )
+
+            if not cls._has_server_id():
+                raise ValueError(
+                    f"`{cls.__name__}` IDs are not generated by database, use `client` ID source!"
+                )
+
+            # Executemany needs the same keys for all rows:
+            if _no_id_data and (len(_no_id_data) < len(raw_data)):
+                _batches = [
+                    [_data for _data in raw_data if "id" in _data],
+                    _no_id_data,
+                ]
+        elif _no_id_data:
+            _ids = cls.gen_unique_ids(count=len(_no_id_data))
+            for _data, _id in zip(_no_id_data, _ids):
+                _data["id"] = _id
 
         _orm_objects: List[cls] = []
         try:
-            _stmt: Insert = insert(cls)
-            if returning:
-                _stmt = _stmt.returning(cls)
+            if method == "copy":
+                _orm_objects: List[cls] = await cls._async_bulk_copy(
+                    async_session=async_session,
+                    raw_data=raw_data,
+                    returning=returning,
+                    chunk_size=chunk_size,
+                    on_conflict=on_conflict,
+                )
+            else:
+                _stmt: Insert = insert(cls)
+                if returning:
+                    _stmt = _stmt.returning(cls)
 
-            _result: Result = await async_session.execute(_stmt, raw_data)
-            if returning:
-                _orm_objects: List[cls] = _result.scalars().all()
+                for _batch in _batches:
+                    _result: Result = await async_session.execute(_stmt, _batch)
+                    if returning:
+                        _orm_objects.extend(_result.scalars().all())
 
             if auto_commit:
                 await async_session.commit()
@@ -436,5 +496,281 @@ class AsyncCreateMixin(AsyncUpdateMixin):
 
         return _orm_objects
 
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
+    async def async_bulk_upsert(
+        cls,
+        async_session: AsyncSession,
+        raw_data: List[Dict[str, Any]],
+        conflict_columns: Optional[List[str]] = None,
+        constraint: Optional[str] = None,
+        update_columns: Optional[List[str]] = None,
+        returning: bool = True,
+        auto_commit: bool = False,
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> List[DeclarativeBase]:
+        """Bulk upsert data into database, in batches within `config.db.bulk_max_params` bind parameters.
+
+        Args:
+            async_session    (AsyncSession        , required): SQLAlchemy async_session for database connection.
+            raw_data         (List[Dict[str, Any]], required): List of dictionary object data, all with the same columns.
+            conflict_columns (Optional[List[str]] , optional): Conflict target columns. Defaults to None (["id"]).
+            constraint       (Optional[str]       , optional): Conflict target constraint name (PostgreSQL only). Defaults to None.
+            update_columns   (Optional[List[str]] , optional): Whitelist of columns to update on conflict, None means all. Defaults to None.
+            returning        (bool                , optional): Return upserted ORM objects from database, selected by conflict target on MySQL and MariaDB. Defaults to True.
+            auto_commit      (bool                , optional): Auto commit. Defaults to False.
+            warn_mode        (WarnEnum            , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Raises:
+            EmptyValueError     : If no data provided to bulk upsert.
+            ValueError          : If data rows have different columns.
+            NullConstraintError : If null constraint error occurred.
+            UniqueKeyError      : If unique constraint error occurred.
+            ForeignKeyError     : If foreign key constraint error occurred.
+            CheckConstraintError: If check constraint error occurred.
+            Exception           : If failed to bulk upsert objects into database.
+
+        Returns:
+            List[DeclarativeBase]: List of upserted ORM objects.
+        """
+
+        if not raw_data:
+            raise EmptyValueError("No data provided to bulk upsert!")
+
+        _no_id_data = [_data for _data in raw_data if "id" not in _data]
+        if _no_id_data:
+            _ids = cls.gen_unique_ids(count=len(_no_id_data))
+            for _data, _id in zip(_no_id_data, _ids):
+                _data["id"] = _id
+
+        _columns = list(raw_data[0].keys())
+        for _data in raw_data:
+            if (len(_data) != len(_columns)) or any(
+                _column not in _data for _column in _columns
+            ):
+                raise ValueError("All rows must have the same columns to bulk upsert!")
+
+        _dialect_name: str = async_session.get_bind().dialect.name
+        _orm_objects: List[cls] = []
+        try:
+            _stmt: Insert = cls._get_upsert_stmt(
+                columns=_columns,
+                conflict_columns=conflict_columns,
+                constraint=constraint,
+                update_columns=update_columns,
+                returning=returning,
+                dialect=_dialect_name,
+            )
+            _batch_size = cls._get_bulk_batch_size(num_columns=len(_columns))
+            # MySQL and MariaDB upserted rows are selected after each batch:
+            _is_returning = _dialect_name in ("postgresql", "sqlite")
+            for _i in range(0, len(raw_data), _batch_size):
+                _batch_data = raw_data[_i : _i + _batch_size]
+                _result: Result = await async_session.execute(
+                    _stmt, _batch_data, execution_options={"populate_existing": True}
+                )
+                if returning and _is_returning:
+                    _orm_objects.extend(_result.scalars().all())
+                elif returning:
+                    _select_stmt, _params = cls._get_upserted_stmt(
+                        raw_data=_batch_data, conflict_columns=conflict_columns
+                    )
+                    _result: Result = await async_session.execute(
+                        _select_stmt,
+                        _params,
+                        execution_options={"populate_existing": True},
+                    )
+                    _orm_objects.extend(_result.scalars().all())
+
+            if returning:
+                _ids = [_orm_object.id for _orm_object in _orm_objects]
+                await cls._async_invalidate_cache(async_session=async_session, ids=_ids)
+            else:
+                await cls._async_invalidate_cache(async_session=async_session)
+
+            if auto_commit:
+                await async_session.commit()
+
+        except Exception as err:
+            if auto_commit:
+                await async_session.rollback()
+
+            if isinstance(err, IntegrityError):
+                if isinstance(err.orig, NotNullViolation):
+                    raise NullConstraintError(
+                        f"`{err.orig.diag.column_name}` cannot be NULL."
+                    )
+                elif isinstance(err.orig, UniqueViolation):
+                    _detail = err.orig.diag.message_detail.replace("Key ", "")
+                    raise UniqueKeyError(_detail)
+                elif isinstance(err.orig, ForeignKeyViolation):
+                    _detail = (
+                        err.orig.diag.message_detail.replace("Key ", "")
+                        .replace('"', "'")
+                        .replace(f"table '{config.db.prefix}", "'")
+                    )
+                    raise ForeignKeyError(_detail)
+                elif isinstance(err.orig, CheckViolation):
+                    _detail = err.orig.diag.message_detail.replace("Key ", "")
+                    raise CheckConstraintError(_detail)
+
+            _message = f"Failed to bulk upsert `{cls.__name__}` objects into database!"
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.error(_message)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message)
+
+            raise
+
+        return _orm_objects
+
+    @classmethod
+    async def _async_copy_rows(
+        cls,
+        async_session: AsyncSession,
+        table_name: str,
+        column_names: List[str],
+        types: List[str],
+        rows: List[Tuple[Any, ...]],
+    ) -> None:
+        """Copy rows into table by binary `COPY ... FROM STDIN` on the session connection (transaction).
+
+        Args:
+            async_session (AsyncSession         , required): SQLAlchemy async_session for database connection.
+            table_name    (str                  , required): Quoted table name.
+            column_names  (List[str]            , required): Quoted column names.
+            types         (List[str]            , required): Database type names of columns.
+            rows          (List[Tuple[Any, ...]], required): Rows as tuples of column values.
+
+        Raises:
+            IntegrityError: If constraint violation occurred, with driver error as `orig`.
+        """
+
+        _sql = (
+            f"COPY {table_name} ({', '.join(column_names)}) FROM STDIN (FORMAT BINARY)"
+        )
+
+        _connection = await async_session.connection()
+        _raw_connection = await _connection.get_raw_connection()
+        try:
+            async with _raw_connection.driver_connection.cursor() as _cursor:
+                async with _cursor.copy(_sql) as _copy:
+                    _copy.set_types(types)
+                    for _row in rows:
+                        await _copy.write_row(_row)
+        except PsycopgIntegrityError as err:
+            # Same exception as statements executed by SQLAlchemy for common error handling:
+            raise IntegrityError(_sql, None, err) from err
+
+        return
+
+    @classmethod
+    async def _async_bulk_copy(
+        cls,
+        async_session: AsyncSession,
+        raw_data: List[Dict[str, Any]],
+        returning: bool = True,
+        chunk_size: int = config.db.copy_chunk_size,
+        on_conflict: Optional[Literal["nothing", "update"]] = None,
+    ) -> List[DeclarativeBase]:
+        """Bulk insert (or merge by staging table) data in chunks by binary `COPY`.
+
+        Args:
+            async_session (AsyncSession                         , required): SQLAlchemy async_session for database connection.
+            raw_data      (List[Dict[str, Any]]                 , required): List of dictionary object data with IDs.
+            returning     (bool                                 , optional): Return inserted ORM objects from database. Defaults to True.
+            chunk_size    (int                                  , optional): Number of rows per `COPY` chunk. Defaults to `config.db.copy_chunk_size`.
+            on_conflict   (Optional[Literal["nothing", "update"]], optional): Merge action on ID conflict. Defaults to None.
+
+        Returns:
+            List[DeclarativeBase]: List of inserted ORM objects.
+        """
+
+        _connection = await async_session.connection()
+        _dialect = _connection.dialect
+        _preparer = _dialect.identifier_preparer
+        _table_name = _preparer.format_table(cls.__table__)
+
+        _staging_name: Union[str, None] = None
+        if on_conflict:
+            _staging_name = f"_staging__{cls.__tablename__}__{uuid4().hex[:8]}"
+            await async_session.execute(
+                text(
+                    f"CREATE TEMP TABLE {_preparer.quote(_staging_name)} "
+                    f"(LIKE {_table_name} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+            )
+
+        _orm_objects: List[cls] = []
+        for _i in range(0, len(raw_data), chunk_size):
+            _chunk = raw_data[_i : _i + chunk_size]
+            _columns, _types, _rows = cls._get_copy_plan(
+                raw_data=_chunk, dialect=_dialect
+            )
+            _column_names = [_preparer.quote(_column.name) for _column in _columns]
+            _ids = [_data["id"] for _data in _chunk]
+
+            if not on_conflict:
+                await cls._async_copy_rows(
+                    async_session=async_session,
+                    table_name=_table_name,
+                    column_names=_column_names,
+                    types=_types,
+                    rows=_rows,
+                )
+
+                if returning:
+                    _stmt: Select = select(cls).where(cls.id.in_(_ids))
+                    _result: Result = await async_session.execute(_stmt)
+                    _orm_objects.extend(_result.scalars().all())
+
+                continue
+
+            await cls._async_copy_rows(
+                async_session=async_session,
+                table_name=_preparer.quote(_staging_name),
+                column_names=_column_names,
+                types=_types,
+                rows=_rows,
+            )
+
+            _staging = table(
+                _staging_name, *[column(_column.name) for _column in _columns]
+            )
+            _stmt: Insert = insert(cls).from_select(
+                _columns, select(*_staging.c), include_defaults=False
+            )
+            if on_conflict == "update":
+                _stmt = _stmt.on_conflict_do_update(
+                    index_elements=["id"],
+                    set_={
+                        _column.name: _stmt.excluded[_column.name]
+                        for _column in _columns
+                        if not _column.primary_key
+                    },
+                )
+            else:
+                _stmt = _stmt.on_conflict_do_nothing(index_elements=["id"])
+
+            if returning:
+                _stmt = _stmt.returning(cls)
+
+            _result: Result = await async_session.execute(_stmt)
+            if returning:
+                _orm_objects.extend(_result.scalars().all())
+
+            await async_session.execute(
+                text(f"TRUNCATE {_preparer.quote(_staging_name)}")
+            )
+            if on_conflict == "update":
+                await cls._async_invalidate_cache(async_session=async_session, ids=_ids)
+
+        if _staging_name:
+            await async_session.execute(
+                text(f"DROP TABLE {_preparer.quote(_staging_name)}")
+            )
+
+        return _orm_objects
+
 
 __all__ = ["AsyncCreateMixin"]
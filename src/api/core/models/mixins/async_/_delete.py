@@ -2,7 +2,6 @@
 
 from typing import List, Dict, Union, Any
 
-from pydantic import validate_call
 from sqlalchemy import Delete, delete, Result
 from sqlalchemy.orm import DeclarativeBase, declarative_mixin
 from sqlalchemy.exc import NoResultFound
@@ -16,6 +15,7 @@ if config.db.dialect == "postgresql":
 # else:
 #     from sqlalchemy.exc import IntegrityError as ForeignKeyViolation
 from api.core.exceptions import EmptyValueError, ForeignKeyError
+from api.core.utils import validate_internal_call
 from api.logger import logger
 
 from ._read import AsyncReadMixin
@@ -23,7 +23,7 @@ from ._read import AsyncReadMixin
 
 @declarative_mixin
 class AsyncDeleteMixin(AsyncReadMixin):
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_delete(
         self,
         async_session: AsyncSession,
@@ -44,6 +44,9 @@ class AsyncDeleteMixin(AsyncReadMixin):
 
         try:
             await async_session.delete(self)
+            await self.__class__._async_invalidate_cache(
+                async_session=async_session, ids=[self.id]
+            )
 
             if auto_commit:
                 await async_session.commit()
@@ -73,7 +76,7 @@ class AsyncDeleteMixin(AsyncReadMixin):
         return
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_delete_by_id(
         cls,
         async_session: AsyncSession,
@@ -108,12 +111,15 @@ class AsyncDeleteMixin(AsyncReadMixin):
             try:
                 _stmt: Delete = delete(cls).where(cls.id == id)
                 _result: Result = await async_session.execute(_stmt)
+                await cls._async_invalidate_cache(async_session=async_session, ids=[id])
 
                 if auto_commit:
                     await async_session.commit()
 
                 logger.debug(
-                    f"Deleted '{_result.rowcount}' row from `{cls.__name__}` ORM table."
+                    "Deleted '{}' row from `{}` ORM table.",
+                    _result.rowcount,
+                    cls.__name__,
                 )
 
                 if _result.rowcount == 0:
@@ -148,7 +154,7 @@ class AsyncDeleteMixin(AsyncReadMixin):
         return
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_delete_by_ids(
         cls,
         async_session: AsyncSession,
@@ -176,12 +182,15 @@ class AsyncDeleteMixin(AsyncReadMixin):
         try:
             _stmt: Delete = delete(cls).where(cls.id.in_(ids))
             _result: Result = await async_session.execute(_stmt)
+            await cls._async_invalidate_cache(async_session=async_session, ids=ids)
 
             if auto_commit:
                 await async_session.commit()
 
             logger.debug(
-                f"Deleted '{_result.rowcount}' row(s) from `{cls.__name__}` ORM table."
+                "Deleted '{}' row(s) from `{}` ORM table.",
+                _result.rowcount,
+                cls.__name__,
             )
 
             if _result.rowcount == 0:
@@ -214,7 +223,7 @@ class AsyncDeleteMixin(AsyncReadMixin):
         return
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_delete_objects(
         cls,
         async_session: AsyncSession,
@@ -222,11 +231,11 @@ class AsyncDeleteMixin(AsyncReadMixin):
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> None:
-        """Delete ORM objects from database.
+        """Delete ORM objects from database by chunked `DELETE ... WHERE id IN (...)` statements.
 
         Args:
-            async_session (AsyncSession         , required): SQLAlchemy
-            objects       (List[DeclarativeBase], required): List of ORM objects.
+            async_session (AsyncSession         , required): SQLAlchemy async_session for database connection.
+            orm_objects   (List[DeclarativeBase], required): List of ORM objects.
             auto_commit   (bool                 , optional): Auto commit. Defaults to False.
             warn_mode     (WarnEnum             , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
@@ -239,13 +248,36 @@ class AsyncDeleteMixin(AsyncReadMixin):
         if not orm_objects:
             raise EmptyValueError("No ORM objects provided to delete!")
 
+        _ids = [_orm_object.id for _orm_object in orm_objects]
         try:
-            for _orm_object in orm_objects:
-                await async_session.delete(_orm_object)
+            _rowcount = 0
+            for _i in range(0, len(_ids), config.db.bulk_max_params):
+                _stmt, _params = cls._get_delete_stmt(
+                    where={
+                        "column": "id",
+                        "op": "in",
+                        "value": _ids[_i : _i + config.db.bulk_max_params],
+                    }
+                )
+                _result: Result = await async_session.execute(_stmt, _params)
+                _rowcount += _result.rowcount
+
+            await cls._async_invalidate_cache(async_session=async_session, ids=_ids)
 
             if auto_commit:
                 await async_session.commit()
 
+            logger.debug(
+                "Deleted '{}' row(s) from `{}` ORM table.",
+                _rowcount,
+                cls.__name__,
+            )
+
+            if _rowcount == 0:
+                raise NoResultFound(
+                    f"Not found any `{cls.__name__}` objects to delete from database!"
+                )
+
         except Exception as err:
             if auto_commit:
                 await async_session.rollback()
@@ -271,7 +303,7 @@ class AsyncDeleteMixin(AsyncReadMixin):
         return
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_delete_by_where(
         cls,
         async_session: AsyncSession,
@@ -317,15 +349,17 @@ class AsyncDeleteMixin(AsyncReadMixin):
                 )
         else:
             try:
-                _stmt: Delete = delete(cls)
-                _stmt = cls._build_where_stmt(stmt=_stmt, where=where)
-                _result: Result = await async_session.execute(_stmt)
+                _stmt, _params = cls._get_delete_stmt(where=where)
+                _result: Result = await async_session.execute(_stmt, _params)
+                await cls._async_invalidate_cache(async_session=async_session)
 
                 if auto_commit:
                     await async_session.commit()
 
                 logger.debug(
-                    f"Deleted '{_result.rowcount}' row(s) from `{cls.__name__}` ORM table."
+                    "Deleted '{}' row(s) from `{}` ORM table.",
+                    _result.rowcount,
+                    cls.__name__,
                 )
 
                 if (not allow_no_result) and (_result.rowcount == 0):
@@ -358,7 +392,7 @@ class AsyncDeleteMixin(AsyncReadMixin):
         return
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_delete_all(
         cls,
         async_session: AsyncSession,
@@ -379,12 +413,15 @@ class AsyncDeleteMixin(AsyncReadMixin):
         try:
             _stmt = delete(cls)
             _result: Result = await async_session.execute(_stmt)
+            await cls._async_invalidate_cache(async_session=async_session)
 
             if auto_commit:
                 await async_session.commit()
 
             logger.debug(
-                f"Deleted '{_result.rowcount}' row(s) from `{cls.__name__}` ORM table."
+                "Deleted '{}' row(s) from `{}` ORM table.",
+                _result.rowcount,
+                cls.__name__,
             )
         except Exception as err:
             if auto_commit:
@@ -1,24 +1,103 @@
 # -*- coding: utf-8 -*-
 
-from typing import Union, List, Dict, Any, Optional
+from typing import Union, List, Dict, Any, Optional, Tuple, AsyncGenerator
 
-from pydantic import validate_call
-from sqlalchemy import Select, select, Result, func
+from sqlalchemy import Select, select, Result, func, inspect
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import DeclarativeBase, declarative_mixin
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncConnection, AsyncScalarResult
 
 from api.core.constants import WarnEnum
 from api.config import config
-from api.core.exceptions import EmptyValueError
-from api.core.models.mixins import BaseMixin
+from api.core.exceptions import EmptyValueError, CursorError
+from api.core.models.mixins import BaseMixin, DataLoader, result_cache
+from api.core.utils import validate_internal_call
 from api.logger import logger
 
 
 @declarative_mixin
 class AsyncReadMixin(BaseMixin):
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    async def _async_get_cached(
+        cls, async_session: AsyncSession, ids: List[Any]
+    ) -> Dict[Any, DeclarativeBase]:
+        """Get ORM objects by IDs from session identity map or result cache (merged into session).
+
+        Args:
+            async_session (AsyncSession, required): SQLAlchemy async_session for database connection.
+            ids           (List[Any]   , required): List of IDs.
+
+        Returns:
+            Dict[Any, DeclarativeBase]: Found ORM objects by ID.
+        """
+
+        _found = {}
+        _keys = {}
+        for _id in ids:
+            _orm_object = async_session.identity_map.get(identity_key(cls, _id))
+            if (_orm_object is not None) and (not inspect(_orm_object).unloaded):
+                _found[_id] = _orm_object
+            else:
+                _keys[cls._get_cache_key(id=_id)] = _id
+
+        if _keys:
+            _values = await result_cache.async_get_many(keys=list(_keys))
+            for _key, _data in _values.items():
+                _found[_keys[_key]] = await async_session.merge(
+                    cls._from_cache_dict(data=_data), load=False
+                )
+
+        return _found
+
+    @classmethod
+    async def _async_set_cached(cls, orm_objects: List[DeclarativeBase]) -> None:
+        """Store loaded and unmodified ORM objects into result cache.
+
+        Args:
+            orm_objects (List[DeclarativeBase], required): List of ORM objects.
+        """
+
+        _items = {}
+        for _orm_object in orm_objects:
+            _state = inspect(_orm_object)
+            if (not _state.persistent) or _state.modified:
+                continue
+
+            _data = _orm_object._to_cache_dict()
+            if _data is not None:
+                _items[cls._get_cache_key(id=_orm_object.id)] = _data
+
+        await result_cache.async_set_many(items=_items, ttl=config.db.result_cache_ttl)
+        return
+
+    @classmethod
+    async def _async_invalidate_cache(
+        cls, async_session: AsyncSession, ids: Optional[List[Any]] = None
+    ) -> None:
+        """Invalidate cached ORM objects now and once more after session commit.
+
+        Args:
+            async_session (AsyncSession       , required): SQLAlchemy async_session of the write.
+            ids           (Optional[List[Any]], optional): List of IDs, None means all objects of the model. Defaults to None.
+        """
+
+        if not cls._is_result_cached():
+            return
+
+        _keys: Union[List[str], str] = f"{cls.__tablename__}:"
+        if ids is not None:
+            _keys = [cls._get_cache_key(id=_id) for _id in ids]
+
+        await result_cache.async_invalidate(keys=_keys)
+        result_cache.invalidate_after_commit(
+            session=async_session.sync_session, keys=_keys
+        )
+        return
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_select_by_where(
         cls,
         async_session: AsyncSession,
@@ -29,10 +108,14 @@ class AsyncReadMixin(BaseMixin):
         is_desc: bool = True,
         joins: Optional[List[str]] = None,
         disable_limit: bool = False,
+        cursor: Optional[str] = None,
+        columns: Optional[List[str]] = None,
         allow_no_result: bool = True,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> List[DeclarativeBase]:
         """Select ORM objects from database by where filter conditions.
+        With `columns` only these columns (and `id`) are selected and returned as read-only
+        `__slots__` dataclass rows (see `get_row_class()`), skipping the session identity map.
 
         Args:
             async_session   (AsyncSession               , required): SQLAlchemy async_session for database connection.
@@ -44,10 +127,14 @@ class AsyncReadMixin(BaseMixin):
             is_desc         (bool                       , optional): Is sort descending or ascending. Defaults to True.
             joins           (Optional[List[str]]        , optional): List of joinable relationships. Defaults to None.
             disable_limit   (bool                       , optional): Disable select limit. Defaults to False.
+            cursor          (Optional[str]              , optional): Keyset pagination cursor, `offset` is ignored. Defaults to None.
+            columns         (Optional[List[str]]        , optional): Read-only projection columns. Defaults to None.
             allow_no_result (bool                       , optional): Allow no result. Defaults to True.
             warn_mode       (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
+            ValueError   : If projection column doesn't exist.
+            CursorError  : If `cursor` is invalid or doesn't match current sort order.
             NoResultFound: If no result found and `allow_no_result` is False.
             Exception    : If failed to get ORM objects from database by where filter conditions.
 
@@ -55,9 +142,13 @@ class AsyncReadMixin(BaseMixin):
             List[DeclarativeBase]: List of ORM objects.
         """
 
+        _columns: Optional[Tuple[str, ...]] = None
+        if columns:
+            _columns, _row_class = cls.get_row_class(columns=columns)
+
         _orm_objects: List[cls] = []
         try:
-            _stmt: Select = cls._build_select(
+            _stmt, _params = cls._get_select_stmt(
                 where=where,
                 offset=offset,
                 limit=limit,
@@ -65,13 +156,20 @@ class AsyncReadMixin(BaseMixin):
                 is_desc=is_desc,
                 joins=joins,
                 disable_limit=disable_limit,
+                cursor=cursor,
+                columns=_columns,
             )
 
-            _result: Result = await async_session.execute(_stmt)
-            if joins:
-                _result = _result.unique()
+            _result: Result = await async_session.execute(_stmt, _params)
+            if _columns:
+                _orm_objects = [_row_class(*_row) for _row in _result.tuples()]
+            else:
+                if joins:
+                    _result = _result.unique()
 
-            _orm_objects: List[cls] = _result.scalars().all()
+                _orm_objects: List[cls] = _result.scalars().all()
+        except CursorError:
+            raise
         except Exception:
             _message = f"Failed to get `{cls.__name__}` objects from database by filtering with '{where}'!"
             if warn_mode == WarnEnum.ALWAYS:
@@ -89,7 +187,172 @@ class AsyncReadMixin(BaseMixin):
         return _orm_objects
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
+    async def async_select_with_count_by_where(
+        cls,
+        async_session: AsyncSession,
+        where: Union[List[Dict[str, Any]], Dict[str, Any]],
+        offset: int = 0,
+        limit: int = config.db.select_limit,
+        order_by: Union[List[str], str, None] = None,
+        is_desc: bool = True,
+        joins: Optional[List[str]] = None,
+        disable_limit: bool = False,
+        cursor: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        estimate_count: bool = False,
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> Tuple[List[DeclarativeBase], int, bool]:
+        """Select ORM objects and count of all filtered objects in one statement.
+        With `estimate_count`, planner estimate above `config.db.count_estimate_threshold`
+        is returned instead of exact count. With `columns` read-only projection rows are returned
+        (same as `async_select_by_where()`).
+
+        Args:
+            async_session   (AsyncSession               , required): SQLAlchemy async_session for database connection.
+            where           (Union[List[Dict[str, Any]],
+                                   Dict[str, Any]]      , required): List of filter conditions.
+            offset          (int                        , optional): Number of objects to skip. Defaults to 0.
+            limit           (int                        , optional): Number of objects to limit. Defaults to `config.db.select_limit`.
+            order_by        (Union[List[str], str, None], optional): List of order by columns. Defaults to None.
+            is_desc         (bool                       , optional): Is sort descending or ascending. Defaults to True.
+            joins           (Optional[List[str]]        , optional): List of joinable relationships. Defaults to None.
+            disable_limit   (bool                       , optional): Disable select limit. Defaults to False.
+            cursor          (Optional[str]              , optional): Keyset pagination cursor, `offset` is ignored. Defaults to None.
+            columns         (Optional[List[str]]        , optional): Read-only projection columns. Defaults to None.
+            estimate_count  (bool                       , optional): Use estimated count for large results. Defaults to False.
+            warn_mode       (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Raises:
+            ValueError : If projection column doesn't exist.
+            CursorError: If `cursor` is invalid or doesn't match current sort order.
+            Exception  : If failed to get ORM objects from database by where filter conditions.
+
+        Returns:
+            Tuple[List[DeclarativeBase], int, bool]: List of ORM objects, count of all objects and is count estimated as tuple.
+        """
+
+        if estimate_count:
+            _estimate: Optional[int] = await cls._async_get_large_estimate(
+                async_session=async_session, where=where, warn_mode=warn_mode
+            )
+            if _estimate is not None:
+                _orm_objects: List[cls] = await cls.async_select_by_where(
+                    async_session=async_session,
+                    where=where,
+                    offset=offset,
+                    limit=limit,
+                    order_by=order_by,
+                    is_desc=is_desc,
+                    joins=joins,
+                    disable_limit=disable_limit,
+                    cursor=cursor,
+                    columns=columns,
+                    warn_mode=warn_mode,
+                )
+                return _orm_objects, _estimate, True
+
+        _columns: Optional[Tuple[str, ...]] = None
+        if columns:
+            _columns, _row_class = cls.get_row_class(columns=columns)
+
+        _orm_objects: List[cls] = []
+        _all_count = 0
+        try:
+            _stmt, _params = cls._get_select_stmt(
+                where=where,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                is_desc=is_desc,
+                joins=joins,
+                disable_limit=disable_limit,
+                cursor=cursor,
+                with_count=True,
+                columns=_columns,
+            )
+
+            _result: Result = await async_session.execute(_stmt, _params)
+            if joins and (not _columns):
+                _result = _result.unique()
+
+            _rows = _result.all()
+            if _columns:
+                _orm_objects = [_row_class(*_row[:-1]) for _row in _rows]
+            else:
+                _orm_objects: List[cls] = [_row[0] for _row in _rows]
+
+            if _rows:
+                _all_count: int = _rows[0][-1]
+        except CursorError:
+            raise
+        except Exception:
+            _message = f"Failed to get `{cls.__name__}` objects with count from database by filtering with '{where}'!"
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.error(_message)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message)
+
+            raise
+
+        # Empty page (out of range offset or cursor) doesn't carry the count:
+        if (not _orm_objects) and ((0 < offset) or cursor):
+            _all_count: int = await cls.async_count_by_where(
+                async_session=async_session, where=where, warn_mode=warn_mode
+            )
+
+        return _orm_objects, _all_count, False
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
+    async def async_stream_by_where(
+        cls,
+        async_session: AsyncSession,
+        where: Union[List[Dict[str, Any]], Dict[str, Any]],
+        order_by: Union[List[str], str, None] = None,
+        is_desc: bool = True,
+        yield_per: int = config.db.stream_yield_per,
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> AsyncGenerator[DeclarativeBase, None]:
+        """Stream ORM objects from database by where filter conditions with server-side cursor.
+        Rows are fetched in `yield_per` sized batches, so memory usage doesn't depend on result size.
+
+        Args:
+            async_session (AsyncSession               , required): SQLAlchemy async_session for database connection.
+            where         (Union[List[Dict[str, Any]],
+                                 Dict[str, Any]]      , required): List of filter conditions.
+            order_by      (Union[List[str], str, None], optional): List of order by columns. Defaults to None.
+            is_desc       (bool                       , optional): Is sort descending or ascending. Defaults to True.
+            yield_per     (int                        , optional): Number of rows to fetch per batch. Defaults to `config.db.stream_yield_per`.
+            warn_mode     (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Raises:
+            Exception: If failed to stream ORM objects from database by where filter conditions.
+
+        Yields:
+            AsyncGenerator[DeclarativeBase, None]: ORM objects.
+        """
+
+        try:
+            _stmt, _params = cls._get_stream_stmt(
+                where=where, order_by=order_by, is_desc=is_desc
+            )
+            _result: AsyncScalarResult = await async_session.stream_scalars(
+                _stmt, _params, execution_options={"yield_per": yield_per}
+            )
+            async for _orm_object in _result:
+                yield _orm_object
+        except Exception:
+            _message = f"Failed to stream `{cls.__name__}` objects from database by filtering with '{where}'!"
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.error(_message)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message)
+
+            raise
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_select(
         cls,
         async_session: AsyncSession,
@@ -144,7 +407,7 @@ class AsyncReadMixin(BaseMixin):
         return _orm_objects
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_get(
         cls,
         async_session: AsyncSession,
@@ -153,6 +416,7 @@ class AsyncReadMixin(BaseMixin):
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> Union[DeclarativeBase, None]:
         """Get ORM object from database by ID.
+        If session has request scoped `DataLoader`, concurrent calls are batched into `async_get_by_ids()`.
 
         Args:
             async_session   (AsyncSession, required): SQLAlchemy async_session for database connection.
@@ -170,7 +434,22 @@ class AsyncReadMixin(BaseMixin):
 
         _orm_object: Union[cls, None] = None
         try:
-            _orm_object: Union[cls, None] = await async_session.get(cls, id)
+            # Request scoped loader (attached by `async_get_read` dependency) batches concurrent gets:
+            _loader: Union[DataLoader, None] = async_session.info.get(
+                DataLoader.SESSION_INFO_KEY
+            )
+            _is_cached = cls._is_result_cached()
+            if _loader:
+                _orm_object: Union[cls, None] = await _loader.load(orm_class=cls, id=id)
+            elif _is_cached:
+                _orm_object = (
+                    await cls._async_get_cached(async_session=async_session, ids=[id])
+                ).get(id)
+
+            if (not _loader) and (_orm_object is None):
+                _orm_object: Union[cls, None] = await async_session.get(cls, id)
+                if _is_cached and _orm_object:
+                    await cls._async_set_cached(orm_objects=[_orm_object])
         except Exception:
             _message = (
                 f"Failed to get `{cls.__name__}` object with '{id}' ID from database!"
@@ -190,7 +469,7 @@ class AsyncReadMixin(BaseMixin):
         return _orm_object
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_get_by_where(
         cls,
         async_session: AsyncSession,
@@ -244,7 +523,7 @@ class AsyncReadMixin(BaseMixin):
         return _orm_object
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_get_by_ids(
         cls,
         async_session: AsyncSession,
@@ -272,9 +551,26 @@ class AsyncReadMixin(BaseMixin):
 
         _orm_objects: List[cls] = []
         try:
-            _stmt: Select = select(cls).where(cls.id.in_(ids))
-            _result: Result = await async_session.execute(_stmt)
-            _orm_objects: List[cls] = _result.scalars().all()
+            if cls._is_result_cached():
+                _found = await cls._async_get_cached(
+                    async_session=async_session, ids=ids
+                )
+                _missing_ids = [_id for _id in ids if _id not in _found]
+                if _missing_ids:
+                    _stmt: Select = select(cls).where(cls.id.in_(_missing_ids))
+                    _result: Result = await async_session.execute(_stmt)
+                    _loaded: List[cls] = _result.scalars().all()
+                    await cls._async_set_cached(orm_objects=_loaded)
+                    for _orm_object in _loaded:
+                        _found[_orm_object.id] = _orm_object
+
+                _orm_objects: List[cls] = [
+                    _found[_id] for _id in dict.fromkeys(ids) if _id in _found
+                ]
+            else:
+                _stmt: Select = select(cls).where(cls.id.in_(ids))
+                _result: Result = await async_session.execute(_stmt)
+                _orm_objects: List[cls] = _result.scalars().all()
 
             if not _orm_objects:
                 raise NoResultFound(
@@ -295,7 +591,7 @@ class AsyncReadMixin(BaseMixin):
         return _orm_objects
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_exists_by_id(
         cls,
         async_session: AsyncSession,
@@ -334,7 +630,7 @@ class AsyncReadMixin(BaseMixin):
 
         return _is_exists
 
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_exists(
         self,
         async_session: AsyncSession,
@@ -372,19 +668,24 @@ class AsyncReadMixin(BaseMixin):
         return _is_exists
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_count_by_where(
         cls,
         async_session: AsyncSession,
         where: Union[List[Dict[str, Any]], Dict[str, Any]],
+        approximate: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> int:
         """Count ORM objects in database by filter conditions.
+        With `approximate`, planner estimate (see `async_estimate_count_by_where()`) above
+        `config.db.count_estimate_threshold` is returned instead of exact count, otherwise
+        (small, non-PostgreSQL, never analyzed table or failed estimate) rows are counted.
 
         Args:
             async_session (AsyncSession              , required): SQLAlchemy async_session for database connection.
             where         (Union[List[Dict[str, Any]],
                                       Dict[str, Any]], required): List of filter conditions.
+            approximate   (bool                      , optional): Use estimated count for large results. Defaults to False.
             warn_mode     (WarnEnum                  , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
@@ -394,13 +695,17 @@ class AsyncReadMixin(BaseMixin):
             int: Count of ORM objects in database.
         """
 
+        if approximate:
+            _estimate: Optional[int] = await cls._async_get_large_estimate(
+                async_session=async_session, where=where, warn_mode=warn_mode
+            )
+            if _estimate is not None:
+                return _estimate
+
         _count = 0
         try:
-            _stmt: Select = select(func.count()).select_from(cls)
-            if where:
-                _stmt: Select = cls._build_where(stmt=_stmt, where=where)
-
-            _result: Result = await async_session.execute(_stmt)
+            _stmt, _params = cls._get_count_stmt(where=where)
+            _result: Result = await async_session.execute(_stmt, _params)
             _count: int = _result.scalar()
         except Exception:
             _message = f"Failed to count `{cls.__name__}` objects by '{where}' filter in database!"
@@ -414,16 +719,111 @@ class AsyncReadMixin(BaseMixin):
         return _count
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    async def _async_get_large_estimate(
+        cls,
+        async_session: AsyncSession,
+        where: Union[List[Dict[str, Any]], Dict[str, Any], None],
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> Optional[int]:
+        """Get planner estimate if it reaches `config.db.count_estimate_threshold`.
+        Estimate is best-effort, failures are logged and exact count should be used instead.
+
+        Args:
+            async_session (AsyncSession               , required): SQLAlchemy async_session for database connection.
+            where         (Union[List[Dict[str, Any]],
+                                 Dict[str, Any], None], required): List of filter conditions.
+            warn_mode     (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Returns:
+            Optional[int]: Estimated count, None if it is disabled, not available, failed or below threshold.
+        """
+
+        if config.db.count_estimate_threshold <= 0:
+            return None
+
+        _estimate: Optional[int] = None
+        try:
+            _estimate = await cls.async_estimate_count_by_where(
+                async_session=async_session, where=where, warn_mode=WarnEnum.IGNORE
+            )
+        except Exception as err:
+            _message = f"Failed to estimate count of `{cls.__name__}` objects, falling back to exact count: {err}"
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.warning(_message)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message)
+
+            return None
+
+        if (_estimate is None) or (_estimate < config.db.count_estimate_threshold):
+            return None
+
+        return _estimate
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
+    async def async_estimate_count_by_where(
+        cls,
+        async_session: AsyncSession,
+        where: Union[List[Dict[str, Any]], Dict[str, Any], None] = None,
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> Optional[int]:
+        """Estimate count of ORM objects in database by filter conditions without counting rows.
+        Uses `pg_class.reltuples` without filters and `EXPLAIN` row estimate with filters (PostgreSQL only).
+
+        Args:
+            async_session (AsyncSession               , required): SQLAlchemy async_session for database connection.
+            where         (Union[List[Dict[str, Any]],
+                                 Dict[str, Any], None], optional): List of filter conditions. Defaults to None.
+            warn_mode     (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Raises:
+            Exception: If failed to estimate count of ORM objects in database.
+
+        Returns:
+            Optional[int]: Estimated count of ORM objects, None if estimate is not available.
+        """
+
+        _dialect: Dialect = async_session.get_bind().dialect
+        if _dialect.name != "postgresql":
+            return None
+
+        _estimate: Optional[int] = None
+        try:
+            _stmt, _params = cls._get_estimate_stmt(where=where, dialect=_dialect)
+            # Savepoint, so failed estimate doesn't abort the outer transaction:
+            async with async_session.begin_nested():
+                if isinstance(_stmt, str):
+                    _connection: AsyncConnection = await async_session.connection()
+                    _result: Result = await _connection.exec_driver_sql(_stmt, _params)
+                else:
+                    _result: Result = await async_session.execute(_stmt, _params)
+
+                _estimate = cls._parse_estimate(value=_result.scalar())
+        except Exception:
+            _message = f"Failed to estimate count of `{cls.__name__}` objects by '{where}' filter in database!"
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.error(_message)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message)
+
+            raise
+
+        return _estimate
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_count(
         cls,
         async_session: AsyncSession,
+        approximate: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> int:
-        """Count all ORM objects in database.
+        """Count all ORM objects in database, with `approximate` large tables are estimated by `pg_class.reltuples`.
 
         Args:
             async_session (AsyncSession, required): SQLAlchemy async_session for database connection.
+            approximate   (bool        , optional): Use estimated count for large tables. Defaults to False.
             warn_mode     (WarnEnum    , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
@@ -438,6 +838,7 @@ class AsyncReadMixin(BaseMixin):
             _count: int = await cls.async_count_by_where(
                 async_session=async_session,
                 where=[],
+                approximate=approximate,
                 warn_mode=WarnEnum.IGNORE,
             )
         except Exception:
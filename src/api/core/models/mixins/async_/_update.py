@@ -1,14 +1,16 @@
 # -*- coding: utf-8 -*-
 
-from typing import List, Dict, Union, Any
+from typing import List, Dict, Union, Any, Tuple
 
-from pydantic import validate_call
-from sqlalchemy import Update, update, Result
+from sqlalchemy import Update, update, Result, Select, select, inspect
 from sqlalchemy.orm import DeclarativeBase, declarative_mixin
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import NoResultFound, IntegrityError
+from sqlalchemy.engine import Dialect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.constants import WarnEnum
+from api.core.utils import validate_internal_call
 from api.config import config
 
 if config.db.dialect == "postgresql":
@@ -32,7 +34,7 @@ from ._read import AsyncReadMixin
 
 @declarative_mixin
 class AsyncUpdateMixin(AsyncReadMixin):
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_update(
         self,
         async_session: AsyncSession,
@@ -67,6 +69,9 @@ class AsyncUpdateMixin(AsyncReadMixin):
             for _key, _val in kwargs.items():
                 setattr(self, _key, _val)
 
+            await self.__class__._async_invalidate_cache(
+                async_session=async_session, ids=[self.id]
+            )
             if auto_commit:
                 await async_session.commit()
 
@@ -106,7 +111,7 @@ class AsyncUpdateMixin(AsyncReadMixin):
         return self
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_update_by_id(
         cls,
         async_session: AsyncSession,
@@ -167,6 +172,7 @@ class AsyncUpdateMixin(AsyncReadMixin):
                     _stmt = _stmt.returning(cls)
 
                 _result: Result = await async_session.execute(_stmt)
+                await cls._async_invalidate_cache(async_session=async_session, ids=[id])
                 if returning:
                     _orm_object: Union[cls, None] = _result.scalars().one()
 
@@ -180,7 +186,9 @@ class AsyncUpdateMixin(AsyncReadMixin):
 
                 if not returning:
                     logger.debug(
-                        f"Updated '{_result.rowcount}' row into `{cls.__name__}` ORM table."
+                        "Updated '{}' row into `{}` ORM table.",
+                        _result.rowcount,
+                        cls.__name__,
                     )
 
                     if _result.rowcount == 0:
@@ -224,7 +232,7 @@ class AsyncUpdateMixin(AsyncReadMixin):
         return _orm_object
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_update_by_ids(
         cls,
         async_session: AsyncSession,
@@ -273,6 +281,7 @@ class AsyncUpdateMixin(AsyncReadMixin):
                 _stmt = _stmt.returning(cls)
 
             _result: Result = await async_session.execute(_stmt)
+            await cls._async_invalidate_cache(async_session=async_session, ids=ids)
             if returning:
                 _orm_objects: List[cls] = _result.scalars().all()
 
@@ -286,7 +295,9 @@ class AsyncUpdateMixin(AsyncReadMixin):
 
             if not returning:
                 logger.debug(
-                    f"Updated '{_result.rowcount}' row(s) into `{cls.__name__}` ORM table."
+                    "Updated '{}' row(s) into `{}` ORM table.",
+                    _result.rowcount,
+                    cls.__name__,
                 )
 
                 if _result.rowcount == 0:
@@ -330,7 +341,106 @@ class AsyncUpdateMixin(AsyncReadMixin):
         return _orm_objects
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
+    async def async_bulk_update_by_id(
+        cls,
+        async_session: AsyncSession,
+        raw_data: List[Dict[str, Any]],
+        returning: bool = True,
+        auto_commit: bool = False,
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> List[DeclarativeBase]:
+        """Bulk update rows with different values per row by ID, in batches within
+        `config.db.bulk_max_params` bind parameters.
+
+        Args:
+            async_session (AsyncSession        , required): SQLAlchemy async_session for database connection.
+            raw_data      (List[Dict[str, Any]], required): List of dictionary data with `id` key.
+            returning     (bool                , optional): Return updated (refreshed) ORM objects. Defaults to True.
+            auto_commit   (bool                , optional): Auto commit. Defaults to False.
+            warn_mode     (WarnEnum            , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Raises:
+            EmptyValueError     : If no data provided to update.
+            ValueError          : If `id` key doesn't exist in data.
+            NoResultFound       : If no ORM objects found with IDs in database.
+            NullConstraintError : If null constraint error occurred.
+            UniqueKeyError      : If unique constraint error occurred.
+            ForeignKeyError     : If foreign key constraint error occurred.
+            CheckConstraintError: If check constraint error occurred.
+            Exception           : If failed to bulk update objects into database.
+
+        Returns:
+            List[DeclarativeBase]: List of updated ORM objects.
+        """
+
+        if not raw_data:
+            raise EmptyValueError("No data provided to update!")
+
+        for _data in raw_data:
+            if "id" not in _data:
+                raise ValueError("Not found 'id' key in bulk update data!")
+
+        _ids = [_data["id"] for _data in raw_data]
+        _orm_objects: List[cls] = []
+        try:
+            _orm_objects, _rowcount = await cls._async_update_rows(
+                async_session=async_session, raw_data=raw_data, returning=returning
+            )
+            await cls._async_invalidate_cache(async_session=async_session, ids=_ids)
+
+            logger.debug(
+                "Updated '{}' row(s) into `{}` ORM table.",
+                _rowcount,
+                cls.__name__,
+            )
+            if _rowcount == 0:
+                raise NoResultFound(
+                    f"Not found any `{cls.__name__}` objects to update from database!"
+                )
+
+            if auto_commit:
+                await async_session.commit()
+
+        except Exception as err:
+            if auto_commit:
+                await async_session.rollback()
+
+            if isinstance(err, NoResultFound):
+                raise
+            elif isinstance(err, IntegrityError):
+                if isinstance(err.orig, NotNullViolation):
+                    raise NullConstraintError(
+                        f"`{err.orig.diag.column_name}` cannot be NULL."
+                    )
+                elif isinstance(err.orig, UniqueViolation):
+                    _detail = err.orig.diag.message_detail.replace("Key ", "")
+                    raise UniqueKeyError(_detail)
+                elif isinstance(err.orig, ForeignKeyViolation):
+                    _detail = (
+                        err.orig.diag.message_detail.replace("Key ", "")
+                        .replace('"', "'")
+                        .replace(f"table '{config.db.prefix}", "'")
+                    )
+                    raise ForeignKeyError(_detail)
+                elif isinstance(err.orig, CheckViolation):
+                    _detail = err.orig.diag.message_detail.replace("Key ", "")
+                    raise CheckConstraintError(_detail)
+
+            _message = (
+                f"Failed to bulk update `{cls.__name__}` objects by IDs into database!"
+            )
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.error(_message)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message)
+
+            raise
+
+        return _orm_objects
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_update_objects(
         cls,
         async_session: AsyncSession,
@@ -339,14 +449,18 @@ class AsyncUpdateMixin(AsyncReadMixin):
         warn_mode: WarnEnum = WarnEnum.DEBUG,
         **kwargs,
     ) -> List[DeclarativeBase]:
-        """Update ORM objects into database.
+        """Update ORM objects into database by set-based statements.
+        With `kwargs` the same values are applied by chunked `UPDATE ... WHERE id IN (...)`, otherwise
+        modified column attributes of each object are applied per row (`UPDATE ... FROM (VALUES ...)`)
+        without unit of work flush of the same objects. Updated objects are refreshed from the `RETURNING`
+        rows, or re-selected if database doesn't support `UPDATE ... RETURNING` (e.g. MySQL).
 
         Args:
             async_session (AsyncSession         , required): SQLAlchemy async_session for database connection.
             orm_objects   (List[DeclarativeBase], required): List of ORM objects.
             auto_commit   (bool                 , optional): Auto commit. Defaults to False.
             warn_mode     (WarnEnum             , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
-            **kwargs      (Dict[str, Any]       , required): Dictionary of update data.
+            **kwargs      (Dict[str, Any]       , optional): Dictionary of update data.
 
         Raises:
             EmptyValueError     : If no ORM objects or data provided to update.
@@ -364,16 +478,77 @@ class AsyncUpdateMixin(AsyncReadMixin):
         if not orm_objects:
             raise EmptyValueError("No objects provided to update!")
 
-        if not kwargs:
-            raise EmptyValueError("No data provided to update!")
-
         if "id" in kwargs:
             del kwargs["id"]
 
-        try:
+        _raw_data: List[Dict[str, Any]] = []
+        _changed_objects: List[cls] = []
+        if not kwargs:
+            _column_keys = [
+                _column.key
+                for _column in cls.__mapper__.column_attrs
+                if _column.key != "id"
+            ]
             for _orm_object in orm_objects:
-                for _key, _val in kwargs.items():
-                    setattr(_orm_object, _key, _val)
+                _attrs = inspect(_orm_object).attrs
+                _data = {
+                    _key: _attrs[_key].value
+                    for _key in _column_keys
+                    if _attrs[_key].history.has_changes()
+                }
+                if _data:
+                    _data["id"] = _orm_object.id
+                    _raw_data.append(_data)
+                    _changed_objects.append(_orm_object)
+
+            if not _raw_data:
+                raise EmptyValueError("No data provided to update!")
+
+        _ids = [_orm_object.id for _orm_object in orm_objects]
+        _updated_objects: List[cls] = []
+        try:
+            if kwargs:
+                _dialect: Dialect = async_session.get_bind().dialect
+                # One bind parameter per ID, besides update values:
+                _chunk_size = max(
+                    1, cls._get_bulk_batch_size(num_columns=1) - len(kwargs)
+                )
+                for _i in range(0, len(_ids), _chunk_size):
+                    _chunk_ids = _ids[_i : _i + _chunk_size]
+                    _stmt, _params = cls._get_update_stmt(
+                        where={"column": "id", "op": "in", "value": _chunk_ids},
+                        values=kwargs,
+                        returning=_dialect.update_returning,
+                    )
+                    _result: Result = await async_session.execute(_stmt, _params)
+                    if _dialect.update_returning:
+                        _updated_objects.extend(_result.scalars().all())
+                        continue
+
+                    _stmt: Select = (
+                        select(cls)
+                        .where(cls.id.in_(_chunk_ids))
+                        .execution_options(populate_existing=True)
+                    )
+                    _result: Result = await async_session.execute(_stmt)
+                    _updated_objects.extend(_result.scalars().all())
+            else:
+                # Changed attributes are written by set-based statements, so unit of work
+                # must not flush the same objects (per row) before them:
+                with async_session.no_autoflush:
+                    _updated_objects, _ = await cls._async_update_rows(
+                        async_session=async_session, raw_data=_raw_data, returning=True
+                    )
+
+                for _orm_object, _data in zip(_changed_objects, _raw_data):
+                    for _key, _val in _data.items():
+                        set_committed_value(_orm_object, _key, _val)
+
+            await cls._async_invalidate_cache(async_session=async_session, ids=_ids)
+            if not _updated_objects:
+                raise NoResultFound(
+                    f"Not found any `{cls.__name__}` objects to update from database!"
+                )
 
             if auto_commit:
                 await async_session.commit()
@@ -411,10 +586,82 @@ class AsyncUpdateMixin(AsyncReadMixin):
 
             raise
 
-        return orm_objects
+        _found = {_orm_object.id: _orm_object for _orm_object in _updated_objects}
+        _orm_objects = [
+            _found.get(_orm_object.id, _orm_object) for _orm_object in orm_objects
+        ]
+        return _orm_objects
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    async def _async_update_rows(
+        cls,
+        async_session: AsyncSession,
+        raw_data: List[Dict[str, Any]],
+        returning: bool = True,
+    ) -> Tuple[List[DeclarativeBase], int]:
+        """Update rows with different values per row by ID, grouped by updated columns and batched
+        within `config.db.bulk_max_params`. PostgreSQL uses `UPDATE ... FROM (VALUES ...) RETURNING`,
+        other databases use executemany of `UPDATE ... WHERE id = ?` and one select to refresh objects.
+
+        Args:
+            async_session (AsyncSession        , required): SQLAlchemy async_session for database connection.
+            raw_data      (List[Dict[str, Any]], required): List of dictionary data with `id` key.
+            returning     (bool                , optional): Return updated ORM objects. Defaults to True.
+
+        Returns:
+            Tuple[List[DeclarativeBase], int]: List of updated ORM objects and updated row count as tuple.
+        """
+
+        _groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for _data in raw_data:
+            _columns = tuple(_key for _key in _data.keys() if _key != "id")
+            if _columns:
+                _groups.setdefault(_columns, []).append(_data)
+
+        _dialect: Dialect = async_session.get_bind().dialect
+        _orm_objects: List[cls] = []
+        _rowcount = 0
+        for _columns, _rows in _groups.items():
+            _batch_size = cls._get_bulk_batch_size(num_columns=len(_columns) + 1)
+            for _i in range(0, len(_rows), _batch_size):
+                _batch = _rows[_i : _i + _batch_size]
+                if _dialect.name == "postgresql":
+                    _stmt: Update = cls._get_values_update_stmt(
+                        rows=_batch, columns=list(_columns), returning=returning
+                    )
+                    _result: Result = await async_session.execute(_stmt)
+                    if returning:
+                        _batch_objects = _result.scalars().all()
+                        _orm_objects.extend(_batch_objects)
+                        _rowcount += len(_batch_objects)
+                    else:
+                        _rowcount += _result.rowcount
+
+                    continue
+
+                _stmt: Update = cls._get_rows_update_stmt(columns=list(_columns))
+                _params = [
+                    {
+                        "w_id": _data["id"],
+                        **{f"v_{_key}": _data[_key] for _key in _columns},
+                    }
+                    for _data in _batch
+                ]
+                _result: Result = await async_session.execute(_stmt, _params)
+                _rowcount += _result.rowcount
+                if returning:
+                    _stmt: Select = (
+                        select(cls)
+                        .where(cls.id.in_([_data["id"] for _data in _batch]))
+                        .execution_options(populate_existing=True)
+                    )
+                    _result: Result = await async_session.execute(_stmt)
+                    _orm_objects.extend(_result.scalars().all())
+
+        return _orm_objects, _rowcount
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_update_by_where(
         cls,
         async_session: AsyncSession,
@@ -470,7 +717,7 @@ class AsyncUpdateMixin(AsyncReadMixin):
             if _orm_objects:
                 _orm_objects: List[cls] = await cls.async_update_objects(
                     async_session=async_session,
-                    objects=_orm_objects,
+                    orm_objects=_orm_objects,
                     auto_commit=auto_commit,
                     warn_mode=warn_mode,
                     **kwargs,
@@ -478,13 +725,11 @@ class AsyncUpdateMixin(AsyncReadMixin):
                 _affected_count = len(_orm_objects)
         else:
             try:
-                _stmt: Update = update(cls)
-                _stmt = cls._build_where(stmt=_stmt, where=where)
-                _stmt = _stmt.values(**kwargs)
-                if returning:
-                    _stmt = _stmt.returning(cls)
-
-                _result: Result = await async_session.execute(_stmt)
+                _stmt, _params = cls._get_update_stmt(
+                    where=where, values=kwargs, returning=returning
+                )
+                _result: Result = await async_session.execute(_stmt, _params)
+                await cls._async_invalidate_cache(async_session=async_session)
                 if returning:
                     _orm_objects: List[cls] = _result.scalars().all()
                     _affected_count = len(_orm_objects)
@@ -495,7 +740,9 @@ class AsyncUpdateMixin(AsyncReadMixin):
                 if not returning:
                     _affected_count = _result.rowcount
                     logger.debug(
-                        f"Updated '{_result.rowcount}' row(s) into `{cls.__name__}` ORM table."
+                        "Updated '{}' row(s) into `{}` ORM table.",
+                        _result.rowcount,
+                        cls.__name__,
                     )
 
             except Exception as err:
@@ -537,7 +784,7 @@ class AsyncUpdateMixin(AsyncReadMixin):
         return _orm_objects
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     async def async_update_all(
         cls,
         async_session: AsyncSession,
@@ -571,12 +818,15 @@ class AsyncUpdateMixin(AsyncReadMixin):
         try:
             _stmt: Update = update(cls).values(**kwargs)
             _result: Result = await async_session.execute(_stmt)
+            await cls._async_invalidate_cache(async_session=async_session)
 
             if auto_commit:
                 await async_session.commit()
 
             logger.debug(
-                f"Updated '{_result.rowcount}' row(s) into `{cls.__name__}` ORM table."
+                "Updated '{}' row(s) into `{}` ORM table.",
+                _result.rowcount,
+                cls.__name__,
             )
         except Exception as err:
             if auto_commit:
@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict, Union, List
+from typing import Any, Dict, Union, List, Literal, Optional
 
-from pydantic import validate_call
 from sqlalchemy import Result
 from sqlalchemy.orm import DeclarativeBase, declarative_mixin, Session
 from sqlalchemy.exc import IntegrityError
 
 from api.core.constants import WarnEnum
+from api.core.utils import validate_internal_call
 from api.config import config
 
 if config.db.dialect == "postgresql":
@@ -38,7 +38,7 @@ from ._update import UpdateMixin
 @declarative_mixin
 class CreateMixin(UpdateMixin):
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def insert(
         cls,
         session: Session,
@@ -137,7 +137,7 @@ class CreateMixin(UpdateMixin):
 
         return _orm_object
 
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def save(
         self,
         session: Session,
@@ -222,7 +222,7 @@ class CreateMixin(UpdateMixin):
         return self
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def upsert(
         cls,
         session: Session,
@@ -345,26 +345,32 @@ class CreateMixin(UpdateMixin):
         return _orm_object
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def bulk_insert(
         cls,
         session: Session,
         raw_data: List[Dict[str, Any]],
         returning: bool = True,
+        id_source: Literal["client", "server"] = "client",
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> List[DeclarativeBase]:
         """Bulk insert data into database.
+        With `server` ID source rows without `id` are inserted without it, so the database fills it
+        (`fn_tr__generate_pk` trigger or column default) and IDs come back by `RETURNING`,
+        order of returned objects is not guaranteed.
 
         Args:
-            session     (Session             , required): SQLAlchemy session for database connection.
-            raw_data    (List[Dict[str, Any]], required): List of dictionary object data.
-            returning   (bool                , optional): Return inserted ORM objects from database. Defaults to True.
-            auto_commit (bool                , optional): Auto commit. Defaults to False.
-            warn_mode   (WarnEnum            , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+            session     (Session                    , required): SQLAlchemy session for database connection.
+            raw_data    (List[Dict[str, Any]]       , required): List of dictionary object data.
+            returning   (bool                       , optional): Return inserted ORM objects from database. Defaults to True.
+            id_source   (Literal["client", "server"], optional): Generator of missing IDs. Defaults to "client".
+            auto_commit (bool                       , optional): Auto commit. Defaults to False.
+            warn_mode   (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
             EmptyValueError     : If no data provided to bulk insert.
+            ValueError          : If `server` ID source is used without database ID generation.
             NullConstraintError : If null constraint error occurred.
             PrimaryKeyError     : If ID (PK) already exists in database.
             UniqueKeyError      : If unique constraint error occurred.
@@ -379,9 +385,24 @@ class CreateMixin(UpdateMixin):
         if not raw_data:
             raise EmptyValueError("No data provided to bulk insert!")
 
-        for _data in raw_data:
-            if "id" not in _data:
-                _data["id"] = cls.gen_unique_id()
+        _no_id_data = [_data for _data in raw_data if "id" not in _data]
+        _batches = [raw_data]
+        if id_source == "server":
+            if not cls._has_server_id():
+                raise ValueError(
+                    f"`{cls.__name__}` IDs are not generated by database, use `client` ID source!"
+                )
+
+            # Executemany needs the same keys for all rows:
+            if _no_id_data and (len(_no_id_data) < len(raw_data)):
+                _batches = [
+                    [_data for _data in raw_data if "id" in _data],
+                    _no_id_data,
+                ]
+        elif _no_id_data:
+            _ids = cls.gen_unique_ids(count=len(_no_id_data))
+            for _data, _id in zip(_no_id_data, _ids):
+                _data["id"] = _id
 
         _orm_objects: List[cls] = []
         try:
@@ -389,9 +410,10 @@ class CreateMixin(UpdateMixin):
             if returning:
                 _stmt = _stmt.returning(cls)
 
-            _result: Result = session.execute(_stmt, raw_data)
-            if returning:
-                _orm_objects: List[cls] = _result.scalars().all()
+            for _batch in _batches:
+                _result: Result = session.execute(_stmt, _batch)
+                if returning:
+                    _orm_objects.extend(_result.scalars().all())
 
             if auto_commit:
                 session.commit()
@@ -435,5 +457,127 @@ class CreateMixin(UpdateMixin):
 
         return _orm_objects
 
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
+    def bulk_upsert(
+        cls,
+        session: Session,
+        raw_data: List[Dict[str, Any]],
+        conflict_columns: Optional[List[str]] = None,
+        constraint: Optional[str] = None,
+        update_columns: Optional[List[str]] = None,
+        returning: bool = True,
+        auto_commit: bool = False,
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> List[DeclarativeBase]:
+        """Bulk upsert data into database, in batches within `config.db.bulk_max_params` bind parameters.
+
+        Args:
+            session          (Session             , required): SQLAlchemy session for database connection.
+            raw_data         (List[Dict[str, Any]], required): List of dictionary object data, all with the same columns.
+            conflict_columns (Optional[List[str]] , optional): Conflict target columns. Defaults to None (["id"]).
+            constraint       (Optional[str]       , optional): Conflict target constraint name (PostgreSQL only). Defaults to None.
+            update_columns   (Optional[List[str]] , optional): Whitelist of columns to update on conflict, None means all. Defaults to None.
+            returning        (bool                , optional): Return upserted ORM objects from database, selected by conflict target on MySQL and MariaDB. Defaults to True.
+            auto_commit      (bool                , optional): Auto commit. Defaults to False.
+            warn_mode        (WarnEnum            , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Raises:
+            EmptyValueError     : If no data provided to bulk upsert.
+            ValueError          : If data rows have different columns.
+            NullConstraintError : If null constraint error occurred.
+            UniqueKeyError      : If unique constraint error occurred.
+            ForeignKeyError     : If foreign key constraint error occurred.
+            CheckConstraintError: If check constraint error occurred.
+            Exception           : If failed to bulk upsert objects into database.
+
+        Returns:
+            List[DeclarativeBase]: List of upserted ORM objects.
+        """
+
+        if not raw_data:
+            raise EmptyValueError("No data provided to bulk upsert!")
+
+        _no_id_data = [_data for _data in raw_data if "id" not in _data]
+        if _no_id_data:
+            _ids = cls.gen_unique_ids(count=len(_no_id_data))
+            for _data, _id in zip(_no_id_data, _ids):
+                _data["id"] = _id
+
+        _columns = list(raw_data[0].keys())
+        for _data in raw_data:
+            if (len(_data) != len(_columns)) or any(
+                _column not in _data for _column in _columns
+            ):
+                raise ValueError("All rows must have the same columns to bulk upsert!")
+
+        _dialect_name: str = session.get_bind().dialect.name
+        _orm_objects: List[cls] = []
+        try:
+            _stmt: Insert = cls._get_upsert_stmt(
+                columns=_columns,
+                conflict_columns=conflict_columns,
+                constraint=constraint,
+                update_columns=update_columns,
+                returning=returning,
+                dialect=_dialect_name,
+            )
+            _batch_size = cls._get_bulk_batch_size(num_columns=len(_columns))
+            # MySQL and MariaDB upserted rows are selected after each batch:
+            _is_returning = _dialect_name in ("postgresql", "sqlite")
+            for _i in range(0, len(raw_data), _batch_size):
+                _batch_data = raw_data[_i : _i + _batch_size]
+                _result: Result = session.execute(
+                    _stmt, _batch_data, execution_options={"populate_existing": True}
+                )
+                if returning and _is_returning:
+                    _orm_objects.extend(_result.scalars().all())
+                elif returning:
+                    _select_stmt, _params = cls._get_upserted_stmt(
+                        raw_data=_batch_data, conflict_columns=conflict_columns
+                    )
+                    _result: Result = session.execute(
+                        _select_stmt,
+                        _params,
+                        execution_options={"populate_existing": True},
+                    )
+                    _orm_objects.extend(_result.scalars().all())
+
+            if auto_commit:
+                session.commit()
+
+        except Exception as err:
+            if auto_commit:
+                session.rollback()
+
+            if isinstance(err, IntegrityError):
+                if isinstance(err.orig, NotNullViolation):
+                    raise NullConstraintError(
+                        f"`{err.orig.diag.column_name}` cannot be NULL."
+                    )
+                elif isinstance(err.orig, UniqueViolation):
+                    _detail = err.orig.diag.message_detail.replace("Key ", "")
+                    raise UniqueKeyError(_detail)
+                elif isinstance(err.orig, ForeignKeyViolation):
+                    _detail = (
+                        err.orig.diag.message_detail.replace("Key ", "")
+                        .replace('"', "'")
+                        .replace(f"table '{config.db.prefix}", "'")
+                    )
+                    raise ForeignKeyError(_detail)
+                elif isinstance(err.orig, CheckViolation):
+                    _detail = err.orig.diag.message_detail.replace("Key ", "")
+                    raise CheckConstraintError(_detail)
+
+            _message = f"Failed to bulk upsert `{cls.__name__}` objects into database!"
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.error(_message)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message)
+
+            raise
+
+        return _orm_objects
+
 
 __all__ = ["CreateMixin"]
@@ -2,7 +2,6 @@
 
 from typing import List, Dict, Union, Any
 
-from pydantic import validate_call
 from sqlalchemy import Delete, delete, Result
 from sqlalchemy.orm import DeclarativeBase, declarative_mixin, Session
 from sqlalchemy.exc import NoResultFound
@@ -13,6 +12,7 @@ from api.config import config
 if config.db.dialect == "postgresql":
     from psycopg.errors import ForeignKeyViolation
 from api.core.exceptions import EmptyValueError, ForeignKeyError
+from api.core.utils import validate_internal_call
 from api.logger import logger
 
 from ._read import ReadMixin
@@ -20,7 +20,7 @@ from ._read import ReadMixin
 
 @declarative_mixin
 class DeleteMixin(ReadMixin):
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def delete(
         self,
         session: Session,
@@ -70,7 +70,7 @@ class DeleteMixin(ReadMixin):
         return
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def delete_by_id(
         cls,
         session: Session,
@@ -108,7 +108,9 @@ class DeleteMixin(ReadMixin):
                     session.commit()
 
                 logger.debug(
-                    f"Deleted '{_result.rowcount}' row from `{cls.__name__}` ORM table."
+                    "Deleted '{}' row from `{}` ORM table.",
+                    _result.rowcount,
+                    cls.__name__,
                 )
 
                 if _result.rowcount == 0:
@@ -143,7 +145,7 @@ class DeleteMixin(ReadMixin):
         return
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def delete_by_ids(
         cls,
         session: Session,
@@ -176,7 +178,9 @@ class DeleteMixin(ReadMixin):
                 session.commit()
 
             logger.debug(
-                f"Deleted '{_result.rowcount}' row(s) from `{cls.__name__}` ORM table."
+                "Deleted '{}' row(s) from `{}` ORM table.",
+                _result.rowcount,
+                cls.__name__,
             )
 
             if _result.rowcount == 0:
@@ -209,7 +213,7 @@ class DeleteMixin(ReadMixin):
         return
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def delete_objects(
         cls,
         session: Session,
@@ -266,7 +270,7 @@ class DeleteMixin(ReadMixin):
         return
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def delete_by_where(
         cls,
         session: Session,
@@ -312,15 +316,16 @@ class DeleteMixin(ReadMixin):
                 )
         else:
             try:
-                _stmt: Delete = delete(cls)
-                _stmt = cls._build_where_stmt(stmt=_stmt, where=where)
-                _result: Result = session.execute(_stmt)
+                _stmt, _params = cls._get_delete_stmt(where=where)
+                _result: Result = session.execute(_stmt, _params)
 
                 if auto_commit:
                     session.commit()
 
                 logger.debug(
-                    f"Deleted '{_result.rowcount}' row(s) from `{cls.__name__}` ORM table."
+                    "Deleted '{}' row(s) from `{}` ORM table.",
+                    _result.rowcount,
+                    cls.__name__,
                 )
 
                 if (not allow_no_result) and (_result.rowcount == 0):
@@ -353,7 +358,7 @@ class DeleteMixin(ReadMixin):
         return
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def delete_all(
         cls,
         session: Session,
@@ -379,7 +384,9 @@ class DeleteMixin(ReadMixin):
                 session.commit()
 
             logger.debug(
-                f"Deleted '{_result.rowcount}' row(s) from `{cls.__name__}` ORM table."
+                "Deleted '{}' row(s) from `{}` ORM table.",
+                _result.rowcount,
+                cls.__name__,
             )
         except Exception as err:
             if auto_commit:
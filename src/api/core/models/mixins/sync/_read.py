@@ -1,23 +1,24 @@
 # -*- coding: utf-8 -*-
 
-from typing import Union, List, Dict, Any, Optional
+from typing import Union, List, Dict, Any, Optional, Tuple
 
-from pydantic import validate_call
 from sqlalchemy import Select, select, Result, func
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.engine import Dialect, Connection
 from sqlalchemy.orm import DeclarativeBase, declarative_mixin, Session
 
 from api.core.constants import WarnEnum
 from api.config import config
-from api.core.exceptions import EmptyValueError
+from api.core.exceptions import EmptyValueError, CursorError
 from api.core.models.mixins import BaseMixin
+from api.core.utils import validate_internal_call
 from api.logger import logger
 
 
 @declarative_mixin
 class ReadMixin(BaseMixin):
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def select_by_where(
         cls,
         session: Session,
@@ -28,6 +29,7 @@ class ReadMixin(BaseMixin):
         is_desc: bool = True,
         joins: Optional[List[str]] = None,
         disable_limit: bool = False,
+        cursor: Optional[str] = None,
         allow_no_result: bool = True,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> List[DeclarativeBase]:
@@ -43,10 +45,12 @@ class ReadMixin(BaseMixin):
             is_desc         (bool                       , optional): Is sort descending or ascending. Defaults to True.
             joins           (Optional[List[str]]        , optional): List of joinable relationships. Defaults to None.
             disable_limit   (bool                       , optional): Disable select limit. Defaults to False.
+            cursor          (Optional[str]              , optional): Keyset pagination cursor, `offset` is ignored. Defaults to None.
             allow_no_result (bool                       , optional): Allow no result. Defaults to True.
             warn_mode       (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
+            CursorError  : If `cursor` is invalid or doesn't match current sort order.
             NoResultFound: If no result found and `allow_no_result` is False.
             Exception    : If failed to get ORM objects from database by where filter conditions.
 
@@ -56,7 +60,7 @@ class ReadMixin(BaseMixin):
 
         _orm_objects: List[cls] = []
         try:
-            _stmt: Select = cls._build_select(
+            _stmt, _params = cls._get_select_stmt(
                 where=where,
                 offset=offset,
                 limit=limit,
@@ -64,13 +68,16 @@ class ReadMixin(BaseMixin):
                 is_desc=is_desc,
                 joins=joins,
                 disable_limit=disable_limit,
+                cursor=cursor,
             )
 
-            _result: Result = session.execute(_stmt)
+            _result: Result = session.execute(_stmt, _params)
             if joins:
                 _result = _result.unique()
 
             _orm_objects: List[cls] = _result.scalars().all()
+        except CursorError:
+            raise
         except Exception:
             _message = f"Failed to get `{cls.__name__}` objects from database by filtering with '{where}'!"
             if warn_mode == WarnEnum.ALWAYS:
@@ -88,7 +95,110 @@ class ReadMixin(BaseMixin):
         return _orm_objects
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
+    def select_with_count_by_where(
+        cls,
+        session: Session,
+        where: Union[List[Dict[str, Any]], Dict[str, Any]],
+        offset: int = 0,
+        limit: int = config.db.select_limit,
+        order_by: Union[List[str], str, None] = None,
+        is_desc: bool = True,
+        joins: Optional[List[str]] = None,
+        disable_limit: bool = False,
+        cursor: Optional[str] = None,
+        estimate_count: bool = False,
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> Tuple[List[DeclarativeBase], int, bool]:
+        """Select ORM objects and count of all filtered objects in one statement.
+        With `estimate_count`, planner estimate above `config.db.count_estimate_threshold`
+        is returned instead of exact count.
+
+        Args:
+            session         (Session                    , required): SQLAlchemy session for database connection.
+            where           (Union[List[Dict[str, Any]],
+                                   Dict[str, Any]]      , required): List of filter conditions.
+            offset          (int                        , optional): Number of objects to skip. Defaults to 0.
+            limit           (int                        , optional): Number of objects to limit. Defaults to `config.db.select_limit`.
+            order_by        (Union[List[str], str, None], optional): List of order by columns. Defaults to None.
+            is_desc         (bool                       , optional): Is sort descending or ascending. Defaults to True.
+            joins           (Optional[List[str]]        , optional): List of joinable relationships. Defaults to None.
+            disable_limit   (bool                       , optional): Disable select limit. Defaults to False.
+            cursor          (Optional[str]              , optional): Keyset pagination cursor, `offset` is ignored. Defaults to None.
+            estimate_count  (bool                       , optional): Use estimated count for large results. Defaults to False.
+            warn_mode       (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Raises:
+            CursorError: If `cursor` is invalid or doesn't match current sort order.
+            Exception  : If failed to get ORM objects from database by where filter conditions.
+
+        Returns:
+            Tuple[List[DeclarativeBase], int, bool]: List of ORM objects, count of all objects and is count estimated as tuple.
+        """
+
+        if estimate_count:
+            _estimate: Optional[int] = cls._get_large_estimate(
+                session=session, where=where, warn_mode=warn_mode
+            )
+            if _estimate is not None:
+                _orm_objects: List[cls] = cls.select_by_where(
+                    session=session,
+                    where=where,
+                    offset=offset,
+                    limit=limit,
+                    order_by=order_by,
+                    is_desc=is_desc,
+                    joins=joins,
+                    disable_limit=disable_limit,
+                    cursor=cursor,
+                    warn_mode=warn_mode,
+                )
+                return _orm_objects, _estimate, True
+
+        _orm_objects: List[cls] = []
+        _all_count = 0
+        try:
+            _stmt, _params = cls._get_select_stmt(
+                where=where,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                is_desc=is_desc,
+                joins=joins,
+                disable_limit=disable_limit,
+                cursor=cursor,
+                with_count=True,
+            )
+
+            _result: Result = session.execute(_stmt, _params)
+            if joins:
+                _result = _result.unique()
+
+            _rows = _result.all()
+            _orm_objects: List[cls] = [_row[0] for _row in _rows]
+            if _rows:
+                _all_count: int = _rows[0][1]
+        except CursorError:
+            raise
+        except Exception:
+            _message = f"Failed to get `{cls.__name__}` objects with count from database by filtering with '{where}'!"
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.error(_message)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message)
+
+            raise
+
+        # Empty page (out of range offset or cursor) doesn't carry the count:
+        if (not _orm_objects) and ((0 < offset) or cursor):
+            _all_count: int = cls.count_by_where(
+                session=session, where=where, warn_mode=warn_mode
+            )
+
+        return _orm_objects, _all_count, False
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def select(
         cls,
         session: Session,
@@ -143,7 +253,7 @@ class ReadMixin(BaseMixin):
         return _orm_objects
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def get(
         cls,
         session: Session,
@@ -189,7 +299,7 @@ class ReadMixin(BaseMixin):
         return _orm_object
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def get_by_where(
         cls,
         session: Session,
@@ -243,7 +353,7 @@ class ReadMixin(BaseMixin):
         return _orm_object
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def get_by_ids(
         cls, session: Session, ids: List[str], warn_mode: WarnEnum = WarnEnum.DEBUG
     ) -> List[DeclarativeBase]:
@@ -291,7 +401,7 @@ class ReadMixin(BaseMixin):
         return _orm_objects
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def exists_by_id(
         cls, session: Session, id: str, warn_mode: WarnEnum = WarnEnum.DEBUG
     ) -> bool:
@@ -327,7 +437,7 @@ class ReadMixin(BaseMixin):
 
         return _is_exists
 
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def exists(self, session: Session, warn_mode: WarnEnum = WarnEnum.DEBUG) -> bool:
         """Check if ORM object exists in database.
 
@@ -361,20 +471,25 @@ class ReadMixin(BaseMixin):
         return _is_exists
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def count_by_where(
         cls,
         session: Session,
         where: Union[List[Dict[str, Any]], Dict[str, Any]],
+        approximate: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> int:
         """Count ORM objects in database by filter conditions.
+        With `approximate`, planner estimate (see `estimate_count_by_where()`) above
+        `config.db.count_estimate_threshold` is returned instead of exact count, otherwise
+        (small, non-PostgreSQL, never analyzed table or failed estimate) rows are counted.
 
         Args:
-            session   (Session                    , required): SQLAlchemy session for database connection.
-            where     (Union[List[Dict[str, Any]],
-                             Dict[str, Any]]      , required): List of filter conditions.
-            warn_mode (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+            session     (Session                    , required): SQLAlchemy session for database connection.
+            where       (Union[List[Dict[str, Any]],
+                               Dict[str, Any]]      , required): List of filter conditions.
+            approximate (bool                       , optional): Use estimated count for large results. Defaults to False.
+            warn_mode   (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
             Exception: If failed to count ORM objects in database by filter conditions.
@@ -383,13 +498,17 @@ class ReadMixin(BaseMixin):
             int: Count of ORM objects in database.
         """
 
+        if approximate:
+            _estimate: Optional[int] = cls._get_large_estimate(
+                session=session, where=where, warn_mode=warn_mode
+            )
+            if _estimate is not None:
+                return _estimate
+
         _count = 0
         try:
-            _stmt: Select = select(func.count()).select_from(cls)
-            if where:
-                _stmt: Select = cls._build_where(stmt=_stmt, where=where)
-
-            _result: Result = session.execute(_stmt)
+            _stmt, _params = cls._get_count_stmt(where=where)
+            _result: Result = session.execute(_stmt, _params)
             _count: int = _result.scalar()
         except Exception:
             _message = f"Failed to count `{cls.__name__}` objects by '{where}' filter in database!"
@@ -403,13 +522,112 @@ class ReadMixin(BaseMixin):
         return _count
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
-    def count(cls, session: Session, warn_mode: WarnEnum = WarnEnum.DEBUG) -> int:
-        """Count all ORM objects in database.
+    def _get_large_estimate(
+        cls,
+        session: Session,
+        where: Union[List[Dict[str, Any]], Dict[str, Any], None],
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> Optional[int]:
+        """Get planner estimate if it reaches `config.db.count_estimate_threshold`.
+        Estimate is best-effort, failures are logged and exact count should be used instead.
 
         Args:
-            session   (Session , required): SQLAlchemy session for database connection.
-            warn_mode (WarnEnum, optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+            session       (Session                    , required): SQLAlchemy session for database connection.
+            where         (Union[List[Dict[str, Any]],
+                                 Dict[str, Any], None], required): List of filter conditions.
+            warn_mode     (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Returns:
+            Optional[int]: Estimated count, None if it is disabled, not available, failed or below threshold.
+        """
+
+        if config.db.count_estimate_threshold <= 0:
+            return None
+
+        _estimate: Optional[int] = None
+        try:
+            _estimate = cls.estimate_count_by_where(
+                session=session, where=where, warn_mode=WarnEnum.IGNORE
+            )
+        except Exception as err:
+            _message = f"Failed to estimate count of `{cls.__name__}` objects, falling back to exact count: {err}"
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.warning(_message)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message)
+
+            return None
+
+        if (_estimate is None) or (_estimate < config.db.count_estimate_threshold):
+            return None
+
+        return _estimate
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
+    def estimate_count_by_where(
+        cls,
+        session: Session,
+        where: Union[List[Dict[str, Any]], Dict[str, Any], None] = None,
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> Optional[int]:
+        """Estimate count of ORM objects in database by filter conditions without counting rows.
+        Uses `pg_class.reltuples` without filters and `EXPLAIN` row estimate with filters (PostgreSQL only).
+
+        Args:
+            session       (Session                    , required): SQLAlchemy session for database connection.
+            where         (Union[List[Dict[str, Any]],
+                                 Dict[str, Any], None], optional): List of filter conditions. Defaults to None.
+            warn_mode     (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Raises:
+            Exception: If failed to estimate count of ORM objects in database.
+
+        Returns:
+            Optional[int]: Estimated count of ORM objects, None if estimate is not available.
+        """
+
+        _dialect: Dialect = session.get_bind().dialect
+        if _dialect.name != "postgresql":
+            return None
+
+        _estimate: Optional[int] = None
+        try:
+            _stmt, _params = cls._get_estimate_stmt(where=where, dialect=_dialect)
+            # Savepoint, so failed estimate doesn't abort the outer transaction:
+            with session.begin_nested():
+                if isinstance(_stmt, str):
+                    _connection: Connection = session.connection()
+                    _result: Result = _connection.exec_driver_sql(_stmt, _params)
+                else:
+                    _result: Result = session.execute(_stmt, _params)
+
+                _estimate = cls._parse_estimate(value=_result.scalar())
+        except Exception:
+            _message = f"Failed to estimate count of `{cls.__name__}` objects by '{where}' filter in database!"
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.error(_message)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message)
+
+            raise
+
+        return _estimate
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
+    def count(
+        cls,
+        session: Session,
+        approximate: bool = False,
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> int:
+        """Count all ORM objects in database, with `approximate` large tables are estimated by `pg_class.reltuples`.
+
+        Args:
+            session     (Session , required): SQLAlchemy session for database connection.
+            approximate (bool    , optional): Use estimated count for large tables. Defaults to False.
+            warn_mode   (WarnEnum, optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
             Exception: If failed to count ORM objects in database.
@@ -423,6 +641,7 @@ class ReadMixin(BaseMixin):
             _count: int = cls.count_by_where(
                 session=session,
                 where=[],
+                approximate=approximate,
                 warn_mode=WarnEnum.IGNORE,
             )
         except Exception:
@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
 
-from typing import List, Dict, Union, Any
+from typing import List, Dict, Union, Any, Tuple
 
-from pydantic import validate_call
-from sqlalchemy import Update, update, Result
+from sqlalchemy import Update, update, Result, Select, select
 from sqlalchemy.orm import DeclarativeBase, declarative_mixin, Session
 from sqlalchemy.exc import NoResultFound, IntegrityError
+from sqlalchemy.engine import Dialect
 
 from api.core.constants import WarnEnum
+from api.core.utils import validate_internal_call
 from api.config import config
 
 if config.db.dialect == "postgresql":
@@ -31,7 +32,7 @@ from ._read import ReadMixin
 
 @declarative_mixin
 class UpdateMixin(ReadMixin):
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def update(
         self,
         session: Session,
@@ -105,7 +106,7 @@ class UpdateMixin(ReadMixin):
         return self
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def update_by_id(
         cls,
         session: Session,
@@ -179,7 +180,9 @@ class UpdateMixin(ReadMixin):
 
                 if not returning:
                     logger.debug(
-                        f"Updated '{_result.rowcount}' row into `{cls.__name__}` ORM table."
+                        "Updated '{}' row into `{}` ORM table.",
+                        _result.rowcount,
+                        cls.__name__,
                     )
 
                     if _result.rowcount == 0:
@@ -223,7 +226,7 @@ class UpdateMixin(ReadMixin):
         return _orm_object
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def update_by_ids(
         cls,
         session: Session,
@@ -285,7 +288,9 @@ class UpdateMixin(ReadMixin):
 
             if not returning:
                 logger.debug(
-                    f"Updated '{_result.rowcount}' row(s) into `{cls.__name__}` ORM table."
+                    "Updated '{}' row(s) into `{}` ORM table.",
+                    _result.rowcount,
+                    cls.__name__,
                 )
 
                 if _result.rowcount == 0:
@@ -329,7 +334,104 @@ class UpdateMixin(ReadMixin):
         return _orm_objects
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
+    def bulk_update_by_id(
+        cls,
+        session: Session,
+        raw_data: List[Dict[str, Any]],
+        returning: bool = True,
+        auto_commit: bool = False,
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> List[DeclarativeBase]:
+        """Bulk update rows with different values per row by ID, in batches within
+        `config.db.bulk_max_params` bind parameters.
+
+        Args:
+            session       (Session             , required): SQLAlchemy session for database connection.
+            raw_data      (List[Dict[str, Any]], required): List of dictionary data with `id` key.
+            returning     (bool                , optional): Return updated (refreshed) ORM objects. Defaults to True.
+            auto_commit   (bool                , optional): Auto commit. Defaults to False.
+            warn_mode     (WarnEnum            , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Raises:
+            EmptyValueError     : If no data provided to update.
+            ValueError          : If `id` key doesn't exist in data.
+            NoResultFound       : If no ORM objects found with IDs in database.
+            NullConstraintError : If null constraint error occurred.
+            UniqueKeyError      : If unique constraint error occurred.
+            ForeignKeyError     : If foreign key constraint error occurred.
+            CheckConstraintError: If check constraint error occurred.
+            Exception           : If failed to bulk update objects into database.
+
+        Returns:
+            List[DeclarativeBase]: List of updated ORM objects.
+        """
+
+        if not raw_data:
+            raise EmptyValueError("No data provided to update!")
+
+        for _data in raw_data:
+            if "id" not in _data:
+                raise ValueError("Not found 'id' key in bulk update data!")
+
+        _orm_objects: List[cls] = []
+        try:
+            _orm_objects, _rowcount = cls._update_rows(
+                session=session, raw_data=raw_data, returning=returning
+            )
+
+            logger.debug(
+                "Updated '{}' row(s) into `{}` ORM table.",
+                _rowcount,
+                cls.__name__,
+            )
+            if _rowcount == 0:
+                raise NoResultFound(
+                    f"Not found any `{cls.__name__}` objects to update from database!"
+                )
+
+            if auto_commit:
+                session.commit()
+
+        except Exception as err:
+            if auto_commit:
+                session.rollback()
+
+            if isinstance(err, NoResultFound):
+                raise
+            elif isinstance(err, IntegrityError):
+                if isinstance(err.orig, NotNullViolation):
+                    raise NullConstraintError(
+                        f"`{err.orig.diag.column_name}` cannot be NULL."
+                    )
+                elif isinstance(err.orig, UniqueViolation):
+                    _detail = err.orig.diag.message_detail.replace("Key ", "")
+                    raise UniqueKeyError(_detail)
+                elif isinstance(err.orig, ForeignKeyViolation):
+                    _detail = (
+                        err.orig.diag.message_detail.replace("Key ", "")
+                        .replace('"', "'")
+                        .replace(f"table '{config.db.prefix}", "'")
+                    )
+                    raise ForeignKeyError(_detail)
+                elif isinstance(err.orig, CheckViolation):
+                    _detail = err.orig.diag.message_detail.replace("Key ", "")
+                    raise CheckConstraintError(_detail)
+
+            _message = (
+                f"Failed to bulk update `{cls.__name__}` objects by IDs into database!"
+            )
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.error(_message)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message)
+
+            raise
+
+        return _orm_objects
+
+    @classmethod
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def update_objects(
         cls,
         session: Session,
@@ -413,7 +515,7 @@ class UpdateMixin(ReadMixin):
         return orm_objects
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def update_by_where(
         cls,
         session: Session,
@@ -469,7 +571,7 @@ class UpdateMixin(ReadMixin):
             if _orm_objects:
                 _orm_objects: List[cls] = cls.update_objects(
                     session=session,
-                    objects=_orm_objects,
+                    orm_objects=_orm_objects,
                     auto_commit=auto_commit,
                     warn_mode=warn_mode,
                     **kwargs,
@@ -477,13 +579,10 @@ class UpdateMixin(ReadMixin):
                 _affected_count = len(_orm_objects)
         else:
             try:
-                _stmt: Update = update(cls)
-                _stmt = cls._build_where(stmt=_stmt, where=where)
-                _stmt = _stmt.values(**kwargs)
-                if returning:
-                    _stmt = _stmt.returning(cls)
-
-                _result: Result = session.execute(_stmt)
+                _stmt, _params = cls._get_update_stmt(
+                    where=where, values=kwargs, returning=returning
+                )
+                _result: Result = session.execute(_stmt, _params)
                 if returning:
                     _orm_objects: List[cls] = _result.scalars().all()
                     _affected_count = len(_orm_objects)
@@ -494,7 +593,9 @@ class UpdateMixin(ReadMixin):
                 if not returning:
                     _affected_count = _result.rowcount
                     logger.debug(
-                        f"Updated '{_result.rowcount}' row(s) into `{cls.__name__}` ORM table."
+                        "Updated '{}' row(s) into `{}` ORM table.",
+                        _result.rowcount,
+                        cls.__name__,
                     )
 
             except Exception as err:
@@ -536,7 +637,7 @@ class UpdateMixin(ReadMixin):
         return _orm_objects
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
+    @validate_internal_call(config={"arbitrary_types_allowed": True})
     def update_all(
         cls,
         session: Session,
@@ -575,7 +676,9 @@ class UpdateMixin(ReadMixin):
                 session.commit()
 
             logger.debug(
-                f"Updated '{_result.rowcount}' row(s) into `{cls.__name__}` ORM table."
+                "Updated '{}' row(s) into `{}` ORM table.",
+                _result.rowcount,
+                cls.__name__,
             )
         except Exception as err:
             if auto_commit:
@@ -610,5 +713,73 @@ class UpdateMixin(ReadMixin):
 
         return
 
+    @classmethod
+    def _update_rows(
+        cls,
+        session: Session,
+        raw_data: List[Dict[str, Any]],
+        returning: bool = True,
+    ) -> Tuple[List[DeclarativeBase], int]:
+        """Update rows with different values per row by ID, grouped by updated columns and batched
+        within `config.db.bulk_max_params`. PostgreSQL uses `UPDATE ... FROM (VALUES ...) RETURNING`,
+        other databases use executemany of `UPDATE ... WHERE id = ?` and one select to refresh objects.
+
+        Args:
+            session       (Session             , required): SQLAlchemy session for database connection.
+            raw_data      (List[Dict[str, Any]], required): List of dictionary data with `id` key.
+            returning     (bool                , optional): Return updated ORM objects. Defaults to True.
+
+        Returns:
+            Tuple[List[DeclarativeBase], int]: List of updated ORM objects and updated row count as tuple.
+        """
+
+        _groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for _data in raw_data:
+            _columns = tuple(_key for _key in _data.keys() if _key != "id")
+            if _columns:
+                _groups.setdefault(_columns, []).append(_data)
+
+        _dialect: Dialect = session.get_bind().dialect
+        _orm_objects: List[cls] = []
+        _rowcount = 0
+        for _columns, _rows in _groups.items():
+            _batch_size = cls._get_bulk_batch_size(num_columns=len(_columns) + 1)
+            for _i in range(0, len(_rows), _batch_size):
+                _batch = _rows[_i : _i + _batch_size]
+                if _dialect.name == "postgresql":
+                    _stmt: Update = cls._get_values_update_stmt(
+                        rows=_batch, columns=list(_columns), returning=returning
+                    )
+                    _result: Result = session.execute(_stmt)
+                    if returning:
+                        _batch_objects = _result.scalars().all()
+                        _orm_objects.extend(_batch_objects)
+                        _rowcount += len(_batch_objects)
+                    else:
+                        _rowcount += _result.rowcount
+
+                    continue
+
+                _stmt: Update = cls._get_rows_update_stmt(columns=list(_columns))
+                _params = [
+                    {
+                        "w_id": _data["id"],
+                        **{f"v_{_key}": _data[_key] for _key in _columns},
+                    }
+                    for _data in _batch
+                ]
+                _result: Result = session.execute(_stmt, _params)
+                _rowcount += _result.rowcount
+                if returning:
+                    _stmt: Select = (
+                        select(cls)
+                        .where(cls.id.in_([_data["id"] for _data in _batch]))
+                        .execution_options(populate_existing=True)
+                    )
+                    _result: Result = session.execute(_stmt)
+                    _orm_objects.extend(_result.scalars().all())
+
+        return _orm_objects, _rowcount
+
 
 __all__ = ["UpdateMixin"]
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
 from http import HTTPStatus
-from typing import Any, Optional, Dict, Type
+from operator import attrgetter, itemgetter
+from typing import Any, Optional, Dict, Type, List, Iterable
 
-from pydantic import validate_call, conint, constr
+from pydantic import validate_call, conint, constr, TypeAdapter
+from pydantic_core import PydanticSerializationError
 from starlette.background import BackgroundTask
 from fastapi import Request
 from fastapi.encoders import jsonable_encoder
@@ -12,6 +14,61 @@ from fastapi.responses import JSONResponse
 from api.config import config
 from api.core import utils
 from api.core.schemas import BaseResPM
+from api.logger import logger
+
+_TYPE_ADAPTERS: Dict[Type[BaseResPM], TypeAdapter] = {}
+
+
+def _get_type_adapter(response_schema: Type[BaseResPM]) -> TypeAdapter:
+    _type_adapter = _TYPE_ADAPTERS.get(response_schema)
+    if _type_adapter is None:
+        _type_adapter = TypeAdapter(response_schema)
+        _TYPE_ADAPTERS[response_schema] = _type_adapter
+
+    return _type_adapter
+
+
+def build_list_data(
+    items: Iterable[Any],
+    fields: Iterable[str],
+    base_url: str,
+    id_field: str = "id",
+) -> List[Dict[str, Any]]:
+    """Build list response data with `links.self` of each item in one pass over the page,
+    instead of per-item model validators or default factories.
+
+    Args:
+        items    (Iterable[Any], required): ORM objects, rows or dictionaries of the page.
+        fields   (Iterable[str], required): Item fields to include into data.
+        base_url (str          , required): Base URL of the resource, self link is `{base_url}/{id}`.
+        id_field (str          , optional): ID field of the item. Defaults to "id".
+
+    Returns:
+        List[Dict[str, Any]]: List of item dictionaries with `links`.
+    """
+
+    _fields = tuple(_field for _field in fields if _field != "links")
+    if id_field not in _fields:
+        _fields = (id_field, *_fields)
+
+    _id_index = _fields.index(id_field)
+    _link_template = base_url.rstrip("/") + "/{}"
+
+    _attr_getter = attrgetter(*_fields)
+    _item_getter = itemgetter(*_fields)
+    _data = []
+    for _item in items:
+        _values = (
+            _item_getter(_item) if isinstance(_item, dict) else _attr_getter(_item)
+        )
+        if len(_fields) == 1:
+            _values = (_values,)
+
+        _item_data = dict(zip(_fields, _values))
+        _item_data["links"] = {"self": _link_template.format(_values[_id_index])}
+        _data.append(_item_data)
+
+    return _data
 
 
 class BaseResponse(JSONResponse):
@@ -41,6 +98,8 @@ class BaseResponse(JSONResponse):
     ) -> None:
         """Constructor method for BaseResponse class.
         This will prepare the most response data and pass it to `JSONResponse` parent class constructor.
+        With `config.api.fast_render` the response schema is serialized directly to JSON bytes
+        (same JSON as `jsonable_encoder()` + `JSONResponse`) by serializer cached per schema type.
 
         Args:
             content         (Any                      , optional): Main data content for response. Defaults to None.
@@ -117,7 +176,17 @@ class BaseResponse(JSONResponse):
         _response_pm = response_schema(
             message=message, data=content, links=links, meta=meta, error=error
         )
-        _content = jsonable_encoder(obj=_response_pm, by_alias=True)
+        _content: Any = None
+        if config.api.fast_render:
+            try:
+                _content = _get_type_adapter(response_schema).dump_json(
+                    _response_pm, by_alias=True
+                )
+            except PydanticSerializationError as err:
+                logger.debug("Failed to fast render response, falling back: {}", err)
+
+        if _content is None:
+            _content = jsonable_encoder(obj=_response_pm, by_alias=True)
 
         super().__init__(
             content=_content,
@@ -128,5 +197,11 @@ class BaseResponse(JSONResponse):
         )
         return
 
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+
+        return super().render(content)
+
 
-__all__ = ["BaseResponse"]
+__all__ = ["BaseResponse", "build_list_data"]
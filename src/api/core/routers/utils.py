@@ -4,6 +4,7 @@ from fastapi import APIRouter, Request
 
 from api.core.schemas import BaseResPM
 from api.core.responses import BaseResponse
+from api.databases.rdb import read_router
 
 
 router = APIRouter(tags=["Utils"])
@@ -41,6 +42,23 @@ async def get_health(request: Request):
     _message = "Everything is OK."
     _data = {"api": {"message": "API is up.", "is_alive": True}}
 
+    _read_stats = read_router.get_stats()
+    _is_read_alive = any(
+        _replica["is_healthy"] and (_replica["breaker"] == "closed")
+        for _replica in _read_stats["replicas"]
+    )
+    _data["read_db"] = {
+        "message": (
+            "Read replicas are up."
+            if _is_read_alive
+            else "No read replica is available, reads fall back to the primary."
+        ),
+        "is_alive": _is_read_alive,
+        "stats": _read_stats,
+    }
+    if not _is_read_alive:
+        _message = "Read replicas are degraded."
+
     return BaseResponse(
         request=request,
         content=_data,
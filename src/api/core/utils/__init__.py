@@ -5,5 +5,6 @@ from ._secure import *
 from ._http import *
 from ._dt import *
 from ._io import *
+from ._id import *
 from . import _validator as validator
 from . import _sanitizer as sanitizer
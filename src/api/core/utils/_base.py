@@ -2,6 +2,7 @@
 
 import re
 import copy
+from typing import Any, Callable, Dict, Optional
 
 from pydantic import validate_call
 
@@ -109,9 +110,41 @@ def obj_to_repr(obj: object) -> str:
     return _self_repr
 
 
+def validate_internal_call(
+    func: Optional[Callable] = None, *, config: Optional[Dict[str, Any]] = None
+) -> Callable:
+    """Pydantic `validate_call` decorator for functions called by internal trusted code (ORM mixins, services).
+    When `config.api.strict_validation` is disabled (`FOT_API_STRICT_VALIDATION=false`),
+    function is returned unwrapped and arguments are not validated on each call.
+    Request data is still validated at the HTTP boundary by FastAPI.
+
+    Args:
+        func   (Optional[Callable]      , optional): Function to decorate. Defaults to None.
+        config (Optional[Dict[str, Any]], optional): Pydantic config for `validate_call`. Defaults to None.
+
+    Returns:
+        Callable: Decorated function or decorator.
+    """
+
+    # Imported lazily, configs depend on utils:
+    from api.config import config as _config
+
+    def _decorator(_func: Callable) -> Callable:
+        if not _config.api.strict_validation:
+            return _func
+
+        return validate_call(config=config)(_func)
+
+    if func is not None:
+        return _decorator(func)
+
+    return _decorator
+
+
 __all__ = [
     "deep_merge",
     "camel_to_snake",
     "clean_obj_dict",
     "obj_to_repr",
+    "validate_internal_call",
 ]
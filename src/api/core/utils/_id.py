@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import uuid
+import random
+import threading
+from typing import List, Optional, Tuple
+
+# 2024-01-01T00:00:00Z, epoch of 63-bit integer IDs (41 bits milliseconds ~ 69 years):
+_INT_ID_EPOCH_MS = 1_704_067_200_000
+_INT_ID_NODE_BITS = 10
+_INT_ID_SEQ_BITS = 12
+_INT_ID_MAX_SEQ = (1 << _INT_ID_SEQ_BITS) - 1
+
+# UUIDv7 layout: 48 bits milliseconds | version | 42 bits counter (rand_a + rand_b) | 32 bits node:
+_UUID7_COUNTER_BITS = 42
+_UUID7_MAX_COUNTER = (1 << _UUID7_COUNTER_BITS) - 1
+
+
+class TimeOrderedIdGenerator:
+    """Per-process generator of time-ordered IDs: UUIDv7 (RFC 9562, counter method) and 63-bit integers.
+    IDs of the same millisecond are ordered by monotonic counter, random node bits are drawn once
+    per process (and after fork), so no random syscall is made per ID.
+    """
+
+    def __init__(self, node_id: Optional[int] = None):
+        """Constructor method for TimeOrderedIdGenerator class.
+
+        Args:
+            node_id (Optional[int], optional): Node ID (0-1023) of integer IDs, None means random. Defaults to None.
+
+        Raises:
+            ValueError: If `node_id` is out of range.
+        """
+
+        if (node_id is not None) and not (0 <= node_id < (1 << _INT_ID_NODE_BITS)):
+            raise ValueError(f"Node ID must be between 0 and 1023, got '{node_id}'!")
+
+        self.node_id = node_id
+        self._lock = threading.Lock()
+        self._reset()
+
+    def set_node_id(self, node_id: Optional[int]) -> None:
+        """Set node ID of integer IDs, unique node per process avoids collisions between processes.
+
+        Args:
+            node_id (Optional[int], required): Node ID (0-1023), None means random.
+
+        Raises:
+            ValueError: If `node_id` is out of range.
+        """
+
+        if (node_id is not None) and not (0 <= node_id < (1 << _INT_ID_NODE_BITS)):
+            raise ValueError(f"Node ID must be between 0 and 1023, got '{node_id}'!")
+
+        with self._lock:
+            self.node_id = node_id
+            self._reset()
+
+        return
+
+    def _reset(self) -> None:
+        self._random = random.Random(os.urandom(16))
+        self._uuid_node = self._random.getrandbits(32)
+        self._int_node = self.node_id
+        if self._int_node is None:
+            self._int_node = self._random.getrandbits(_INT_ID_NODE_BITS)
+
+        self._uuid_ms = 0
+        self._uuid_counter = 0
+        self._int_ms = 0
+        self._int_seq = 0
+        return
+
+    def _after_fork(self) -> None:
+        # Lock may be held by other thread of parent process at fork time:
+        self._lock = threading.Lock()
+        self._reset()
+        return
+
+    def _reserve_uuid7(self, count: int) -> Tuple[int, int]:
+        with self._lock:
+            _now_ms = time.time_ns() // 1_000_000
+            if self._uuid_ms < _now_ms:
+                self._uuid_ms = _now_ms
+                # Random start with headroom keeps IDs unguessable and counter from overflow:
+                self._uuid_counter = self._random.getrandbits(_UUID7_COUNTER_BITS - 1)
+
+            if _UUID7_MAX_COUNTER < (self._uuid_counter + count):
+                self._uuid_ms += 1
+                self._uuid_counter = 0
+
+            _counter = self._uuid_counter
+            self._uuid_counter += count
+            return self._uuid_ms, _counter
+
+    def _reserve_int(self, count: int) -> List[Tuple[int, int, int]]:
+        _reserved = []
+        with self._lock:
+            _now_ms = time.time_ns() // 1_000_000
+            if self._int_ms < _now_ms:
+                self._int_ms = _now_ms
+                self._int_seq = 0
+
+            while 0 < count:
+                if _INT_ID_MAX_SEQ < self._int_seq:
+                    self._int_ms += 1
+                    self._int_seq = 0
+
+                _size = min(count, _INT_ID_MAX_SEQ + 1 - self._int_seq)
+                _reserved.append((self._int_ms, self._int_seq, _size))
+                self._int_seq += _size
+                count -= _size
+
+        return _reserved
+
+    def gen_uuid7_ints(self, count: int = 1) -> List[int]:
+        """Generate 128-bit integers of time-ordered UUIDv7.
+
+        Args:
+            count (int, optional): Number of IDs. Defaults to 1.
+
+        Returns:
+            List[int]: List of UUIDv7 integers.
+        """
+
+        _ms, _counter = self._reserve_uuid7(count=count)
+        _prefix = ((_ms & 0xFFFF_FFFF_FFFF) << 80) | (0x7 << 76) | (0b10 << 62)
+        _ints = [
+            _prefix
+            | ((_value >> 30) << 64)
+            | ((_value & 0x3FFF_FFFF) << 32)
+            | self._uuid_node
+            for _value in range(_counter, _counter + count)
+        ]
+        return _ints
+
+    def gen_uuid7(self) -> uuid.UUID:
+        """Generate time-ordered UUIDv7.
+
+        Returns:
+            uuid.UUID: UUIDv7.
+        """
+
+        return uuid.UUID(int=self.gen_uuid7_ints(count=1)[0])
+
+    def gen_uuid7_hex(self, prefix: str = "", count: int = 1) -> List[str]:
+        """Generate time-ordered UUIDv7 as lowercase 32 hex characters with prefix.
+
+        Args:
+            prefix (str, optional): Prefix of IDs. Defaults to ''.
+            count  (int, optional): Number of IDs. Defaults to 1.
+
+        Returns:
+            List[str]: List of IDs.
+        """
+
+        return [
+            prefix + _int.to_bytes(16, "big").hex()
+            for _int in self.gen_uuid7_ints(count=count)
+        ]
+
+    def gen_int_ids(self, count: int = 1) -> List[int]:
+        """Generate time-ordered 63-bit integer IDs (milliseconds | node | sequence), fit into BIGINT.
+
+        Args:
+            count (int, optional): Number of IDs. Defaults to 1.
+
+        Returns:
+            List[int]: List of integer IDs.
+        """
+
+        _ids = []
+        for _ms, _seq, _size in self._reserve_int(count=count):
+            _prefix = (
+                (_ms - _INT_ID_EPOCH_MS) << (_INT_ID_NODE_BITS + _INT_ID_SEQ_BITS)
+            ) | (self._int_node << _INT_ID_SEQ_BITS)
+            _ids.extend(_prefix | _value for _value in range(_seq, _seq + _size))
+
+        return _ids
+
+
+id_generator = TimeOrderedIdGenerator()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=id_generator._after_fork)
+
+
+__all__ = [
+    "TimeOrderedIdGenerator",
+    "id_generator",
+]
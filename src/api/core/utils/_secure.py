@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 
+import hmac
+import json
 import uuid
+import base64
 import string
 import secrets
 import hashlib
+from typing import Any, Dict
 
 from pydantic import validate_call, conint, constr
 
@@ -68,8 +72,69 @@ def hash_str(val: str, algorithm: HashAlgoEnum = HashAlgoEnum.sha256) -> str:
     return _hash_val
 
 
+@validate_call
+def encode_cursor(payload: Dict[str, Any], key: constr(min_length=8)) -> str:  # type: ignore
+    """Encode payload into opaque and signed (HMAC-SHA256) cursor token.
+
+    Args:
+        payload (Dict[str, Any], required): JSON serializable payload to encode.
+        key     (str           , required): Secret key to sign cursor with.
+
+    Returns:
+        str: URL-safe cursor token.
+    """
+
+    _json_bytes = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    _body = base64.urlsafe_b64encode(_json_bytes).rstrip(b"=")
+    _signature = hmac.new(key.encode("utf-8"), _body, hashlib.sha256).digest()
+    _signature = base64.urlsafe_b64encode(_signature).rstrip(b"=")
+
+    _cursor = f"{_body.decode('ascii')}.{_signature.decode('ascii')}"
+    return _cursor
+
+
+@validate_call
+def decode_cursor(cursor: str, key: constr(min_length=8)) -> Dict[str, Any]:  # type: ignore
+    """Verify signature and decode cursor token into payload.
+
+    Args:
+        cursor (str, required): Cursor token to decode.
+        key    (str, required): Secret key to verify cursor signature with.
+
+    Raises:
+        ValueError: If cursor format or signature is invalid.
+
+    Returns:
+        Dict[str, Any]: Decoded payload from cursor.
+    """
+
+    try:
+        _body, _signature = cursor.encode("ascii").split(b".")
+    except ValueError:
+        raise ValueError("Invalid cursor format!")
+
+    _expected = hmac.new(key.encode("utf-8"), _body, hashlib.sha256).digest()
+    _expected = base64.urlsafe_b64encode(_expected).rstrip(b"=")
+    if not hmac.compare_digest(_signature, _expected):
+        raise ValueError("Invalid cursor signature!")
+
+    _payload: Dict[str, Any]
+    try:
+        _padding = b"=" * (-len(_body) % 4)
+        _payload = json.loads(base64.urlsafe_b64decode(_body + _padding))
+    except ValueError:
+        raise ValueError("Invalid cursor payload!")
+
+    if not isinstance(_payload, dict):
+        raise ValueError("Invalid cursor payload!")
+
+    return _payload
+
+
 __all__ = [
     "gen_unique_id",
     "gen_random_string",
     "hash_str",
+    "encode_cursor",
+    "decode_cursor",
 ]
@@ -6,6 +6,7 @@ from ._connect import *
 from ._check import *
 from ._create import *
 from ._close import *
+from ._router import *
 
 
 register_orms()
@@ -14,9 +15,25 @@ register_orms()
 async_write_engine = make_async_engine(dsn_url=config.db.dsn_url.get_secret_value())
 AsyncWriteSession = create_async_session_maker(async_engine=async_write_engine)
 
-async_read_engine = make_async_engine(dsn_url=config.db.read_dsn_url.get_secret_value())
+async_read_engines = [
+    make_async_engine(dsn_url=_read_dsn_url.get_secret_value())
+    for _read_dsn_url in config.db.read_dsn_urls
+]
+async_read_engine = async_read_engines[0]
 AsyncReadSession = create_async_session_maker(async_engine=async_read_engine)
 
+read_router = ReplicaRouter(
+    primary_async_engine=async_write_engine,
+    read_async_engines=async_read_engines,
+    balance=config.db.read_balance,
+    max_lag=config.db.read_max_lag,
+    check_interval=config.db.read_check_interval,
+    failure_threshold=config.db.read_failure_threshold,
+    reset_timeout=config.db.read_reset_timeout,
+    fallback_limit=config.db.read_fallback_limit,
+    fallback_timeout=config.db.read_fallback_timeout,
+)
+
 ## Sync
 # write_engine = make_engine(dsn_url=config.db.dsn_url.get_secret_value())
 # WriteSession = create_session_maker(engine=write_engine)
@@ -27,7 +44,7 @@ AsyncReadSession = create_async_session_maker(async_engine=async_read_engine)
 
 engines = [
     async_write_engine,
-    async_read_engine,
+    *async_read_engines,
     # write_engine,
     # read_engine,
 ]
@@ -42,14 +59,19 @@ sessions = [
 __all__ = [
     "async_write_engine",
     "async_read_engine",
+    "async_read_engines",
     "AsyncWriteSession",
     "AsyncReadSession",
+    "read_router",
     # "write_engine",
     # "WriteSession",
     # "read_engine",
     # "ReadSession",
     "engines",
     "sessions",
+    "ReadUnavailableError",
+    "ReadReplica",
+    "ReplicaRouter",
     "make_async_engine",
     "create_async_session_maker",
     "async_create_db",
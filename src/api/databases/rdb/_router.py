@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+import itertools
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Dict, List, Literal, Optional
+
+from sqlalchemy import Result, text
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from api.logger import logger
+
+# Replay lag of replica in seconds, 0 if all received WAL is replayed (idle primary doesn't advance replay timestamp):
+_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM (now() - pg_last_xact_replay_timestamp())), 0)
+    END
+    """)
+
+
+def _create_session_maker(async_engine: AsyncEngine) -> async_sessionmaker:
+    _session_maker = async_sessionmaker(
+        bind=async_engine,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    return _session_maker
+
+
+class ReadUnavailableError(ConnectionError):
+    """Raised when no replica is reachable and the primary fallback budget is exhausted."""
+
+
+def _is_connection_error(err: BaseException) -> bool:
+    if isinstance(err, DBAPIError):
+        return err.connection_invalidated or isinstance(
+            err, (OperationalError, InterfaceError)
+        )
+
+    return isinstance(err, (OSError, asyncio.TimeoutError))
+
+
+class ReadReplica:
+    """Read replica engine with session maker, health state, circuit breaker and number of sessions in use."""
+
+    def __init__(self, async_engine: AsyncEngine):
+        """Constructor method for ReadReplica class.
+
+        Args:
+            async_engine (AsyncEngine, required): SQLAlchemy async engine of replica.
+        """
+
+        self.async_engine = async_engine
+        self.name = f"{async_engine.url.host}:{async_engine.url.port}"
+        self.session_maker = _create_session_maker(async_engine=async_engine)
+        self.is_healthy = True
+        self.lag: Optional[float] = None
+        self.in_use = 0
+        self.sessions = 0
+        self.ejections = 0
+        self.is_open = False
+        self.failures = 0
+        self.opens = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def is_available(self) -> bool:
+        return self.is_healthy and (not self.is_open)
+
+    def get_stats(self) -> Dict[str, Any]:
+        _stats = {
+            "name": self.name,
+            "is_healthy": self.is_healthy,
+            "breaker": "open" if self.is_open else "closed",
+            "lag": self.lag,
+            "in_use": self.in_use,
+            "sessions": self.sessions,
+            "failures": self.failures,
+            "ejections": self.ejections,
+            "opens": self.opens,
+        }
+        return _stats
+
+
+class ReplicaRouter:
+    """Router of read sessions over multiple replicas (round-robin or least connections).
+    Replicas are health-checked in background and ejected while unreachable or lagging
+    more than `max_lag` seconds. Connection failures of read sessions open replica's circuit breaker
+    after `failure_threshold` consecutive failures, open replicas are probed again after `reset_timeout`.
+    Reads fall back to the primary when no replica is available, at most `fallback_limit` at a time.
+    """
+
+    def __init__(
+        self,
+        primary_async_engine: AsyncEngine,
+        read_async_engines: List[AsyncEngine],
+        balance: Literal["round_robin", "least_connections"] = "round_robin",
+        max_lag: float = 5.0,
+        check_interval: int = 10,
+        failure_threshold: int = 3,
+        reset_timeout: int = 30,
+        fallback_limit: int = 10,
+        fallback_timeout: float = 5.0,
+    ):
+        """Constructor method for ReplicaRouter class.
+
+        Args:
+            primary_async_engine (AsyncEngine                                , required): SQLAlchemy async engine of primary (write) database.
+            read_async_engines   (List[AsyncEngine]                          , required): SQLAlchemy async engines of read replicas.
+            balance              (Literal["round_robin", "least_connections"], optional): Replica balancing policy. Defaults to "round_robin".
+            max_lag              (float                                      , optional): Max replay lag in seconds, 0 means disabled. Defaults to 5.0.
+            check_interval       (int                                        , optional): Health check interval in seconds. Defaults to 10.
+            failure_threshold    (int                                        , optional): Consecutive connection failures to open breaker. Defaults to 3.
+            reset_timeout        (int                                        , optional): Seconds before probing replica with open breaker. Defaults to 30.
+            fallback_limit       (int                                        , optional): Max concurrent fallback reads on primary, 0 means disabled. Defaults to 10.
+            fallback_timeout     (float                                      , optional): Seconds to wait for fallback slot. Defaults to 5.0.
+        """
+
+        self.primary_session_maker = _create_session_maker(
+            async_engine=primary_async_engine
+        )
+        self.replicas = [
+            ReadReplica(async_engine=_async_engine)
+            for _async_engine in read_async_engines
+        ]
+        self.balance = balance
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.fallback_limit = fallback_limit
+        self.fallback_timeout = fallback_timeout
+        self.primary_reads = 0
+        self.fallbacks = 0
+        self.fallback_rejects = 0
+        self.fallback_in_use = 0
+        self._fallback_semaphore = asyncio.Semaphore(max(fallback_limit, 1))
+        self._cycle = itertools.count()
+        self._check_task: Optional[asyncio.Task] = None
+
+    def pick(
+        self, exclude: Optional[List[ReadReplica]] = None
+    ) -> Optional[ReadReplica]:
+        """Pick available (healthy and closed breaker) replica by balancing policy.
+
+        Args:
+            exclude (Optional[List[ReadReplica]], optional): Replicas to skip (e.g. already failed). Defaults to None.
+
+        Returns:
+            Optional[ReadReplica]: Read replica, None if no replica is available.
+        """
+
+        _available = [
+            _replica
+            for _replica in self.replicas
+            if _replica.is_available and (_replica not in (exclude or []))
+        ]
+        if not _available:
+            return None
+
+        if self.balance == "least_connections":
+            return min(_available, key=lambda _replica: _replica.in_use)
+
+        return _available[next(self._cycle) % len(_available)]
+
+    def record_failure(self, replica: ReadReplica, err: BaseException) -> None:
+        """Record connection failure of replica, open its breaker at `failure_threshold`.
+
+        Args:
+            replica (ReadReplica  , required): Read replica of failed session.
+            err     (BaseException, required): Connection error.
+        """
+
+        replica.failures += 1
+        logger.warning("Read replica '{}' connection failed: {}", replica.name, err)
+        if (not replica.is_open) and (self.failure_threshold <= replica.failures):
+            replica.is_open = True
+            replica.opens += 1
+            replica.opened_at = time.monotonic()
+            logger.error(
+                "Opened circuit breaker of '{}' read replica after {} failure(s)!",
+                replica.name,
+                replica.failures,
+            )
+
+        return
+
+    @asynccontextmanager
+    async def async_session(
+        self, use_primary: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Open read session on picked replica, or on primary if pinned or no replica is available.
+        Replica connection is established eagerly, so failed replica falls back to the primary
+        in the same call.
+
+        Args:
+            use_primary (bool, optional): Read from primary (e.g. read-your-writes). Defaults to False.
+
+        Raises:
+            ReadUnavailableError: If fallback to the primary is disabled or its budget is exhausted.
+
+        Yields:
+            AsyncGenerator[AsyncSession, None]: SQLAlchemy async session.
+        """
+
+        _replica: Optional[ReadReplica] = None
+        _failed: List[ReadReplica] = []
+        if not use_primary:
+            _replica = self.pick()
+
+        while _replica is not None:
+            _async_session: AsyncSession = _replica.session_maker()
+            _replica.in_use += 1
+            _replica.sessions += 1
+            try:
+                await _async_session.connection()
+            except Exception as err:
+                _replica.in_use -= 1
+                await _async_session.close()
+                if not _is_connection_error(err):
+                    raise
+
+                self.record_failure(replica=_replica, err=err)
+                _failed.append(_replica)
+                _replica = self.pick(exclude=_failed)
+                continue
+
+            try:
+                yield _async_session
+            except Exception as err:
+                if _is_connection_error(err):
+                    self.record_failure(replica=_replica, err=err)
+                raise
+            else:
+                _replica.failures = 0
+            finally:
+                _replica.in_use -= 1
+                await _async_session.close()
+
+            return
+
+        if use_primary:
+            self.primary_reads += 1
+            async with self.primary_session_maker() as _async_session:
+                yield _async_session
+            return
+
+        await self._async_acquire_fallback()
+        self.fallbacks += 1
+        self.fallback_in_use += 1
+        try:
+            async with self.primary_session_maker() as _async_session:
+                yield _async_session
+        finally:
+            self.fallback_in_use -= 1
+            self._fallback_semaphore.release()
+
+        return
+
+    async def _async_acquire_fallback(self) -> None:
+        try:
+            if self.fallback_limit <= 0:
+                raise asyncio.TimeoutError()
+
+            await asyncio.wait_for(
+                self._fallback_semaphore.acquire(), timeout=self.fallback_timeout
+            )
+        except asyncio.TimeoutError:
+            self.fallback_rejects += 1
+            raise ReadUnavailableError(
+                "No read replica is available and primary fallback limit is reached!"
+            ) from None
+
+        return
+
+    async def async_check_replica(self, replica: ReadReplica) -> bool:
+        """Check replica connection and replay lag, eject or restore replica by the result.
+        Replica with open breaker is probed only after `reset_timeout`, breaker is closed on success.
+
+        Args:
+            replica (ReadReplica, required): Read replica to check.
+
+        Returns:
+            bool: True if replica is healthy, False otherwise.
+        """
+
+        if replica.is_open and (
+            (time.monotonic() - replica.opened_at) < self.reset_timeout
+        ):
+            return False
+
+        _is_healthy = False
+        try:
+            async with replica.async_engine.connect() as _connection:
+                if _connection.dialect.name == "postgresql":
+                    _result: Result = await _connection.execute(_LAG_SQL)
+                    replica.lag = float(_result.scalar() or 0)
+                else:
+                    await _connection.execute(text("SELECT 1"))
+                    replica.lag = 0.0
+
+            _is_healthy = (not self.max_lag) or (replica.lag <= self.max_lag)
+            if not _is_healthy:
+                logger.warning(
+                    "Read replica '{}' is lagging {:.1f} second(s)!",
+                    replica.name,
+                    replica.lag,
+                )
+        except Exception as err:
+            replica.lag = None
+            logger.warning("Read replica '{}' is unreachable: {}", replica.name, err)
+
+        if replica.is_open:
+            if _is_healthy:
+                replica.is_open = False
+                replica.failures = 0
+                replica.opened_at = None
+                logger.success(
+                    "Closed circuit breaker of '{}' read replica.", replica.name
+                )
+            else:
+                # Wait another `reset_timeout` before next probe:
+                replica.opened_at = time.monotonic()
+
+        if replica.is_healthy and (not _is_healthy):
+            replica.ejections += 1
+            logger.warning("Ejected '{}' read replica.", replica.name)
+        elif (not replica.is_healthy) and _is_healthy:
+            logger.success("Restored '{}' read replica.", replica.name)
+
+        replica.is_healthy = _is_healthy
+        return _is_healthy
+
+    async def async_check_all(self) -> None:
+        """Check all replicas concurrently."""
+
+        await asyncio.gather(
+            *[self.async_check_replica(replica=_replica) for _replica in self.replicas]
+        )
+        return
+
+    async def _async_check_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            try:
+                await self.async_check_all()
+            except Exception as err:
+                logger.warning("Failed to check read replicas: {}", err)
+
+    async def async_start(self) -> None:
+        """Check replicas and start background health check task."""
+
+        if self._check_task is not None:
+            return
+
+        await self.async_check_all()
+        self._check_task = asyncio.create_task(self._async_check_loop())
+        return
+
+    async def async_stop(self) -> None:
+        """Stop background health check task."""
+
+        if self._check_task is None:
+            return
+
+        self._check_task.cancel()
+        try:
+            await self._check_task
+        except asyncio.CancelledError:
+            pass
+
+        self._check_task = None
+        return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get read router statistics.
+
+        Returns:
+            Dict[str, Any]: Balancing policy, primary reads, fallbacks and statistics of each replica.
+        """
+
+        _stats = {
+            "balance": self.balance,
+            "primary_reads": self.primary_reads,
+            "fallbacks": self.fallbacks,
+            "fallback_rejects": self.fallback_rejects,
+            "fallback_in_use": self.fallback_in_use,
+            "replicas": [_replica.get_stats() for _replica in self.replicas],
+        }
+        return _stats
+
+
+__all__ = [
+    "ReadUnavailableError",
+    "ReadReplica",
+    "ReplicaRouter",
+]
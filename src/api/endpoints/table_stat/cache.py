@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from sqlalchemy.engine import make_url
+
+from api.config import config
+from api.logger import logger
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # Refresh may have no callers left to retrieve its exception:
+    if not task.cancelled():
+        task.exception()
+
+    return
+
+
+class RowCountCache:
+    """In-process cache of table row counts with TTL and single in-flight refresh per table.
+    Concurrent misses of the same table wait for one loader call instead of querying database each.
+    Cached counts are optionally invalidated by PostgreSQL `LISTEN` on table stat change notifications.
+    """
+
+    def __init__(self, ttl: int = 5):
+        """Constructor method for RowCountCache class.
+
+        Args:
+            ttl (int, optional): Time to live of cached counts in seconds, 0 means disabled. Defaults to 5.
+        """
+
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.invalidations = 0
+        self.notifications = 0
+        self._items: Dict[str, Tuple[float, int]] = {}
+        self._versions: Dict[str, int] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._listen_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_enabled(self) -> bool:
+        return 0 < self.ttl
+
+    async def async_get(self, key: str, loader: Callable[[], Awaitable[int]]) -> int:
+        """Get cached count or load it, only one load per key is in flight at a time.
+
+        Args:
+            key    (str                         , required): Cache key (table name).
+            loader (Callable[[], Awaitable[int]], required): Coroutine function to load count from database.
+
+        Raises:
+            Exception: Any exception from `loader`, raised to all callers of the same refresh.
+
+        Returns:
+            int: Count of rows.
+        """
+
+        if not self.is_enabled:
+            return await loader()
+
+        _item = self._items.get(key)
+        if (_item is not None) and (time.monotonic() < _item[0]):
+            self.hits += 1
+            return _item[1]
+
+        self.misses += 1
+        _task = self._inflight.get(key)
+        if _task is None:
+            self.refreshes += 1
+            # Refresh runs as its own task, so cancelled caller doesn't cancel it for others:
+            _task = asyncio.get_running_loop().create_task(
+                self._async_refresh(key=key, loader=loader)
+            )
+            _task.add_done_callback(_retrieve_exception)
+            self._inflight[key] = _task
+
+        return await asyncio.shield(_task)
+
+    async def _async_refresh(
+        self, key: str, loader: Callable[[], Awaitable[int]]
+    ) -> int:
+        _version = self._versions.get(key, 0)
+        try:
+            _count = await loader()
+        finally:
+            self._inflight.pop(key, None)
+
+        # Count loaded before invalidation may be stale, return it without caching:
+        if _version == self._versions.get(key, 0):
+            self._items[key] = (time.monotonic() + self.ttl, _count)
+
+        return _count
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Invalidate cached count of key or all cached counts.
+
+        Args:
+            key (Optional[str], optional): Cache key (table name), None means all. Defaults to None.
+        """
+
+        _keys = (
+            list(self._items.keys() | self._inflight.keys()) if key is None else [key]
+        )
+        for _key in _keys:
+            self._items.pop(_key, None)
+            self._versions[_key] = self._versions.get(_key, 0) + 1
+
+        self.invalidations += 1
+        return
+
+    async def async_start_listener(self, dsn_url: str, channel: str) -> None:
+        """Start background task to invalidate cached counts by PostgreSQL `LISTEN` notifications.
+        Payload of notification is table name, connection is re-established after failures.
+
+        Args:
+            dsn_url (str, required): SQLAlchemy database URL (PostgreSQL).
+            channel (str, required): Notification channel name.
+        """
+
+        if self._listen_task is not None:
+            return
+
+        _url = make_url(dsn_url).set(drivername="postgresql")
+        self._listen_task = asyncio.create_task(
+            self._async_listen(
+                conninfo=_url.render_as_string(hide_password=False), channel=channel
+            )
+        )
+        return
+
+    async def async_stop_listener(self) -> None:
+        """Stop background `LISTEN` task."""
+
+        if self._listen_task is None:
+            return
+
+        self._listen_task.cancel()
+        try:
+            await self._listen_task
+        except asyncio.CancelledError:
+            pass
+
+        self._listen_task = None
+        return
+
+    async def _async_listen(self, conninfo: str, channel: str) -> None:
+        import psycopg
+
+        _kwargs: Dict[str, Any] = config.db.connect_args or {}
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    conninfo, autocommit=True, **_kwargs
+                ) as _connection:
+                    await _connection.execute(f'LISTEN "{channel}"')
+                    # Notifications may be missed while disconnected:
+                    self.invalidate()
+                    logger.debug("Listening '{}' channel for row counts.", channel)
+                    async for _notify in _connection.notifies():
+                        self.notifications += 1
+                        self.invalidate(key=_notify.payload or None)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                self.invalidate()
+                logger.warning(
+                    f"Lost '{channel}' channel listener connection, retrying in {config.db.retry_after} second(s): {err}"
+                )
+                await asyncio.sleep(config.db.retry_after)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get row count cache statistics.
+
+        Returns:
+            Dict[str, Any]: TTL, size, hits, misses, refreshes, invalidations and notifications of cache.
+        """
+
+        _stats = {
+            "ttl": self.ttl,
+            "size": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "invalidations": self.invalidations,
+            "notifications": self.notifications,
+            "is_listening": self._listen_task is not None,
+        }
+        return _stats
+
+
+row_count_cache = RowCountCache(ttl=config.db.row_count_cache_ttl)
+
+
+__all__ = [
+    "RowCountCache",
+    "row_count_cache",
+]
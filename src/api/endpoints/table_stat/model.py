@@ -1,13 +1,29 @@
 # -*- coding: utf-8 -*-
 
-from sqlalchemy import String, Integer, text
+from sqlalchemy import (
+    Result,
+    String,
+    Integer,
+    SmallInteger,
+    UniqueConstraint,
+    func,
+    select,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.models import BaseORM
 
 
 class TableStatORM(BaseORM):
-    table_name: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    # Counters of a table are sharded into slot rows (summed on read) to avoid single row lock contention:
+    __table_args__ = (UniqueConstraint("table_name", "slot"),)
+
+    table_name: Mapped[str] = mapped_column(String(64), nullable=False)
+    slot: Mapped[int] = mapped_column(
+        SmallInteger, nullable=False, server_default=text("0")
+    )
     insert_count: Mapped[int] = mapped_column(
         Integer, nullable=False, server_default=text("0")
     )
@@ -18,5 +34,27 @@ class TableStatORM(BaseORM):
         Integer, nullable=False, server_default=text("0")
     )
 
+    @classmethod
+    async def async_get_row_count(
+        cls, async_session: AsyncSession, table_name: str
+    ) -> int:
+        """Get count of rows of the table, summed over all slot rows.
+
+        Args:
+            async_session (AsyncSession, required): SQLAlchemy async_session for database connection.
+            table_name    (str         , required): Name of the table.
+
+        Returns:
+            int: Count of rows.
+        """
+
+        _result: Result = await async_session.execute(
+            select(func.coalesce(func.sum(cls.row_count), 0)).where(
+                cls.table_name == table_name
+            )
+        )
+        _row_count = int(_result.scalar_one())
+        return _row_count
+
 
 __all__ = ["TableStatORM"]
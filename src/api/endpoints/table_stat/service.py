@@ -1,25 +1,27 @@
 # -*- coding: utf-8 -*-
 
-from typing import Union
+from functools import partial
 
-from pydantic import validate_call
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.constants import WarnEnum
+from api.core.utils import validate_internal_call
 from api.endpoints.table_stat.model import TableStatORM
 from api.logger import async_log_mode
 
 from .model import TableStatORM
+from .cache import row_count_cache
 
 
-@validate_call(config={"arbitrary_types_allowed": True})
+@validate_internal_call(config={"arbitrary_types_allowed": True})
 async def async_get_row_count(
     async_session: AsyncSession,
     request_id: str,
     table_name: str,
     warn_mode: WarnEnum = WarnEnum.IGNORE,
 ) -> int:
-    """Get count of rows from the table stat by table name.
+    """Get count of rows from the table stat by table name (sum of sharded slot rows),
+    cached in process for `config.db.row_count_cache_ttl` seconds.
 
     Args:
         async_session (AsyncSession, required): SQLAlchemy async_session for database connection.
@@ -32,20 +34,26 @@ async def async_get_row_count(
     """
 
     await async_log_mode(
-        message=f"[{request_id}] - Getting row count of '{table_name}' table from table stat...",
+        "[{}] - Getting row count of '{}' table from table stat...",
+        request_id,
+        table_name,
         warn_mode=warn_mode,
     )
 
-    _table_stat_orm: Union[TableStatORM, None] = await TableStatORM.async_get_by_where(
-        async_session=async_session, where={"column": "table_name", "value": table_name}
+    _row_scount = await row_count_cache.async_get(
+        key=table_name,
+        loader=partial(
+            TableStatORM.async_get_row_count,
+            async_session=async_session,
+            table_name=table_name,
+        ),
     )
 
-    _row_scount = 0
-    if _table_stat_orm:
-        _row_scount = _table_stat_orm.row_count
-
     await async_log_mode(
-        message=f"[{request_id}] - Successfully got row count of '{table_name}' table: {_row_scount}.",
+        "[{}] - Successfully got row count of '{}' table: {}.",
+        request_id,
+        table_name,
+        _row_scount,
         level="SUCCESS",
         warn_mode=warn_mode,
     )
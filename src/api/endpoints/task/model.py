@@ -7,6 +7,8 @@ from api.core.models import BaseORM
 
 
 class TaskORM(BaseORM):
+    __result_cache__ = True
+
     name: Mapped[str] = mapped_column(String(64), nullable=False)
     point: Mapped[int] = mapped_column(
         Integer, nullable=False, default=70, server_default=text("70")
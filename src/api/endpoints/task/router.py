@@ -1,19 +1,22 @@
 # -*- coding: utf-8 -*-
 
-from typing import List, Tuple
+from contextlib import AsyncExitStack
+from typing import Any, List, Tuple, Optional, AsyncGenerator
 
 from fastapi import APIRouter, Request, Depends, Path, Body, Query, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import constr
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.core.constants import ALPHANUM_HYPHEN_REGEX
+from api.core.constants import ALPHANUM_HYPHEN_REGEX, ExportFormatEnum
 from api.core import utils
 from api.config import config
 from api.core.dependencies import db as db_deps
-from api.core.responses import BaseResponse
+from api.core.responses import BaseResponse, build_list_data
 from api.logger import logger
 
-from .schemas import TaskBasePM, TaskUpPM, ResTaskPM, ResTasksPM
+from .schemas import TaskBasePM, TaskUpPM, TaskPM, ResTaskPM, ResTasksPM
 from .model import TaskORM
 from . import service
 
@@ -50,13 +53,26 @@ async def get_tasks(
         description="Is sort descending or ascending.",
         examples=[True],
     ),
+    cursor: Optional[str] = Query(
+        default=None,
+        min_length=8,
+        max_length=2048,
+        title="Cursor",
+        description="Keyset pagination cursor from `next`/`prev` links, `skip` is ignored.",
+    ),
+    approximate: bool = Query(
+        default=False,
+        title="Approximate Count",
+        description="Allow planner estimate of total count for large filtered results.",
+        examples=[False],
+    ),
     db_session: AsyncSession = Depends(db_deps.async_get_read),
 ):
     _request_id = request.state.request_id
-    logger.info(f"[{_request_id}] - Getting task list...")
+    logger.info("[{}] - Getting task list...", _request_id)
 
     _message = "Not found any task!"
-    _orm_tasks: List[TaskORM] = []
+    _orm_tasks: List[Any] = []
     _links = {
         "first": None,
         "prev": None,
@@ -65,17 +81,20 @@ async def get_tasks(
     }
     _list_count = 0
     _all_count = 0
+    _is_count_estimated = False
     try:
-        _result_tuple: Tuple[List[TaskORM], int] = await service.async_get_list(
+        _result_tuple: Tuple[List[Any], int, bool] = await service.async_get_list(
             async_session=db_session,
             request_id=_request_id,
             offset=skip,
             limit=(limit + 1),
             is_desc=is_desc,
+            cursor=cursor,
+            approximate_count=approximate,
         )
-        _orm_tasks, _all_count = _result_tuple
+        _orm_tasks, _all_count, _is_count_estimated = _result_tuple
 
-        _url = request.url.remove_query_params(["skip", "limit", "is_desc"])
+        _url = request.url.remove_query_params(["skip", "limit", "is_desc", "cursor"])
 
         if 0 < _all_count:
             _links["first"] = utils.get_relative_url(
@@ -87,48 +106,154 @@ async def get_tasks(
                 _url.include_query_params(skip=_last_skip, limit=limit, is_desc=is_desc)
             )
 
-        if 0 < skip:
-            _prev_skip = max(skip - limit, 0)
-            _links["prev"] = utils.get_relative_url(
-                _url.include_query_params(skip=_prev_skip, limit=limit, is_desc=is_desc)
-            )
+        _has_prev = 0 < skip
+        _has_next = False
+        if cursor:
+            _is_prev: bool
+            _, _is_prev = TaskORM.decode_cursor(cursor=cursor, is_desc=is_desc)
+            if _is_prev:
+                # Extra row of the previous page is the first one:
+                _has_prev = limit < len(_orm_tasks)
+                _has_next = True
+                if _has_prev:
+                    _orm_tasks = _orm_tasks[1:]
+            else:
+                _has_prev = True
+                _has_next = limit < len(_orm_tasks)
+        elif limit < len(_orm_tasks):
+            _has_next = True
 
         if limit < len(_orm_tasks):
             _orm_tasks = _orm_tasks[:limit]
-            _links["next"] = utils.get_relative_url(
-                _url.include_query_params(
-                    skip=(skip + limit), limit=limit, is_desc=is_desc
+
+        if _orm_tasks:
+            if _has_prev:
+                _prev_cursor = TaskORM.encode_cursor(
+                    orm_object=_orm_tasks[0], is_desc=is_desc, is_prev=True
+                )
+                _links["prev"] = utils.get_relative_url(
+                    _url.include_query_params(
+                        cursor=_prev_cursor, limit=limit, is_desc=is_desc
+                    )
+                )
+
+            if _has_next:
+                _next_cursor = TaskORM.encode_cursor(
+                    orm_object=_orm_tasks[-1], is_desc=is_desc
+                )
+                _links["next"] = utils.get_relative_url(
+                    _url.include_query_params(
+                        cursor=_next_cursor, limit=limit, is_desc=is_desc
+                    )
                 )
-            )
 
         _list_count = len(_orm_tasks)
         if 0 < _list_count:
             _message = "Successfully retrieved task list."
 
         logger.success(
-            f"[{_request_id}] - Successfully retrieved task list count: {len(_orm_tasks)}/{_all_count}."
+            "[{}] - Successfully retrieved task list count: {}/{}.",
+            _request_id,
+            len(_orm_tasks),
+            _all_count,
         )
     except Exception as err:
         if isinstance(err, HTTPException):
             raise
 
-        logger.error(f"[{_request_id}] - Failed to get task list!")
+        logger.error("[{}] - Failed to get task list!", _request_id)
         raise
 
     _response = BaseResponse(
         request=request,
         message=_message,
-        content=_orm_tasks,
+        content=build_list_data(
+            items=_orm_tasks,
+            fields=TaskPM.model_fields,
+            base_url=f"{config.api.prefix}{router.prefix}",
+        ),
         links=_links,
         meta={
             "list_count": _list_count,
             "all_count": _all_count,
+            "all_count_estimated": _is_count_estimated,
         },
         response_schema=ResTasksPM,
     )
     return _response
 
 
+@router.get(
+    "/export",
+    summary="Export Tasks",
+    description="Stream all tasks as NDJSON or CSV file.",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}, "text/csv": {}}},
+        422: {},
+    },
+)
+async def export_tasks(
+    request: Request,
+    export_format: ExportFormatEnum = Query(
+        default=ExportFormatEnum.ndjson,
+        alias="format",
+        title="Export Format",
+        description="Format of the exported file.",
+        examples=["ndjson"],
+    ),
+    is_desc: bool = Query(
+        default=config.db.select_is_desc,
+        title="Sort Direction",
+        description="Is sort descending or ascending.",
+        examples=[True],
+    ),
+):
+    _request_id = request.state.request_id
+    logger.info("[{}] - Exporting tasks...", _request_id)
+
+    # Session dependencies are closed before response body is sent, so the stream owns
+    # its routed read session. It is opened here to fail with 503 before streaming, and
+    # closed by background task too if the stream is never iterated (e.g. client disconnect):
+    _exit_stack = AsyncExitStack()
+    _async_read_session: AsyncSession = await _exit_stack.enter_async_context(
+        db_deps.async_open_read(request=request)
+    )
+
+    async def _async_stream() -> AsyncGenerator[str, None]:
+        async with _exit_stack:
+            try:
+                async for _chunk in service.async_export(
+                    async_session=_async_read_session,
+                    request_id=_request_id,
+                    export_format=export_format,
+                    is_desc=is_desc,
+                ):
+                    yield _chunk
+            except Exception:
+                logger.error("[{}] - Failed to export tasks!", _request_id)
+                raise
+
+    try:
+        _media_type = "application/x-ndjson"
+        if export_format == ExportFormatEnum.csv:
+            _media_type = "text/csv"
+
+        _response = StreamingResponse(
+            content=_async_stream(),
+            media_type=_media_type,
+            headers={
+                "Content-Disposition": f'attachment; filename="tasks.{export_format.value}"'
+            },
+            background=BackgroundTask(_exit_stack.aclose),
+        )
+    except Exception:
+        await _exit_stack.aclose()
+        raise
+
+    return _response
+
+
 @router.post(
     "/",
     summary="Create Task",
@@ -146,7 +271,7 @@ async def create_task(
     db_session: AsyncSession = Depends(db_deps.async_get_write),
 ):
     _request_id = request.state.request_id
-    logger.info(f"[{_request_id}] - Creating task with '{task_in.name}' name...")
+    logger.info("[{}] - Creating task with '{}' name...", _request_id, task_in.name)
 
     _task_orm: TaskORM
     try:
@@ -156,7 +281,9 @@ async def create_task(
         await db_session.commit()
 
         logger.success(
-            f"[{_request_id}] - Successfully created task with '{_task_orm.id}' ID."
+            "[{}] - Successfully created task with '{}' ID.",
+            _request_id,
+            _task_orm.id,
         )
     except Exception as err:
         await db_session.rollback()
@@ -165,7 +292,7 @@ async def create_task(
             raise
 
         logger.error(
-            f"[{_request_id}] - Failed to create task with '{task_in.name}' name!"
+            "[{}] - Failed to create task with '{}' name!", _request_id, task_in.name
         )
         raise
 
@@ -199,7 +326,7 @@ async def get_task(
     db_session: AsyncSession = Depends(db_deps.async_get_read),
 ):
     _request_id = request.state.request_id
-    logger.info(f"[{_request_id}] - Getting task with '{task_id}' ID...")
+    logger.info("[{}] - Getting task with '{}' ID...", _request_id, task_id)
 
     try:
         _task_orm: TaskORM = await service.async_get(
@@ -207,13 +334,15 @@ async def get_task(
         )
 
         logger.success(
-            f"[{_request_id}] - Successfully retrieved task with '{task_id}' ID."
+            "[{}] - Successfully retrieved task with '{}' ID.",
+            _request_id,
+            task_id,
         )
     except Exception as err:
         if isinstance(err, HTTPException):
             raise
 
-        logger.error(f"[{_request_id}] - Failed to get task with '{task_id}' ID!")
+        logger.error("[{}] - Failed to get task with '{}' ID!", _request_id, task_id)
         raise
 
     _response = BaseResponse(
@@ -248,7 +377,7 @@ async def update_task(
     db_session: AsyncSession = Depends(db_deps.async_get_write),
 ):
     _request_id = request.state.request_id
-    logger.info(f"[{_request_id}] - Updating task with '{task_id}' ID...")
+    logger.info("[{}] - Updating task with '{}' ID...", _request_id, task_id)
 
     _task_orm: TaskORM
     try:
@@ -261,7 +390,9 @@ async def update_task(
         await db_session.commit()
 
         logger.success(
-            f"[{_request_id}] - Successfully updated task with '{task_id}' ID."
+            "[{}] - Successfully updated task with '{}' ID.",
+            _request_id,
+            task_id,
         )
     except Exception as err:
         await db_session.rollback()
@@ -269,7 +400,9 @@ async def update_task(
         if isinstance(err, HTTPException):
             raise
 
-        logger.error(f"[{_request_id}] - Failed to update task with '{task_id}' ID!")
+        logger.error(
+            "[{}] - Failed to update task with '{}' ID!", _request_id, task_id
+        )
         raise
 
     _response = BaseResponse(
@@ -301,7 +434,7 @@ async def delete_task(
     db_session: AsyncSession = Depends(db_deps.async_get_write),
 ):
     _request_id = request.state.request_id
-    logger.info(f"[{_request_id}] - Deleting task with '{task_id}' ID...")
+    logger.info("[{}] - Deleting task with '{}' ID...", _request_id, task_id)
 
     try:
         await service.async_delete(
@@ -310,7 +443,9 @@ async def delete_task(
         await db_session.commit()
 
         logger.success(
-            f"[{_request_id}] - Successfully deleted task with '{task_id}' ID."
+            "[{}] - Successfully deleted task with '{}' ID.",
+            _request_id,
+            task_id,
         )
     except Exception as err:
         await db_session.rollback()
@@ -318,7 +453,9 @@ async def delete_task(
         if isinstance(err, HTTPException):
             raise
 
-        logger.error(f"[{_request_id}] - Failed to delete task with '{task_id}' ID!")
+        logger.error(
+            "[{}] - Failed to delete task with '{}' ID!", _request_id, task_id
+        )
         raise
 
     return
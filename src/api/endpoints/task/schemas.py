@@ -70,7 +70,10 @@ class TasksPM(TaskPM):
 
     @model_validator(mode="after")
     def _check_all(self) -> Self:
-        self.links.self_link = f"{_tasks_base_url}/{self.id}"
+        # Self link is already built for whole page by `build_list_data()`:
+        if not self.links.self_link:
+            self.links.self_link = f"{_tasks_base_url}/{self.id}"
+
         return self
 
 
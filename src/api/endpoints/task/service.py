@@ -1,69 +1,108 @@
 # -*- coding: utf-8 -*-
 
-from typing import List, Tuple
+import io
+import csv
+from typing import Any, List, Tuple, Optional, AsyncGenerator
 
-from pydantic import validate_call
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.core.constants import ErrorCodeEnum, WarnEnum
+from api.core.constants import ErrorCodeEnum, WarnEnum, ExportFormatEnum
+from api.core.utils import validate_internal_call
 from api.config import config
-from api.core.exceptions import BaseHTTPException, EmptyValueError, NullConstraintError
+from api.core.exceptions import (
+    BaseHTTPException,
+    EmptyValueError,
+    NullConstraintError,
+    CursorError,
+)
 from api.endpoints.table_stat import service as table_stat_service
 from api.logger import async_log_mode
 
-from .schemas import TaskBasePM
+from .schemas import TaskBasePM, TaskPM
 from .model import TaskORM
 
+# Read-only list endpoint only needs response columns, rows skip ORM identity map:
+_LIST_COLUMNS: List[str] = list(TaskPM.model_fields)
 
-@validate_call(config={"arbitrary_types_allowed": True})
+
+@validate_internal_call(config={"arbitrary_types_allowed": True})
 async def async_get_list(
     async_session: AsyncSession,
     request_id: str,
     offset: int = 0,
     limit: int = config.db.select_limit,
     is_desc: bool = config.db.select_is_desc,
+    cursor: Optional[str] = None,
+    approximate_count: bool = False,
     warn_mode: WarnEnum = WarnEnum.IGNORE,
     **kwargs,
-) -> Tuple[List[TaskORM], int]:
-    """Get list of tasks and total count.
+) -> Tuple[List[Any], int, bool]:
+    """Get list of tasks (as read-only projection rows) and total count.
 
     Args:
-        async_session (AsyncSession, required): SQLAlchemy async_session for database connection.
-        request_id    (str         , required): ID of the request.
-        offset        (int         , optional): Offset of the query. Defaults to 0.
-        limit         (int         , optional): Limit of the query. Defaults to `config.db.select_limit`.
-        is_desc       (bool        , optional): Is descending or ascending. Defaults to `config.db.select_is_desc`.
-        warn_mode     (WarnEnum    , optional): Warning mode. Defaults to `WarnEnum.IGNORE`.
-        **kwargs      (dict        , optional): Column and value as key-value pair for filtering.
+        async_session     (AsyncSession , required): SQLAlchemy async_session for database connection.
+        request_id        (str          , required): ID of the request.
+        offset            (int          , optional): Offset of the query. Defaults to 0.
+        limit             (int          , optional): Limit of the query. Defaults to `config.db.select_limit`.
+        is_desc           (bool         , optional): Is descending or ascending. Defaults to `config.db.select_is_desc`.
+        cursor            (Optional[str], optional): Keyset pagination cursor, `offset` is ignored. Defaults to None.
+        approximate_count (bool         , optional): Allow planner estimate of total count for large filtered results. Defaults to False.
+        warn_mode         (WarnEnum     , optional): Warning mode. Defaults to `WarnEnum.IGNORE`.
+        **kwargs          (dict         , optional): Column and value as key-value pair for filtering.
+
+    Raises:
+        BaseHTTPException: If cursor is invalid.
 
     Returns:
-        Tuple[List[TaskORM], int]: List of tasks and total count as tuple.
+        Tuple[List[Any], int, bool]: List of task rows, total count and is total count estimated as tuple.
     """
 
-    await async_log_mode(
-        message=f"[{request_id}] - Getting task list...", warn_mode=warn_mode
-    )
+    await async_log_mode("[{}] - Getting task list...", request_id, warn_mode=warn_mode)
 
     _where = []
     if kwargs:
         for _key, _val in kwargs.items():
             _where.append({"column": _key, "value": _val})
 
-    _orm_tasks: List[TaskORM] = await TaskORM.async_select_by_where(
-        async_session=async_session,
-        where=_where,
-        offset=offset,
-        limit=limit,
-        is_desc=is_desc,
-    )
-
+    _orm_tasks: List[Any] = []
     _all_count = 0
-    if _where:
-        _all_count = await TaskORM.async_count_by_where(
-            async_session=async_session, where=_where
+    _is_estimated = False
+    try:
+        if _where:
+            # Page and (estimated for large results) total count in one round trip:
+            (
+                _orm_tasks,
+                _all_count,
+                _is_estimated,
+            ) = await TaskORM.async_select_with_count_by_where(
+                async_session=async_session,
+                where=_where,
+                offset=offset,
+                limit=limit,
+                is_desc=is_desc,
+                cursor=cursor,
+                columns=_LIST_COLUMNS,
+                estimate_count=approximate_count,
+            )
+        else:
+            _orm_tasks: List[Any] = await TaskORM.async_select_by_where(
+                async_session=async_session,
+                where=_where,
+                offset=offset,
+                limit=limit,
+                is_desc=is_desc,
+                cursor=cursor,
+                columns=_LIST_COLUMNS,
+            )
+    except CursorError as err:
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.BAD_REQUEST,
+            message="Invalid cursor!",
+            description=str(err),
         )
-    else:
+
+    if not _where:
         _all_count = await table_stat_service.async_get_row_count(
             async_session=async_session,
             request_id=request_id,
@@ -72,14 +111,82 @@ async def async_get_list(
         )
 
     await async_log_mode(
-        message=f"[{request_id}] - Successfully retrieved task list.",
+        "[{}] - Successfully retrieved task list.",
+        request_id,
         level="SUCCESS",
         warn_mode=warn_mode,
     )
-    return _orm_tasks, _all_count
+    return _orm_tasks, _all_count, _is_estimated
 
 
-@validate_call(config={"arbitrary_types_allowed": True})
+async def async_export(
+    async_session: AsyncSession,
+    request_id: str,
+    export_format: ExportFormatEnum = ExportFormatEnum.ndjson,
+    is_desc: bool = config.db.select_is_desc,
+    chunk_size: int = config.db.stream_yield_per,
+    warn_mode: WarnEnum = WarnEnum.IGNORE,
+) -> AsyncGenerator[str, None]:
+    """Export all tasks as NDJSON or CSV text chunks, streamed from database with constant memory.
+
+    Args:
+        async_session (AsyncSession    , required): SQLAlchemy async_session for database connection.
+        request_id    (str             , required): ID of the request.
+        export_format (ExportFormatEnum, optional): Export format. Defaults to `ExportFormatEnum.ndjson`.
+        is_desc       (bool            , optional): Is descending or ascending. Defaults to `config.db.select_is_desc`.
+        chunk_size    (int             , optional): Number of tasks per yielded chunk. Defaults to `config.db.stream_yield_per`.
+        warn_mode     (WarnEnum        , optional): Warning mode. Defaults to `WarnEnum.IGNORE`.
+
+    Yields:
+        AsyncGenerator[str, None]: Text chunks of exported tasks.
+    """
+
+    await async_log_mode(
+        "[{}] - Exporting tasks as '{}'...",
+        request_id,
+        export_format.value,
+        warn_mode=warn_mode,
+    )
+
+    _buffer = io.StringIO()
+    _csv_writer = None
+    if export_format == ExportFormatEnum.csv:
+        _csv_writer = csv.DictWriter(_buffer, fieldnames=list(TaskPM.model_fields))
+        _csv_writer.writeheader()
+
+    _count = 0
+    async for _task_orm in TaskORM.async_stream_by_where(
+        async_session=async_session,
+        where=[],
+        is_desc=is_desc,
+        yield_per=chunk_size,
+    ):
+        _task_pm = TaskPM.model_validate(_task_orm)
+        if _csv_writer:
+            _csv_writer.writerow(_task_pm.model_dump(mode="json"))
+        else:
+            _buffer.write(_task_pm.model_dump_json())
+            _buffer.write("\n")
+
+        _count += 1
+        if (_count % chunk_size) == 0:
+            yield _buffer.getvalue()
+            _buffer.seek(0)
+            _buffer.truncate(0)
+
+    if _buffer.tell():
+        yield _buffer.getvalue()
+
+    await async_log_mode(
+        "[{}] - Successfully exported {} tasks.",
+        request_id,
+        _count,
+        level="SUCCESS",
+        warn_mode=warn_mode,
+    )
+
+
+@validate_internal_call(config={"arbitrary_types_allowed": True})
 async def async_create(
     async_session: AsyncSession,
     request_id: str,
@@ -103,9 +210,7 @@ async def async_create(
         TaskORM: New TaskORM model.
     """
 
-    await async_log_mode(
-        message=f"[{request_id}] - Creating task...", warn_mode=warn_mode
-    )
+    await async_log_mode("[{}] - Creating task...", request_id, warn_mode=warn_mode)
 
     _task_orm: TaskORM
     try:
@@ -116,7 +221,9 @@ async def async_create(
         )
 
         await async_log_mode(
-            message=f"[{request_id}] - Successfully created task with '{_task_orm.id}' ID.",
+            "[{}] - Successfully created task with '{}' ID.",
+            request_id,
+            _task_orm.id,
             level="SUCCESS",
             warn_mode=warn_mode,
         )
@@ -130,7 +237,7 @@ async def async_create(
     return _task_orm
 
 
-@validate_call(config={"arbitrary_types_allowed": True})
+@validate_internal_call(config={"arbitrary_types_allowed": True})
 async def async_get(
     async_session: AsyncSession,
     request_id: str,
@@ -153,7 +260,9 @@ async def async_get(
     """
 
     await async_log_mode(
-        message=f"[{request_id}] - Getting task with '{id}' ID...",
+        "[{}] - Getting task with '{}' ID...",
+        request_id,
+        id,
         warn_mode=warn_mode,
     )
 
@@ -162,7 +271,9 @@ async def async_get(
         _task_orm: TaskORM = await TaskORM.async_get(async_session=async_session, id=id)
 
         await async_log_mode(
-            message=f"[{request_id}] - Successfully retrieved task with '{id}' ID.",
+            "[{}] - Successfully retrieved task with '{}' ID.",
+            request_id,
+            id,
             level="SUCCESS",
             warn_mode=warn_mode,
         )
@@ -175,7 +286,7 @@ async def async_get(
     return _task_orm
 
 
-@validate_call(config={"arbitrary_types_allowed": True})
+@validate_internal_call(config={"arbitrary_types_allowed": True})
 async def async_update(
     async_session: AsyncSession,
     request_id: str,
@@ -205,7 +316,9 @@ async def async_update(
     """
 
     await async_log_mode(
-        message=f"[{request_id}] - Updating task with '{id}' ID...",
+        "[{}] - Updating task with '{}' ID...",
+        request_id,
+        id,
         warn_mode=warn_mode,
     )
 
@@ -216,7 +329,9 @@ async def async_update(
         )
 
         await async_log_mode(
-            message=f"[{request_id}] - Successfully updated task with '{id}' ID.",
+            "[{}] - Successfully updated task with '{}' ID.",
+            request_id,
+            id,
             level="SUCCESS",
             warn_mode=warn_mode,
         )
@@ -240,7 +355,7 @@ async def async_update(
     return _task_orm
 
 
-@validate_call(config={"arbitrary_types_allowed": True})
+@validate_internal_call(config={"arbitrary_types_allowed": True})
 async def async_delete(
     async_session: AsyncSession,
     request_id: str,
@@ -262,7 +377,9 @@ async def async_delete(
     """
 
     await async_log_mode(
-        message=f"[{request_id}] - Deleting task with '{id}' ID...",
+        "[{}] - Deleting task with '{}' ID...",
+        request_id,
+        id,
         warn_mode=warn_mode,
     )
 
@@ -272,7 +389,9 @@ async def async_delete(
         )
 
         await async_log_mode(
-            message=f"[{request_id}] - Successfully deleted task with '{id}' ID.",
+            "[{}] - Successfully deleted task with '{}' ID.",
+            request_id,
+            id,
             level="SUCCESS",
             warn_mode=warn_mode,
         )
@@ -287,6 +406,7 @@ async def async_delete(
 
 __all__ = [
     "async_get_list",
+    "async_export",
     "async_create",
     "async_get",
     "async_update",
@@ -1 +1,72 @@
 # -*- coding: utf-8 -*-
+
+import json
+from typing import Any, Dict, List
+
+import redis.asyncio as aioredis
+
+# Leaf module, `mixins` package may still be initializing when this backend is created:
+from api.core.models.mixins._cache_backend import BaseCacheBackend
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """Redis result cache backend, values are stored as JSON strings with TTL."""
+
+    name = "redis"
+
+    def __init__(self, url: str, key_prefix: str = "result_cache:", **kwargs):
+        """Constructor method for RedisCacheBackend class.
+
+        Args:
+            url        (str           , required): Redis connection URL.
+            key_prefix (str           , optional): Prefix of all cache keys. Defaults to "result_cache:".
+            **kwargs   (Dict[str, Any], optional): Additional keyword arguments for Redis client.
+        """
+
+        self.key_prefix = key_prefix
+        self.client: aioredis.Redis = aioredis.Redis.from_url(url, **kwargs)
+
+    async def async_get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        _values = await self.client.mget([f"{self.key_prefix}{_key}" for _key in keys])
+
+        _found = {}
+        for _key, _value in zip(keys, _values):
+            if _value is not None:
+                _found[_key] = json.loads(_value)
+
+        return _found
+
+    async def async_set_many(self, items: Dict[str, Dict[str, Any]], ttl: int) -> None:
+        async with self.client.pipeline(transaction=False) as _pipeline:
+            for _key, _value in items.items():
+                _pipeline.set(
+                    f"{self.key_prefix}{_key}",
+                    json.dumps(_value, default=str, ensure_ascii=False),
+                    ex=ttl,
+                )
+
+            await _pipeline.execute()
+
+        return
+
+    async def async_delete_many(self, keys: List[str]) -> None:
+        if keys:
+            await self.client.unlink(*[f"{self.key_prefix}{_key}" for _key in keys])
+
+        return
+
+    async def async_delete_prefix(self, prefix: str) -> None:
+        _keys = []
+        async for _key in self.client.scan_iter(match=f"{self.key_prefix}{prefix}*"):
+            _keys.append(_key)
+            if 500 <= len(_keys):
+                await self.client.unlink(*_keys)
+                _keys = []
+
+        if _keys:
+            await self.client.unlink(*_keys)
+
+        return
+
+
+__all__ = ["RedisCacheBackend"]
@@ -15,11 +15,12 @@ from api.databases.rdb import (
     # async_create_structure,
     async_close_db,
     async_write_engine,
-    async_read_engine,
+    read_router,
     engines,
     sessions,
 )
-from api.logger import logger
+from api.endpoints.table_stat.cache import row_count_cache
+from api.logger import logger, log_queue
 
 
 def pre_init() -> None:
@@ -86,8 +87,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
 
     await async_check_db(async_engine=async_write_engine)
-    await async_check_db(async_engine=async_read_engine, is_write_db=False)
+    # Unreachable read replicas are ejected instead of failing startup:
+    await read_router.async_start()
     # await async_create_structure(async_engine=async_write_engine)
+    if (
+        config.db.row_count_cache_listen
+        and row_count_cache.is_enabled
+        and (config.db.dialect == "postgresql")
+    ):
+        await row_count_cache.async_start_listener(
+            dsn_url=config.db.dsn_url.get_secret_value(),
+            channel=f"{config.db.prefix}table_stat",
+        )
     ## Add startup code here...
     logger.success("Finished preparation to startup.")
     logger.opt(colors=True).info(f"Version: <c>{config.version}</c>")
@@ -101,8 +112,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     logger.info("Praparing to shutdown...")
     ## Add shutdown code here...
+    await read_router.async_stop()
+    await row_count_cache.async_stop_listener()
     await async_close_db(sessions=sessions, engines=engines)
     logger.success("Finished preparation to shutdown.")
+    log_queue.close()
 
 
 __all__ = [
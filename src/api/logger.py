@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 
-from pydantic import validate_call
-from fastapi.concurrency import run_in_threadpool
+import os
+import sys
+import queue
+import atexit
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
+from loguru._recattrs import RecordFile, RecordThread
 from beans_logging import Logger, LoggerLoader
 from beans_logging_fastapi import (
     add_http_file_handler,
@@ -43,82 +48,304 @@ if config.logger.extra.http_json_enabled:
     )
 
 
-@validate_call
+class AsyncLogQueue:
+    """Bounded queue of log records, drained in batches by a single background writer thread
+    into configured logger handlers, so async callers don't wait for handlers or thread pool.
+    Caller (module, function, line and thread) is captured on enqueue, so written records
+    report the caller instead of the writer thread.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        full_policy: str = "drop",
+        batch_size: int = 256,
+        block_timeout: float = 0.01,
+    ):
+        """Constructor method for AsyncLogQueue class.
+
+        Args:
+            max_size      (int  , optional): Maximum number of queued records. Defaults to 10_000.
+            full_policy   (str  , optional): Policy when queue is full: "drop" or "block". Defaults to "drop".
+            batch_size    (int  , optional): Maximum number of records written per batch. Defaults to 256.
+            block_timeout (float, optional): Max seconds to wait for free space with "block" policy. Defaults to 0.01.
+
+        Raises:
+            ValueError: If `full_policy` is unknown.
+        """
+
+        if full_policy not in ("drop", "block"):
+            raise ValueError(f"Unknown log queue full policy: '{full_policy}'")
+
+        self.full_policy = full_policy
+        self.batch_size = batch_size
+        self.block_timeout = block_timeout
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.errors = 0
+        self._queue: queue.Queue[Optional[Tuple[str, str, tuple, tuple]]] = (
+            queue.Queue(maxsize=max_size)
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._caller: Optional[tuple] = None
+        self._logger = logger.patch(self._patch_record)
+
+    def put(self, level: str, message: str, *args: Any, depth: int = 0) -> bool:
+        """Enqueue log record without waiting for handlers.
+        With "drop" policy full queue drops the record, with "block" policy caller waits for free space
+        at most `block_timeout` seconds (caller may be the event loop), then the record is dropped.
+
+        Args:
+            level   (str, required): Log level name.
+            message (str, required): Message or message template to log.
+            *args   (Any, optional): Arguments of message template, formatted by writer thread.
+            depth   (int, optional): Number of frames above caller of `put()` to report as caller. Defaults to 0.
+
+        Returns:
+            bool: True if record is enqueued, False if dropped.
+        """
+
+        if self._thread is None:
+            self._start()
+
+        _frame = sys._getframe(depth + 1)
+        _thread = threading.current_thread()
+        _caller = (
+            _frame.f_globals.get("__name__"),
+            _frame.f_code.co_name,
+            _frame.f_code.co_filename,
+            _frame.f_lineno,
+            _thread.ident,
+            _thread.name,
+        )
+        _record = (level, message, args, _caller)
+        try:
+            self._queue.put_nowait(_record)
+        except queue.Full:
+            if self.full_policy == "drop":
+                self.dropped += 1
+                return False
+
+            try:
+                self._queue.put(_record, timeout=self.block_timeout)
+            except queue.Full:
+                self.dropped += 1
+                return False
+
+        self.enqueued += 1
+        return True
+
+    def _patch_record(self, record: dict) -> None:
+        if self._caller is None:
+            return
+
+        _name, _function, _file_path, _line, _thread_id, _thread_name = self._caller
+        _file_name = os.path.basename(_file_path)
+        record["name"] = _name
+        record["module"] = os.path.splitext(_file_name)[0]
+        record["function"] = _function
+        record["file"] = RecordFile(_file_name, _file_path)
+        record["line"] = _line
+        record["thread"] = RecordThread(_thread_id, _thread_name)
+        return
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="log-queue-writer", daemon=True
+                )
+                self._thread.start()
+
+        return
+
+    def _run(self) -> None:
+        _is_closed = False
+        while not _is_closed:
+            _batch = [self._queue.get()]
+            while len(_batch) < self.batch_size:
+                try:
+                    _batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for _record in _batch:
+                # Records enqueued after close sentinel are still written:
+                if _record is None:
+                    _is_closed = True
+                    continue
+
+                try:
+                    self._caller = _record[3]
+                    self._logger.log(_record[0], _record[1], *_record[2])
+                    self.written += 1
+                except Exception:
+                    self.errors += 1
+                finally:
+                    self._caller = None
+
+            self.batches += 1
+            for _ in _batch:
+                self._queue.task_done()
+
+        return
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Write remaining records and stop background writer thread.
+
+        Args:
+            timeout (Optional[float], optional): Seconds to wait for writer thread. Defaults to 5.0.
+        """
+
+        with self._lock:
+            _thread = self._thread
+            self._thread = None
+
+        if (_thread is not None) and _thread.is_alive():
+            self._queue.put(None)
+            _thread.join(timeout=timeout)
+
+        return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get log queue statistics.
+
+        Returns:
+            Dict[str, Any]: Queue size, enqueued, written, dropped, batches and errors counts.
+        """
+
+        _stats = {
+            "size": self._queue.qsize(),
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "errors": self.errors,
+        }
+        return _stats
+
+
+log_queue = AsyncLogQueue(
+    max_size=config.logger.extra.queue_max_size,
+    full_policy=config.logger.extra.queue_full_policy,
+    batch_size=config.logger.extra.queue_batch_size,
+    block_timeout=config.logger.extra.queue_block_timeout,
+)
+atexit.register(log_queue.close)
+
+
+_LOG_MODE_LEVELS = ("INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL", "TRACE")
+_LEVEL_NOS: Dict[str, int] = {}
+
+
+def is_level_enabled(level: str) -> bool:
+    """Check if any logger handler accepts level, to skip building suppressed messages.
+
+    Args:
+        level (str, required): Log level name.
+
+    Raises:
+        ValueError: If `level` doesn't exist.
+
+    Returns:
+        bool: True if level is enabled.
+    """
+
+    _level_no = _LEVEL_NOS.get(level)
+    if _level_no is None:
+        _level_no = logger.level(level).no
+        _LEVEL_NOS[level] = _level_no
+
+    # Loguru keeps minimum level of all handlers in its core:
+    return getattr(logger._core, "min_level", 0) <= _level_no
+
+
+def _get_mode_level(level: str, warn_mode: WarnEnum) -> Optional[str]:
+    if warn_mode == WarnEnum.ALWAYS:
+        level = level.upper()
+        if level not in _LOG_MODE_LEVELS:
+            raise ValueError(f"Unknown log level: '{level}'")
+    elif warn_mode == WarnEnum.DEBUG:
+        level = "DEBUG"
+    else:
+        return None
+
+    if not is_level_enabled(level):
+        return None
+
+    return level
+
+
 def log_mode(
-    message: str, level: str = "INFO", warn_mode: WarnEnum = WarnEnum.ALWAYS
+    message: Union[str, Callable[[], str]],
+    *args: Any,
+    level: str = "INFO",
+    warn_mode: WarnEnum = WarnEnum.ALWAYS,
 ) -> None:
     """Log message with level and warn mode.
+    Message is formatted (`message.format(*args)` or `message()`) only if level is enabled.
 
     Args:
-        message   (str,          reqiured): Message to log.
-        level     (LogLevelEnum, optional): Log level when warn mode is `WarnEnum.ALWAYS`. Defaults to "INFO".
-        warn_mode (WarnEnum,     optional): Warn mode to use. Defaults to `WarnEnum.ALWAYS`.
+        message   (Union[str, Callable], required): Message or message template to log, or callable returning it.
+        *args     (Any                 , optional): Arguments of message template.
+        level     (str                 , optional): Log level when warn mode is `WarnEnum.ALWAYS`. Defaults to "INFO".
+        warn_mode (WarnEnum            , optional): Warn mode to use. Defaults to `WarnEnum.ALWAYS`.
 
     Raises:
         ValueError: If `level` is not a valid log level.
     """
 
-    level = level.upper()
-    if warn_mode == WarnEnum.ALWAYS:
-        if level == "INFO":
-            logger.info(message)
-        elif level == "SUCCESS":
-            logger.success(message)
-        elif level == "WARNING":
-            logger.warning(message)
-        elif level == "ERROR":
-            logger.error(message)
-        elif level == "CRITICAL":
-            logger.critical(message)
-        elif level == "TRACE":
-            logger.trace(message)
-        else:
-            raise ValueError(f"Unknown log level: '{level}'")
+    level = _get_mode_level(level=level, warn_mode=warn_mode)
+    if level is None:
+        return
 
-    elif warn_mode == WarnEnum.DEBUG:
-        logger.debug(message)
+    if callable(message):
+        message = message()
 
+    logger.opt(depth=1).log(level, message, *args)
     return
 
 
-@validate_call
 async def async_log_mode(
-    message: str, level: str = "INFO", warn_mode: WarnEnum = WarnEnum.ALWAYS
+    message: Union[str, Callable[[], str]],
+    *args: Any,
+    level: str = "INFO",
+    warn_mode: WarnEnum = WarnEnum.ALWAYS,
 ) -> None:
     """Log message with level and warn mode in async mode.
+    Record is enqueued into `log_queue` only if level is enabled, message template is formatted
+    by background writer thread.
 
     Args:
-        message   (str     , required): Message to log.
-        level     (str     , optional): Log level when warn mode is `WarnEnum.ALWAYS`. Defaults to "INFO".
-        warn_mode (WarnEnum, optional): Warn mode to use. Defaults to `WarnEnum.ALWAYS`.
+        message   (Union[str, Callable], required): Message or message template to log, or callable returning it.
+        *args     (Any                 , optional): Arguments of message template.
+        level     (str                 , optional): Log level when warn mode is `WarnEnum.ALWAYS`. Defaults to "INFO".
+        warn_mode (WarnEnum            , optional): Warn mode to use. Defaults to `WarnEnum.ALWAYS`.
+
+    Raises:
+        ValueError: If `level` is not a valid log level.
     """
 
-    level = level.upper()
-    if warn_mode == WarnEnum.ALWAYS:
-        if level == "INFO":
-            await run_in_threadpool(logger.info, message)
-        elif level == "SUCCESS":
-            await run_in_threadpool(logger.success, message)
-        elif level == "WARNING":
-            await run_in_threadpool(logger.warning, message)
-        elif level == "ERROR":
-            await run_in_threadpool(logger.error, message)
-        elif level == "CRITICAL":
-            await run_in_threadpool(logger.critical, message)
-        elif level == "TRACE":
-            await run_in_threadpool(logger.trace, message)
-        else:
-            raise ValueError(f"Unknown log level: '{level}'")
+    level = _get_mode_level(level=level, warn_mode=warn_mode)
+    if level is None:
+        return
 
-    elif warn_mode == WarnEnum.DEBUG:
-        await run_in_threadpool(logger.debug, message)
+    if callable(message):
+        message = message()
 
+    log_queue.put(level, message, *args, depth=1)
     return
 
 
 __all__ = [
     "logger_loader",
     "logger",
+    "AsyncLogQueue",
+    "log_queue",
+    "is_level_enabled",
     "log_mode",
     "async_log_mode",
 ]
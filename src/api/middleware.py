@@ -13,7 +13,11 @@ from beans_logging_fastapi import (
 )
 
 from api.config import config
-from api.core.middlewares import ProcessTimeMiddleware, RequestIdMiddleware
+from api.core.middlewares import (
+    ProcessTimeMiddleware,
+    RequestIdMiddleware,
+    ReadPinMiddleware,
+)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -25,6 +29,11 @@ def add_middlewares(app: FastAPI) -> None:
     """
 
     ## Add more middlewares here...
+    app.add_middleware(
+        ReadPinMiddleware,
+        secret=config.api.security.read_pin.secret.get_secret_value(),
+        window=config.db.read_pin_window,
+    )
     app.add_middleware(ResponseHTTPInfoMiddleware)
     app.add_middleware(
         HttpAccessLogMiddleware,
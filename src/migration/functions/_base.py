@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from typing import Optional
+
 from pydantic import validate_call
 from alembic import op
 
@@ -100,6 +102,68 @@ def create_fn_stat_count(table_name: str) -> None:
     return
 
 
+@validate_call
+def create_fn_sharded_stat_count(
+    table_name: str, slot_count: int = 16, notify_channel: Optional[str] = None
+) -> None:
+    """Create function to update sharded stat count for stat table by statement-level triggers.
+    Each statement adds row count of its transition table to one of `slot_count` slot rows
+    (by backend PID), so concurrent writers don't serialize on a single stat row.
+    With `notify_channel` the changed table name is sent by `pg_notify()` on commit
+    (deduplicated per transaction) to invalidate cached row counts.
+
+    Args:
+        table_name     (str          , required): Name of the stat table.
+        slot_count     (int          , optional): Number of slot rows per table. Defaults to 16.
+        notify_channel (Optional[str], optional): Channel name to notify on changes. Defaults to None.
+    """
+
+    _notify_sql = ""
+    if notify_channel:
+        _notify_sql = f"PERFORM pg_notify('{notify_channel}', TG_TABLE_NAME);"
+
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION fn_tr__update_stat_count()
+        RETURNS TRIGGER AS $BODY$
+        DECLARE
+            v_count BIGINT;
+            v_slot SMALLINT := pg_backend_pid() % {slot_count};
+        BEGIN
+            IF (TG_OP = 'INSERT') THEN
+                SELECT COUNT(*) INTO v_count FROM new_rows;
+            ELSE
+                SELECT COUNT(*) INTO v_count FROM old_rows;
+            END IF;
+
+            IF (v_count = 0) THEN
+                RETURN NULL;
+            END IF;
+
+            IF (TG_OP = 'INSERT') THEN
+                INSERT INTO "{table_name}" ("table_name", "slot", "insert_count", "row_count")
+                VALUES (TG_TABLE_NAME, v_slot, v_count, v_count)
+                ON CONFLICT ("table_name", "slot") DO UPDATE
+                SET "insert_count" = "{table_name}"."insert_count" + EXCLUDED."insert_count",
+                    "row_count" = "{table_name}"."row_count" + EXCLUDED."row_count";
+            ELSE
+                INSERT INTO "{table_name}" ("table_name", "slot", "delete_count", "row_count")
+                VALUES (TG_TABLE_NAME, v_slot, v_count, -v_count)
+                ON CONFLICT ("table_name", "slot") DO UPDATE
+                SET "delete_count" = "{table_name}"."delete_count" + EXCLUDED."delete_count",
+                    "row_count" = "{table_name}"."row_count" + EXCLUDED."row_count";
+            END IF;
+
+            {_notify_sql}
+            RETURN NULL;
+        END;
+        $BODY$ LANGUAGE plpgsql;
+        """
+    )
+
+    return
+
+
 def drop_fn_all() -> None:
     """Drop function to generate primary key for table."""
 
@@ -115,5 +179,6 @@ __all__ = [
     "create_fn_generate_pk",
     "create_fn_updated_at",
     "create_fn_stat_count",
+    "create_fn_sharded_stat_count",
     "drop_fn_all",
 ]
@@ -87,8 +87,79 @@ def create_tr_stat_count(table_names: Union[List[str], str]) -> None:
     return
 
 
+@validate_call
+def create_tr_sharded_stat_count(table_names: Union[List[str], str]) -> None:
+    """Create statement-level triggers (with transition tables) to update sharded stat count table for table(s).
+
+    Args:
+        table_names (Union[List[str], str], required): List of table names or a table name.
+    """
+
+    if isinstance(table_names, str):
+        table_names = [table_names]
+
+    for _table_name in table_names:
+        op.execute(
+            f"""
+            CREATE OR REPLACE TRIGGER tr__insert_stat_count__{_table_name}
+            AFTER INSERT ON "{_table_name}"
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION fn_tr__update_stat_count();
+            """
+        )
+
+        op.execute(
+            f"""
+            CREATE OR REPLACE TRIGGER tr__delete_stat_count__{_table_name}
+            AFTER DELETE ON "{_table_name}"
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION fn_tr__update_stat_count();
+            """
+        )
+
+        op.execute(
+            f"""
+            CREATE OR REPLACE TRIGGER tr__truncate_stat_count__{_table_name}
+            AFTER TRUNCATE ON "{_table_name}"
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION fn_tr__truncate_stat_count();
+            """
+        )
+
+    return
+
+
+@validate_call
+def drop_tr_stat_count(table_names: Union[List[str], str]) -> None:
+    """Drop row-level and statement-level triggers of stat count table for table(s).
+
+    Args:
+        table_names (Union[List[str], str], required): List of table names or a table name.
+    """
+
+    if isinstance(table_names, str):
+        table_names = [table_names]
+
+    for _table_name in table_names:
+        for _trigger_name in (
+            "tr__update_stat_count",
+            "tr__insert_stat_count",
+            "tr__delete_stat_count",
+            "tr__truncate_stat_count",
+        ):
+            op.execute(
+                f'DROP TRIGGER IF EXISTS {_trigger_name}__{_table_name} ON "{_table_name}";'
+            )
+
+    return
+
+
 __all__ = [
     "create_tr_generate_pk",
     "create_tr_updated_at",
     "create_tr_stat_count",
+    "create_tr_sharded_stat_count",
+    "drop_tr_stat_count",
 ]
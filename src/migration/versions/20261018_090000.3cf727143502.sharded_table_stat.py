@@ -0,0 +1,143 @@
+"""Sharded table stat counters.
+
+Revision ID: 3cf727143502
+Revises: aaf11408f3f8
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from alembic import context
+
+from migration import functions
+from migration import triggers
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3cf727143502"
+down_revision: Union[str, None] = "aaf11408f3f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_STAT_TABLE_NAME = "fot_table_stat"
+_STAT_TABLE_NAMES = [
+    "fot_task",
+]
+_SLOT_COUNT = 16
+
+
+def upgrade() -> None:
+    schema_upgrades()
+    if context.get_x_argument(as_dictionary=True).get("data", None):
+        data_upgrades()
+
+    return
+
+
+def downgrade() -> None:
+    if context.get_x_argument(as_dictionary=True).get("data", None):
+        data_downgrades()
+    schema_downgrades()
+
+    return
+
+
+def schema_upgrades() -> None:
+    """schema upgrade migrations go here."""
+
+    ## Row-level triggers lock the single stat row of the table per inserted/deleted row:
+    triggers.drop_tr_stat_count(table_names=_STAT_TABLE_NAMES + [_STAT_TABLE_NAME])
+
+    # Existing counters become slot 0 of each table:
+    op.add_column(
+        _STAT_TABLE_NAME,
+        sa.Column(
+            "slot", sa.SmallInteger(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+    op.drop_constraint(
+        op.f("uq__fot_table_stat__table_name"), _STAT_TABLE_NAME, type_="unique"
+    )
+    op.create_unique_constraint(
+        op.f("uq__fot_table_stat__table_name"),
+        _STAT_TABLE_NAME,
+        ["table_name", "slot"],
+    )
+
+    ## Functions
+    functions.create_fn_sharded_stat_count(
+        table_name=_STAT_TABLE_NAME, slot_count=_SLOT_COUNT
+    )
+
+    ## Triggers
+    triggers.create_tr_sharded_stat_count(table_names=_STAT_TABLE_NAMES)
+
+    return
+
+
+def schema_downgrades() -> None:
+    """schema downgrade migrations go here."""
+
+    triggers.drop_tr_stat_count(table_names=_STAT_TABLE_NAMES)
+
+    # Merge slot rows of each table into slot 0 before dropping `slot` column:
+    op.execute(
+        f"""
+        UPDATE "{_STAT_TABLE_NAME}" AS t
+        SET "insert_count" = s."insert_count",
+            "delete_count" = s."delete_count",
+            "row_count" = s."row_count"
+        FROM (
+            SELECT "table_name",
+                SUM("insert_count") AS "insert_count",
+                SUM("delete_count") AS "delete_count",
+                SUM("row_count") AS "row_count"
+            FROM "{_STAT_TABLE_NAME}"
+            GROUP BY "table_name"
+        ) AS s
+        WHERE (t."table_name" = s."table_name") AND (t."slot" = (
+            SELECT MIN("slot") FROM "{_STAT_TABLE_NAME}" WHERE "table_name" = t."table_name"
+        ));
+        """
+    )
+    op.execute(
+        f"""
+        DELETE FROM "{_STAT_TABLE_NAME}" AS t
+        WHERE t."slot" <> (
+            SELECT MIN("slot") FROM "{_STAT_TABLE_NAME}" WHERE "table_name" = t."table_name"
+        );
+        """
+    )
+
+    op.drop_constraint(
+        op.f("uq__fot_table_stat__table_name"), _STAT_TABLE_NAME, type_="unique"
+    )
+    op.drop_column(_STAT_TABLE_NAME, "slot")
+    op.create_unique_constraint(
+        op.f("uq__fot_table_stat__table_name"), _STAT_TABLE_NAME, ["table_name"]
+    )
+
+    ## Functions
+    functions.create_fn_stat_count(table_name=_STAT_TABLE_NAME)
+
+    ## Triggers
+    triggers.create_tr_stat_count(table_names=_STAT_TABLE_NAMES + [_STAT_TABLE_NAME])
+
+    return
+
+
+def data_upgrades() -> None:
+    """Add any optional data upgrade migrations here!"""
+
+    return
+
+
+def data_downgrades() -> None:
+    """Add any optional data downgrade migrations here!"""
+
+    return
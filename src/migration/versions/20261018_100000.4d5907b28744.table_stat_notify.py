@@ -0,0 +1,80 @@
+"""Notify table stat changes.
+
+Revision ID: 4d5907b28744
+Revises: 3cf727143502
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from alembic import context
+
+from migration import functions
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d5907b28744"
+down_revision: Union[str, None] = "3cf727143502"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_STAT_TABLE_NAME = "fot_table_stat"
+_SLOT_COUNT = 16
+
+
+def upgrade() -> None:
+    schema_upgrades()
+    if context.get_x_argument(as_dictionary=True).get("data", None):
+        data_upgrades()
+
+    return
+
+
+def downgrade() -> None:
+    if context.get_x_argument(as_dictionary=True).get("data", None):
+        data_downgrades()
+    schema_downgrades()
+
+    return
+
+
+def schema_upgrades() -> None:
+    """schema upgrade migrations go here."""
+
+    ## Functions
+    # Channel is listened by row count cache of API (`db.row_count_cache_listen`):
+    functions.create_fn_sharded_stat_count(
+        table_name=_STAT_TABLE_NAME,
+        slot_count=_SLOT_COUNT,
+        notify_channel=_STAT_TABLE_NAME,
+    )
+
+    return
+
+
+def schema_downgrades() -> None:
+    """schema downgrade migrations go here."""
+
+    ## Functions
+    functions.create_fn_sharded_stat_count(
+        table_name=_STAT_TABLE_NAME, slot_count=_SLOT_COUNT
+    )
+
+    return
+
+
+def data_upgrades() -> None:
+    """Add any optional data upgrade migrations here!"""
+
+    return
+
+
+def data_downgrades() -> None:
+    """Add any optional data downgrade migrations here!"""
+
+    return
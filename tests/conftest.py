@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 import logging
 
 import pytest
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.api.endpoints.task.model import TaskORM
 
 
 logger = logging.getLogger(__name__)
@@ -17,3 +22,38 @@ def setup_and_teardown():
 
     # Equivalent of tearDown
     logger.info("Tearing down!")
+
+
+@pytest.fixture(scope="module")
+def event_loop():
+    _loop = asyncio.new_event_loop()
+    yield _loop
+    _loop.close()
+
+
+@pytest.fixture
+def orm_classes() -> list:
+    # Override in test module to create tables of other ORM classes:
+    return [TaskORM]
+
+
+@pytest.fixture
+def async_engine(event_loop, orm_classes: list) -> AsyncEngine:
+    _engine = create_async_engine("sqlite+aiosqlite://")
+
+    async def _async_create_tables() -> None:
+        async with _engine.begin() as _connection:
+            # Tables only, indexes may be registered twice when `main` app is imported:
+            for _orm_class in orm_classes:
+                await _connection.execute(CreateTable(_orm_class.__table__))
+
+    event_loop.run_until_complete(_async_create_tables())
+    yield _engine
+    event_loop.run_until_complete(_engine.dispose())
+
+
+@pytest.fixture
+def async_session(event_loop, async_engine: AsyncEngine) -> AsyncSession:
+    _async_session = AsyncSession(async_engine)
+    yield _async_session
+    event_loop.run_until_complete(_async_session.close())
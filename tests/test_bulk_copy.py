@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+from sqlalchemy.dialects import postgresql
+
+from src.api.endpoints.task.model import TaskORM
+
+
+def test_copy_plan_columns_types_and_defaults():
+    _columns, _types, _rows = TaskORM._get_copy_plan(
+        raw_data=[
+            {"id": "tas1", "name": "Task 1"},
+            {"id": "tas2", "name": "Task 2", "point": 90},
+        ],
+        dialect=postgresql.dialect(),
+    )
+
+    assert [_column.name for _column in _columns] == ["id", "name", "point"]
+    assert _types == ["varchar", "varchar", "integer"]
+    assert _rows == [("tas1", "Task 1", 70), ("tas2", "Task 2", 90)]
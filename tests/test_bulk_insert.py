@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import importlib
+
+import pytest
+from sqlalchemy import String, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.endpoints.task.model import TaskORM
+
+# Module of `BaseORM` which `TaskORM` is built on (imported without `src.` prefix by app):
+models = importlib.import_module(TaskORM.__mro__[1].__module__)
+
+
+class ServerIdTaskORM(models.BaseORM):
+    # SQLite stand-in of `fn_tr__generate_pk` trigger:
+    id: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        server_default=text("(lower(hex(randomblob(16))))"),
+        sort_order=-100,
+    )
+    name: Mapped[str] = mapped_column(String(64), nullable=False)
+
+
+_ORM_CLASSES = {"client": TaskORM, "server": ServerIdTaskORM}
+
+
+@pytest.fixture
+def orm_classes() -> list:
+    return list(_ORM_CLASSES.values())
+
+
+async def _async_bulk_insert(
+    async_session: AsyncSession, id_source: str, count: int = 1_000
+) -> list:
+    _orm_objects = await _ORM_CLASSES[id_source].async_bulk_insert(
+        async_session=async_session,
+        raw_data=[{"name": f"Task {_i}"} for _i in range(count)],
+        id_source=id_source,
+    )
+    _ids = [_orm_object.id for _orm_object in _orm_objects]
+    await async_session.rollback()
+    return _ids
+
+
+def test_bulk_insert_server_ids(event_loop, async_session):
+    _ids = event_loop.run_until_complete(
+        _async_bulk_insert(async_session=async_session, id_source="server", count=10)
+    )
+    assert len(set(_ids)) == 10
+    assert all(_id and (len(_id) == 32) for _id in _ids)
+
+    with pytest.raises(ValueError):
+        event_loop.run_until_complete(
+            ServerIdTaskORM.async_bulk_insert(
+                async_session=async_session,
+                raw_data=[{"name": "Task"}],
+                method="copy",
+                id_source="server",
+            )
+        )
+
+
+@pytest.mark.benchmark(group="bulk_insert_ids")
+@pytest.mark.parametrize("id_source", ["client", "server"])
+def test_benchmark_bulk_insert_ids(
+    benchmark, event_loop, async_session, id_source: str
+):
+    benchmark(
+        lambda: event_loop.run_until_complete(
+            _async_bulk_insert(async_session=async_session, id_source=id_source)
+        )
+    )
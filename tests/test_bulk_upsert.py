@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.endpoints.task.model import TaskORM
+
+
+def test_upsert_stmt_set_whitelist_and_batch_size():
+    _stmt = TaskORM._get_upsert_stmt(
+        columns=["id", "name", "point"], update_columns=["name"], returning=True
+    )
+    _sql = str(_stmt.compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT (id) DO UPDATE SET name = excluded.name" in _sql
+    assert "point = excluded.point" not in _sql
+    assert "RETURNING" in _sql
+
+    assert TaskORM._get_bulk_batch_size(num_columns=3) == 65_535 // 3
+
+
+def test_upsert_stmt_without_returning_on_mysql():
+    _stmt = TaskORM._get_upsert_stmt(
+        columns=["id", "name", "abstract"],
+        update_columns=["name"],
+        returning=True,
+        dialect="mysql",
+    )
+    _sql = str(_stmt.compile(dialect=mysql.dialect()))
+
+    assert "ON DUPLICATE KEY UPDATE name = VALUES(name)" in _sql
+    assert "RETURNING" not in _sql
+
+
+async def _async_bulk_upsert(monkeypatch, async_session: AsyncSession) -> tuple:
+    _invalidated_ids = []
+
+    async def _async_invalidate_cache(cls, async_session, ids=None) -> None:
+        _invalidated_ids.append(ids)
+
+    monkeypatch.setattr(
+        TaskORM, "_async_invalidate_cache", classmethod(_async_invalidate_cache)
+    )
+    monkeypatch.setattr(
+        TaskORM, "_get_bulk_batch_size", classmethod(lambda cls, num_columns: 2)
+    )
+    _orm_objects = await TaskORM.async_bulk_upsert(
+        async_session=async_session,
+        raw_data=[{"name": f"Task {_i}"} for _i in range(5)],
+    )
+    _ids = [_orm_object.id for _orm_object in _orm_objects]
+
+    # Re-select of upserted rows (MySQL and MariaDB):
+    _stmt, _params = TaskORM._get_upserted_stmt(
+        raw_data=[{"id": _id} for _id in _ids[:3]]
+    )
+    _result = await async_session.execute(_stmt, _params)
+    _selected_ids = {_orm_object.id for _orm_object in _result.scalars().all()}
+    return _ids, _invalidated_ids, _selected_ids
+
+
+def test_bulk_upsert_batches(monkeypatch, event_loop, async_session):
+    _ids, _invalidated_ids, _selected_ids = event_loop.run_until_complete(
+        _async_bulk_upsert(monkeypatch=monkeypatch, async_session=async_session)
+    )
+    assert len(_ids) == 5
+    # Cache is invalidated once after all batches:
+    assert _invalidated_ids == [_ids]
+    assert _selected_ids == set(_ids[:3])
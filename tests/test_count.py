@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.endpoints.task.model import TaskORM
+
+
+async def _async_counts(async_session: AsyncSession) -> tuple:
+    _where = {"column": "point", "value": 70}
+    _counts = (
+        await TaskORM.async_count_by_where(async_session=async_session, where=_where),
+        await TaskORM.async_count_by_where(
+            async_session=async_session, where=_where, approximate=True
+        ),
+        await TaskORM.async_count(async_session=async_session, approximate=True),
+    )
+    return _counts
+
+
+def test_approximate_count(monkeypatch, event_loop, async_session):
+    event_loop.run_until_complete(
+        TaskORM.async_bulk_insert(
+            async_session=async_session,
+            raw_data=[{"name": f"Task {_i}", "point": 70} for _i in range(3)],
+            returning=False,
+            auto_commit=True,
+        )
+    )
+    # SQLite has no planner estimate, exact count is used:
+    assert event_loop.run_until_complete(_async_counts(async_session)) == (3, 3, 3)
+
+    async def _async_estimate(cls, **kwargs) -> int:
+        return 1_000_000
+
+    monkeypatch.setattr(
+        TaskORM, "async_estimate_count_by_where", classmethod(_async_estimate)
+    )
+    assert event_loop.run_until_complete(_async_counts(async_session)) == (
+        3,
+        1_000_000,
+        1_000_000,
+    )
+
+
+async def _async_count_in_filter(async_session: AsyncSession) -> int:
+    await TaskORM.async_bulk_insert(
+        async_session=async_session,
+        raw_data=[{"name": f"Task {_i}"} for _i in range(3)],
+        returning=False,
+    )
+    _count = await TaskORM.async_count_by_where(
+        async_session=async_session,
+        where={"column": "name", "op": "in", "value": ["Task 0", "Task 2"]},
+        approximate=True,
+    )
+    return _count
+
+
+def test_approximate_count_in_filter_fallback(monkeypatch, event_loop, async_session):
+    async def _async_estimate(cls, **kwargs) -> int:
+        raise RuntimeError("EXPLAIN failed")
+
+    # Failed estimate falls back to exact count in the same transaction:
+    monkeypatch.setattr(
+        TaskORM, "async_estimate_count_by_where", classmethod(_async_estimate)
+    )
+    assert event_loop.run_until_complete(_async_count_in_filter(async_session)) == 2
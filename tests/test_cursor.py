@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+from types import SimpleNamespace
+from datetime import datetime, timezone
+
+import pytest
+
+from src.api.endpoints.task.model import TaskORM
+
+
+def test_cursor_round_trip():
+    _row = SimpleNamespace(
+        id="tas1701388800_a0dc99d68d5e427eafe00525fac47012",
+        created_at=datetime(2024, 12, 1, tzinfo=timezone.utc),
+    )
+    _cursor = TaskORM.encode_cursor(
+        orm_object=_row, order_by="created_at", is_desc=True, is_prev=True
+    )
+
+    _values, _is_prev = TaskORM.decode_cursor(
+        cursor=_cursor, order_by="created_at", is_desc=True
+    )
+    assert _values == [_row.created_at, _row.id]
+    assert _is_prev is True
+
+
+def test_cursor_rejects_tampered_or_mismatched():
+    _row = SimpleNamespace(id="tas1701388800_a0dc99d68d5e427eafe00525fac47012")
+    _cursor = TaskORM.encode_cursor(orm_object=_row, is_desc=True)
+
+    with pytest.raises(ValueError):
+        TaskORM.decode_cursor(cursor=f"{_cursor[:-2]}xx", is_desc=True)
+
+    with pytest.raises(ValueError):
+        TaskORM.decode_cursor(cursor=_cursor, is_desc=False)
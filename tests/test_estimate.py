@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.endpoints.task import service
+from src.api.endpoints.task.model import TaskORM
+
+_WHERE = [
+    {"column": "name", "op": "in", "value": ["Task 0", "Task 1"]},
+    {"column": "point", "value": 70},
+]
+
+
+def test_estimate_stmt_expands_in_filter():
+    _dialect = postgresql.psycopg.dialect()
+    _sql, _params = TaskORM._get_estimate_stmt(where=_WHERE, dialect=_dialect)
+    assert _sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "POSTCOMPILE" not in _sql
+    assert _params == {"w_0_1": "Task 0", "w_0_2": "Task 1", "w_1": 70}
+
+    # Cached statement shape is rendered with values of each call:
+    _where = [dict(_WHERE[0], value=["A", "B", "C"]), dict(_WHERE[1], value=1)]
+    _sql, _params = TaskORM._get_estimate_stmt(where=_where, dialect=_dialect)
+    assert "%(w_0_3)s" in _sql
+    assert _params == {"w_0_1": "A", "w_0_2": "B", "w_0_3": "C", "w_1": 1}
+
+
+async def _async_select_with_count(async_session: AsyncSession) -> tuple:
+    _orm_objects, _count, _is_estimated = (
+        await TaskORM.async_select_with_count_by_where(
+            async_session=async_session, where=_WHERE, estimate_count=True
+        )
+    )
+    return len(_orm_objects), _count, _is_estimated
+
+
+def test_select_with_count_estimate(monkeypatch, event_loop, async_session):
+    event_loop.run_until_complete(
+        TaskORM.async_bulk_insert(
+            async_session=async_session,
+            raw_data=[{"name": f"Task {_i}", "point": 70} for _i in range(3)],
+            returning=False,
+        )
+    )
+
+    def _select_with_count() -> tuple:
+        return event_loop.run_until_complete(_async_select_with_count(async_session))
+
+    assert _select_with_count() == (2, 2, False)
+
+    async def _async_failed_estimate(cls, **kwargs) -> int:
+        raise RuntimeError("EXPLAIN failed")
+
+    # Failed estimate falls back to exact count in the same transaction:
+    monkeypatch.setattr(
+        TaskORM, "async_estimate_count_by_where", classmethod(_async_failed_estimate)
+    )
+    assert _select_with_count() == (2, 2, False)
+
+    async def _async_estimate(cls, **kwargs) -> int:
+        return 1_000_000
+
+    monkeypatch.setattr(
+        TaskORM, "async_estimate_count_by_where", classmethod(_async_estimate)
+    )
+    assert _select_with_count() == (2, 1_000_000, True)
+
+
+async def _async_get_list(async_session: AsyncSession, **kwargs) -> tuple:
+    _orm_tasks, _all_count, _is_estimated = await service.async_get_list(
+        async_session=async_session, request_id="test", point=70, **kwargs
+    )
+    return len(_orm_tasks), _all_count, _is_estimated
+
+
+def test_get_list_count_estimate_opt_in(monkeypatch, event_loop, async_session):
+    event_loop.run_until_complete(
+        TaskORM.async_bulk_insert(
+            async_session=async_session,
+            raw_data=[{"name": f"Task {_i}", "point": 70} for _i in range(3)],
+            returning=False,
+        )
+    )
+
+    async def _async_estimate(cls, **kwargs) -> int:
+        return 1_000_000
+
+    monkeypatch.setattr(
+        TaskORM, "async_estimate_count_by_where", classmethod(_async_estimate)
+    )
+
+    # Exact total by default, estimate only when asked for:
+    assert event_loop.run_until_complete(_async_get_list(async_session)) == (
+        3,
+        3,
+        False,
+    )
+    assert event_loop.run_until_complete(
+        _async_get_list(async_session, approximate_count=True)
+    ) == (3, 1_000_000, True)
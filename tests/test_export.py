@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+import csv
+import json
+import importlib
+from types import SimpleNamespace
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.core.constants import ExportFormatEnum
+from src.api.endpoints.task import service
+from src.api.endpoints.task.model import TaskORM
+
+_router = importlib.import_module("src.api.endpoints.task.router")
+
+
+async def _async_export(
+    async_session: AsyncSession, export_format: ExportFormatEnum
+) -> tuple:
+    await TaskORM.async_bulk_insert(
+        async_session=async_session,
+        raw_data=[{"name": f"Task {_i}", "point": 50 - _i * 10} for _i in range(5)],
+        returning=False,
+    )
+    await async_session.commit()
+
+    _names = [
+        _orm_object.name
+        async for _orm_object in TaskORM.async_stream_by_where(
+            async_session=async_session,
+            where={"column": "point", "op": "lt", "value": 50},
+            order_by="point",
+            is_desc=False,
+            yield_per=2,
+        )
+    ]
+    _chunks = [
+        _chunk
+        async for _chunk in service.async_export(
+            async_session=async_session,
+            request_id="test",
+            export_format=export_format,
+            chunk_size=2,
+        )
+    ]
+    return _names, _chunks
+
+
+def test_stream_by_where(event_loop, async_session):
+    _names, _ = event_loop.run_until_complete(
+        _async_export(
+            async_session=async_session, export_format=ExportFormatEnum.ndjson
+        )
+    )
+    assert _names == ["Task 4", "Task 3", "Task 2", "Task 1"]
+
+
+def test_export_ndjson(event_loop, async_session):
+    _, _chunks = event_loop.run_until_complete(
+        _async_export(
+            async_session=async_session, export_format=ExportFormatEnum.ndjson
+        )
+    )
+
+    # 5 tasks in chunks of 2 rows:
+    assert [_chunk.count("\n") for _chunk in _chunks] == [2, 2, 1]
+    _tasks = [json.loads(_line) for _line in "".join(_chunks).splitlines()]
+    assert sorted(_task["name"] for _task in _tasks) == [
+        f"Task {_i}" for _i in range(5)
+    ]
+    assert all(_task["id"] for _task in _tasks)
+
+
+def test_export_csv(event_loop, async_session):
+    _, _chunks = event_loop.run_until_complete(
+        _async_export(async_session=async_session, export_format=ExportFormatEnum.csv)
+    )
+
+    # Header is written into the first chunk:
+    assert _chunks[0].startswith("id,")
+    _rows = list(csv.DictReader("".join(_chunks).splitlines()))
+    assert len(_chunks) == 3
+    assert sorted((_row["name"], _row["point"]) for _row in _rows) == [
+        (f"Task {_i}", str(50 - _i * 10)) for _i in range(5)
+    ]
+
+
+def test_export_closes_unread_stream(monkeypatch, event_loop, async_engine):
+    # Class of the app module (imported without `src.` prefix by dependencies):
+    _read_router = type(_router.db_deps.read_router)(
+        primary_async_engine=async_engine,
+        read_async_engines=[],
+        fallback_limit=1,
+    )
+    monkeypatch.setattr(_router.db_deps, "read_router", _read_router)
+    _request = SimpleNamespace(
+        state=SimpleNamespace(request_id="test", read_pinned=False)
+    )
+
+    async def _async_export_unread() -> tuple:
+        _response = await _router.export_tasks(
+            request=_request, export_format=ExportFormatEnum.ndjson, is_desc=True
+        )
+        _in_use = _read_router.fallback_in_use
+
+        # Response body is never iterated (e.g. client disconnected before first chunk):
+        await _response.background()
+        return _in_use, _read_router.fallback_in_use
+
+    assert event_loop.run_until_complete(_async_export_unread()) == (1, 0)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+import uuid
+import importlib
+
+import pytest
+
+from src.api.core.utils import TimeOrderedIdGenerator
+from src.api.endpoints.task.model import TaskORM
+
+# Module of `BaseMixin` which `TaskORM` is built on (imported without `src.` prefix by app):
+mixins_base = importlib.import_module(TaskORM._get_id_strategy.__func__.__module__)
+
+
+def test_time_ordered_ids():
+    _generator = TimeOrderedIdGenerator(node_id=7)
+
+    _ints = _generator.gen_uuid7_ints(count=10_000)
+    assert _ints == sorted(_ints)
+    assert len(set(_ints)) == len(_ints)
+
+    _uuid = _generator.gen_uuid7()
+    assert (_uuid.version == 7) and (_uuid.variant == uuid.RFC_4122)
+    assert _ints[-1] < _uuid.int
+
+    _ids = _generator.gen_int_ids(count=10_000)
+    assert _ids == sorted(_ids)
+    assert len(set(_ids)) == len(_ids)
+    assert max(_ids).bit_length() <= 63
+    assert all(((_id >> 12) & 0x3FF) == 7 for _id in _ids)
+
+    with pytest.raises(ValueError):
+        TimeOrderedIdGenerator(node_id=1024)
+
+
+def test_gen_unique_ids_strategy(monkeypatch):
+    monkeypatch.setattr(TaskORM, "__id_strategy__", "uuid7")
+    monkeypatch.setattr(mixins_base, "_ID_STRATEGIES", {})
+
+    _ids = TaskORM.gen_unique_ids(count=100)
+    assert _ids == sorted(_ids)
+    assert all(_id.startswith("tas") and (len(_id) == 35) for _id in _ids)
+    assert TaskORM.gen_unique_id() > _ids[-1]
+
+    monkeypatch.setattr(TaskORM, "__id_strategy__", "unique")
+    monkeypatch.setattr(mixins_base, "_ID_STRATEGIES", {})
+    _id = TaskORM.gen_unique_id()
+    assert _id.startswith("tas") and ("_" in _id)
+
+
+@pytest.mark.benchmark(group="gen_unique_ids")
+@pytest.mark.parametrize("strategy", ["unique", "uuid7"])
+def test_benchmark_gen_unique_ids(benchmark, monkeypatch, strategy: str):
+    monkeypatch.setattr(TaskORM, "__id_strategy__", strategy)
+    monkeypatch.setattr(mixins_base, "_ID_STRATEGIES", {})
+    benchmark(TaskORM.gen_unique_ids, count=1_000)
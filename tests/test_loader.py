@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from types import SimpleNamespace
+
+from src.api.core.models.mixins import DataLoader
+
+
+class _FakeORM:
+    calls = []
+
+    @classmethod
+    async def async_get_by_ids(cls, async_session, ids, warn_mode):
+        cls.calls.append(ids)
+        return [SimpleNamespace(id=_id) for _id in ids if _id != "missing"]
+
+
+def test_loader_batches_and_memoizes():
+    async def _run():
+        _loader = DataLoader(async_session=None)
+        _results = await asyncio.gather(
+            _loader.load(orm_class=_FakeORM, id="a"),
+            _loader.load(orm_class=_FakeORM, id="b"),
+            _loader.load(orm_class=_FakeORM, id="a"),
+            _loader.load(orm_class=_FakeORM, id="missing"),
+        )
+        assert [_result and _result.id for _result in _results] == [
+            "a",
+            "b",
+            "a",
+            None,
+        ]
+        assert _FakeORM.calls == [["a", "b", "missing"]]
+
+        assert (await _loader.load(orm_class=_FakeORM, id="b")).id == "b"
+        assert len(_FakeORM.calls) == 1
+
+    asyncio.run(_run())
+
+
+class _SessionBoundORM:
+    active = 0
+    calls = []
+
+    @classmethod
+    async def async_get_by_ids(cls, async_session, ids, warn_mode):
+        # Same session must not run concurrent queries:
+        assert _SessionBoundORM.active == 0
+        _SessionBoundORM.active += 1
+        await asyncio.sleep(0.01)
+        _SessionBoundORM.active -= 1
+        _SessionBoundORM.calls.append((cls.__name__, ids))
+        return [SimpleNamespace(id=_id) for _id in ids]
+
+
+class _FirstORM(_SessionBoundORM):
+    pass
+
+
+class _SecondORM(_SessionBoundORM):
+    pass
+
+
+def test_loader_runs_batches_sequentially():
+    async def _run():
+        _loader = DataLoader(async_session=None)
+        _results = await asyncio.gather(
+            _loader.load(orm_class=_FirstORM, id="a"),
+            _loader.load(orm_class=_SecondORM, id="b"),
+            _loader.load(orm_class=_FirstORM, id="c"),
+        )
+        assert [_result.id for _result in _results] == ["a", "b", "c"]
+        assert _SessionBoundORM.calls == [
+            ("_FirstORM", ["a", "c"]),
+            ("_SecondORM", ["b"]),
+        ]
+        assert _loader.get_stats()["batches"] == 2
+
+    asyncio.run(_run())
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+from pydantic import validate_call
+from fastapi.concurrency import run_in_threadpool
+
+from src.api.logger import (
+    AsyncLogQueue,
+    async_log_mode,
+    is_level_enabled,
+    log_queue,
+    logger,
+)
+from src.api.core.constants import WarnEnum
+
+
+@validate_call
+async def _async_log_mode_baseline(
+    message: str, level: str = "INFO", warn_mode: WarnEnum = WarnEnum.ALWAYS
+) -> None:
+    # Previous implementation: validated arguments and thread pool hop per call.
+    if warn_mode == WarnEnum.ALWAYS:
+        await run_in_threadpool(logger.log, level.upper(), message)
+    elif warn_mode == WarnEnum.DEBUG:
+        await run_in_threadpool(logger.debug, message)
+
+
+async def _async_crud_path_baseline(request_id: str, task_id: str) -> None:
+    for _action in ("Creating", "Getting", "Updating", "Deleting"):
+        logger.info(f"[{request_id}] - {_action} task with '{task_id}' ID...")
+        await _async_log_mode_baseline(
+            message=f"[{request_id}] - {_action} task with '{task_id}' ID...",
+            warn_mode=WarnEnum.ALWAYS,
+        )
+        await _async_log_mode_baseline(
+            message=f"[{request_id}] - Successfully done task with '{task_id}' ID.",
+            level="SUCCESS",
+            warn_mode=WarnEnum.ALWAYS,
+        )
+        logger.success(f"[{request_id}] - Successfully done task with '{task_id}' ID.")
+
+
+async def _async_crud_path(request_id: str, task_id: str) -> None:
+    for _action in ("Creating", "Getting", "Updating", "Deleting"):
+        logger.info("[{}] - {} task with '{}' ID...", request_id, _action, task_id)
+        await async_log_mode(
+            "[{}] - {} task with '{}' ID...",
+            request_id,
+            _action,
+            task_id,
+            warn_mode=WarnEnum.ALWAYS,
+        )
+        await async_log_mode(
+            "[{}] - Successfully done task with '{}' ID.",
+            request_id,
+            task_id,
+            level="SUCCESS",
+            warn_mode=WarnEnum.ALWAYS,
+        )
+        logger.success(
+            "[{}] - Successfully done task with '{}' ID.", request_id, task_id
+        )
+
+
+@pytest.fixture
+def info_disabled(monkeypatch):
+    # Same as all handlers configured with WARNING level:
+    monkeypatch.setattr(logger._core, "min_level", logger.level("WARNING").no)
+
+
+def test_log_queue_drop_policy_counters():
+    _log_queue = AsyncLogQueue(max_size=2, full_policy="drop", batch_size=8)
+    for _i in range(1_000):
+        _log_queue.put("INFO", "Record {}", _i)
+
+    _log_queue.close()
+    _stats = _log_queue.get_stats()
+    assert _stats["enqueued"] == _stats["written"]
+    assert _stats["written"] + _stats["dropped"] == 1_000
+    assert _stats["size"] == 0
+
+    with pytest.raises(ValueError):
+        AsyncLogQueue(full_policy="wait")
+
+
+def test_log_queue_block_policy_timeout(monkeypatch):
+    _log_queue = AsyncLogQueue(max_size=1, full_policy="block", block_timeout=0.01)
+    # Writer thread is not started, so the queue stays full:
+    monkeypatch.setattr(_log_queue, "_start", lambda: None)
+    assert _log_queue.put("INFO", "Record {}", 1)
+    assert not _log_queue.put("INFO", "Record {}", 2)
+    assert _log_queue.get_stats()["dropped"] == 1
+
+
+def _log_from_caller(log_queue: AsyncLogQueue) -> None:
+    log_queue.put("ERROR", "Caller {}.", "record", depth=1)
+
+
+def test_log_queue_caller_and_close():
+    _records = []
+    _handler_id = logger.add(
+        lambda _message: _records.append(_message.record), format="{message}"
+    )
+    try:
+        _log_queue = AsyncLogQueue(batch_size=8)
+        _log_from_caller(log_queue=_log_queue)
+        _log_queue.close()
+
+        # Records batched after close sentinel are still written:
+        _log_queue = AsyncLogQueue(batch_size=8)
+        _log_queue._queue.put(("ERROR", "Before close.", (), None))
+        _log_queue._queue.put(None)
+        _log_queue._queue.put(("ERROR", "After close.", (), None))
+        _log_queue._start()
+        _log_queue._thread.join(timeout=5)
+    finally:
+        logger.remove(_handler_id)
+
+    _record = _records[0]
+    assert _record["message"] == "Caller record."
+    assert _record["function"] == "test_log_queue_caller_and_close"
+    assert _record["file"].path == __file__
+    assert _record["thread"].name == "MainThread"
+    assert [_record["message"] for _record in _records[1:]] == [
+        "Before close.",
+        "After close.",
+    ]
+    assert _log_queue.get_stats()["size"] == 0
+
+
+def test_async_log_mode_skips_disabled_levels(info_disabled):
+    _enqueued = log_queue.enqueued
+    asyncio.run(async_log_mode("Skipped {}.", "record", level="info"))
+    asyncio.run(async_log_mode("Queued {}.", "record", level="error"))
+    asyncio.run(async_log_mode(lambda: 1 / 0, warn_mode=WarnEnum.IGNORE))
+    assert not is_level_enabled("INFO")
+    assert log_queue.enqueued == _enqueued + 1
+
+    with pytest.raises(ValueError):
+        asyncio.run(async_log_mode("Unknown.", level="VERBOSE"))
+
+
+@pytest.mark.benchmark(group="crud_path_logging")
+@pytest.mark.parametrize("baseline", [True, False], ids=["eager", "lazy"])
+def test_benchmark_crud_path_info_disabled(benchmark, info_disabled, baseline: bool):
+    _crud_path = _async_crud_path_baseline if baseline else _async_crud_path
+    _loop = asyncio.new_event_loop()
+    try:
+        benchmark(
+            lambda: _loop.run_until_complete(
+                _crud_path(
+                    request_id="c5b2a4d1e8f04c4e9b0f6a3d2e1c0b9a",
+                    task_id="tas1701388800_dc2cc6c9033c4837b6c34c8bb19bb289",
+                )
+            )
+        )
+    finally:
+        _loop.close()
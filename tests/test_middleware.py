@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+import time
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.api.middleware import add_middlewares
+from src.api.core.middlewares import ProcessTimeMiddleware, RequestIdMiddleware
+
+
+class _BaselineRequestIdMiddleware(BaseHTTPMiddleware):
+    # Previous implementation based on `BaseHTTPMiddleware`.
+    async def dispatch(self, request: Request, call_next):
+        _request_id: str = uuid4().hex
+        if "X-Request-ID" in request.headers:
+            _request_id: str = request.headers.get("X-Request-ID")
+        elif "X-Correlation-ID" in request.headers:
+            _request_id: str = request.headers.get("X-Correlation-ID")
+
+        request.state.request_id = _request_id
+        _response = await call_next(request)
+        _response.headers["X-Request-ID"] = _request_id
+        return _response
+
+
+class _BaselineProcessTimeMiddleware(BaseHTTPMiddleware):
+    # Previous implementation based on `BaseHTTPMiddleware`.
+    async def dispatch(self, request: Request, call_next):
+        _start_time: int = time.perf_counter_ns()
+        _response = await call_next(request)
+        _response_time = round((time.perf_counter_ns() - _start_time) / 1_000_000, 1)
+        _response.headers["X-Process-Time"] = str(_response_time)
+        return _response
+
+
+_BASELINE_MIDDLEWARES = {
+    RequestIdMiddleware: _BaselineRequestIdMiddleware,
+    ProcessTimeMiddleware: _BaselineProcessTimeMiddleware,
+}
+
+
+def _create_app(baseline: bool = False, isolated: bool = False) -> FastAPI:
+    _app = FastAPI()
+
+    @_app.get("/ping")
+    async def _ping(request: Request):
+        return PlainTextResponse(request.state.request_id)
+
+    if isolated:
+        # Only the rewritten middlewares, without logging middlewares and sinks:
+        _app.add_middleware(ProcessTimeMiddleware)
+        _app.add_middleware(RequestIdMiddleware)
+    else:
+        add_middlewares(app=_app)
+
+    if baseline:
+        _app.user_middleware = [
+            Middleware(
+                _BASELINE_MIDDLEWARES.get(_middleware.cls, _middleware.cls),
+                *_middleware.args,
+                **_middleware.kwargs,
+            )
+            for _middleware in _app.user_middleware
+        ]
+
+    return _app
+
+
+async def _async_request(app: FastAPI, headers: list) -> dict:
+    _scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost")] + headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 80),
+    }
+    _messages = []
+
+    async def _receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def _send(message):
+        _messages.append(message)
+
+    await app(_scope, _receive, _send)
+    _response = {
+        "headers": dict(_messages[0]["headers"]),
+        "body": b"".join(_message.get("body", b"") for _message in _messages[1:]),
+    }
+    return _response
+
+
+@pytest.mark.parametrize("isolated", [False, True])
+@pytest.mark.parametrize("baseline", [False, True])
+def test_middlewares_inject_headers(event_loop, baseline: bool, isolated: bool):
+    _app = _create_app(baseline=baseline, isolated=isolated)
+
+    _response = event_loop.run_until_complete(
+        _async_request(_app, headers=[(b"x-correlation-id", b"corr_12345678")])
+    )
+    assert _response["body"] == b"corr_12345678"
+    assert _response["headers"][b"x-request-id"] == b"corr_12345678"
+    assert float(_response["headers"][b"x-process-time"]) >= 0
+
+    _response = event_loop.run_until_complete(_async_request(_app, headers=[]))
+    assert len(_response["headers"][b"x-request-id"]) == 32
+
+
+@pytest.mark.benchmark(group="middleware_isolated")
+@pytest.mark.parametrize("baseline", [True, False], ids=["base_http", "pure_asgi"])
+def test_benchmark_middlewares(benchmark, event_loop, baseline: bool):
+    _app = _create_app(baseline=baseline, isolated=True)
+    benchmark(lambda: event_loop.run_until_complete(_async_request(_app, headers=[])))
+
+
+@pytest.mark.benchmark(group="middleware_stack")
+@pytest.mark.parametrize("baseline", [True, False], ids=["base_http", "pure_asgi"])
+def test_benchmark_middleware_stack(benchmark, event_loop, baseline: bool):
+    _app = _create_app(baseline=baseline)
+    benchmark(lambda: event_loop.run_until_complete(_async_request(_app, headers=[])))
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+import dataclasses
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.api.endpoints.task.model import TaskORM
+
+
+def test_projection_select_stmt_and_row_class():
+    _columns, _row_class = TaskORM.get_row_class(columns=["name", "point"])
+    assert _columns == ("id", "name", "point")
+    assert TaskORM.get_row_class(columns=["id", "name", "point"])[1] is _row_class
+
+    _stmt, _ = TaskORM._get_select_stmt(columns=_columns)
+    _sql = str(_stmt.compile(dialect=postgresql.dialect()))
+    assert _sql.startswith(
+        f"SELECT {TaskORM.__tablename__}.id, {TaskORM.__tablename__}.name, {TaskORM.__tablename__}.point \nFROM"
+    )
+
+    _row = _row_class("task_0001", "Task 1", 10)
+    assert not hasattr(_row, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        _row.name = "Task 2"
+
+    with pytest.raises(ValueError):
+        TaskORM.get_row_class(columns=["not_exists"])
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.api.databases.rdb import ReplicaRouter, ReadUnavailableError
+from src.api.core import utils
+from src.api.core.middlewares import ReadPinMiddleware
+from src.api.core.dependencies import db as db_deps
+
+
+def _create_router(router_class: type = ReplicaRouter, **kwargs) -> ReplicaRouter:
+    _router = router_class(
+        primary_async_engine=create_async_engine("sqlite+aiosqlite://"),
+        read_async_engines=[
+            create_async_engine("sqlite+aiosqlite://"),
+            create_async_engine("sqlite+aiosqlite://"),
+            # Unreachable replica:
+            create_async_engine("sqlite+aiosqlite:////not_exists/replica.db"),
+        ],
+        **kwargs,
+    )
+    return _router
+
+
+async def _async_read(router: ReplicaRouter, use_primary: bool = False):
+    async with router.async_session(use_primary=use_primary) as _session:
+        await _session.execute(text("SELECT 1"))
+        return _session.bind
+
+
+def test_replica_router_balance_and_ejection():
+    _router = _create_router()
+    _replicas = [_router.pick() for _ in range(6)]
+    assert _replicas == _router.replicas * 2
+
+    asyncio.run(_router.async_check_all())
+    _healthy, _unreachable = _router.replicas[:2], _router.replicas[2]
+    assert (not _unreachable.is_healthy) and (_unreachable.ejections == 1)
+    assert {_router.pick() for _ in range(4)} == set(_healthy)
+
+    asyncio.run(_async_read(router=_router, use_primary=True))
+    assert (_router.primary_reads == 1) and (_router.fallbacks == 0)
+
+    for _healthy_replica in _healthy:
+        _healthy_replica.is_healthy = False
+
+    asyncio.run(_async_read(router=_router))
+    assert (_router.primary_reads == 1) and (_router.fallbacks == 1)
+
+
+def test_replica_router_least_connections():
+    _router = _create_router(balance="least_connections")
+
+    async def _async_open_two():
+        async with _router.async_session() as _first:
+            async with _router.async_session() as _second:
+                assert _first.bind is not _second.bind
+                assert [_replica.in_use for _replica in _router.replicas[:2]] == [1, 1]
+
+    asyncio.run(_async_open_two())
+    assert all(_replica.in_use == 0 for _replica in _router.replicas)
+
+
+def test_replica_router_circuit_breaker():
+    _router = _create_router(failure_threshold=2, reset_timeout=1, fallback_limit=1)
+    _unreachable = _router.replicas[2]
+    for _replica in _router.replicas[:2]:
+        _replica.is_healthy = False
+
+    # Failed replica falls back to the primary in the same call:
+    asyncio.run(_async_read(router=_router))
+    assert (_unreachable.failures == 1) and (not _unreachable.is_open)
+    asyncio.run(_async_read(router=_router))
+    assert _unreachable.is_open and (_unreachable.opens == 1)
+    assert _router.fallbacks == 2
+
+    # Open breaker is skipped, no more connection attempts:
+    asyncio.run(_async_read(router=_router))
+    assert (_unreachable.failures == 2) and (_router.fallbacks == 3)
+
+    async def _async_exceed_fallback_limit():
+        async with _router.async_session():
+            with pytest.raises(ReadUnavailableError):
+                async with _router.async_session():
+                    pass
+
+    _router.fallback_timeout = 0.01
+    asyncio.run(_async_exceed_fallback_limit())
+    assert _router.get_stats()["fallback_rejects"] == 1
+
+    # Recovered replica closes breaker after `reset_timeout`:
+    _unreachable.async_engine = _router.replicas[0].async_engine
+    asyncio.run(_router.async_check_replica(replica=_unreachable))
+    assert _unreachable.is_open
+    _unreachable.opened_at -= 1
+    asyncio.run(_router.async_check_replica(replica=_unreachable))
+    assert (not _unreachable.is_open) and (_unreachable.failures == 0)
+    assert _router.pick() is _unreachable
+
+
+def test_read_pin_middleware():
+    _app = FastAPI()
+
+    @_app.post("/write")
+    async def _write(request: Request):
+        request.state.db_written = True
+        return {"read_pinned": request.state.read_pinned}
+
+    @_app.get("/read")
+    async def _read(request: Request):
+        return {"read_pinned": request.state.read_pinned}
+
+    _secret = "READ_PIN_SECRET123"
+    _app.add_middleware(ReadPinMiddleware, secret=_secret, window=5)
+    _client = TestClient(_app)
+
+    assert _client.get("/read").json() == {"read_pinned": False}
+
+    _response = _client.post("/write")
+    _token = _response.headers["X-Read-Pin"]
+    assert "read_pin" in _response.cookies
+
+    # Pin cookie is sent back by client:
+    assert _client.get("/read").json() == {"read_pinned": True}
+    assert TestClient(_app).get("/read", headers={"X-Read-Pin": _token}).json() == {
+        "read_pinned": True
+    }
+
+    # Unsigned, forged, too long and other tokens are rejected:
+    _until = time.time() + 5
+    for _value in [
+        f"{_until:.3f}",
+        utils.encode_cursor(payload={"read_pin": _until}, key="OTHER_SECRET123"),
+        utils.encode_cursor(payload={"read_pin": _until + 3600}, key=_secret),
+        utils.encode_cursor(payload={"id": "1"}, key=_secret),
+        f"{_token}x",
+    ]:
+        assert TestClient(_app).get("/read", headers={"X-Read-Pin": _value}).json() == {
+            "read_pinned": False
+        }
+
+
+def test_open_read_unavailable(monkeypatch):
+    # Class of the app module (imported without `src.` prefix by dependencies):
+    _router = _create_router(router_class=type(db_deps.read_router), fallback_limit=0)
+    for _replica in _router.replicas:
+        _replica.is_healthy = False
+
+    monkeypatch.setattr(db_deps, "read_router", _router)
+    _request = SimpleNamespace(state=SimpleNamespace(read_pinned=False))
+
+    async def _async_open_read():
+        async with db_deps.async_open_read(request=_request):
+            pass
+
+    with pytest.raises(HTTPException) as _exc_info:
+        asyncio.run(_async_open_read())
+
+    assert _exc_info.value.status_code == 503
+    assert "Retry-After" in _exc_info.value.headers
+    assert _router.fallback_rejects == 1
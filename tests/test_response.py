@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import json
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+
+from src.api.core.responses import BaseResponse, build_list_data
+from src.api.endpoints.task.model import TaskORM
+from src.api.endpoints.task.schemas import TaskPM, ResTasksPM
+
+
+def test_fast_render_keeps_json_shape():
+    _now = datetime(2024, 12, 1, 10, 30, tzinfo=timezone.utc)
+    _tasks = [
+        TaskORM(
+            id=f"tas1701388800_{_i:032x}",
+            name=f"Task {_i}",
+            point=_i * 10,
+            updated_at=_now,
+            created_at=_now,
+        )
+        for _i in range(3)
+    ]
+
+    _response = BaseResponse(
+        message="Successfully retrieved task list.",
+        content=_tasks,
+        links={"next": "/api/v1/tasks?cursor=abc"},
+        meta={"list_count": 3, "all_count": 3},
+        response_schema=ResTasksPM,
+    )
+
+    _response_pm = ResTasksPM(
+        message="Successfully retrieved task list.",
+        data=_tasks,
+        links={"next": "/api/v1/tasks?cursor=abc"},
+        meta=json.loads(_response.body)["meta"],
+    )
+    _expected = json.dumps(
+        jsonable_encoder(obj=_response_pm, by_alias=True),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    assert _response.body == _expected
+
+    # Items without `build_list_data()` still get self links from `TasksPM`:
+    for _task, _item in zip(_tasks, json.loads(_response.body)["data"]):
+        assert _item["links"]["self"].endswith(f"/tasks/{_task.id}")
+
+
+def test_build_list_data_self_links():
+    _now = datetime(2024, 12, 1, 10, 30, tzinfo=timezone.utc)
+    _, _row_class = TaskORM.get_row_class(columns=list(TaskPM.model_fields))
+    _rows = [
+        _row_class(f"tas1701388800_{_i:032x}", f"Task {_i}", _i * 10, _now, _now)
+        for _i in range(3)
+    ]
+
+    _data = build_list_data(
+        items=_rows, fields=TaskPM.model_fields, base_url="/api/v1/tasks/"
+    )
+    assert _data == build_list_data(
+        items=_data, fields=TaskPM.model_fields, base_url="/api/v1/tasks"
+    )
+
+    _response_pm = ResTasksPM(message="OK", data=_data)
+    for _row, _task_pm in zip(_rows, _response_pm.data):
+        assert _task_pm.id == _row.id
+        assert _task_pm.links.self_link == f"/api/v1/tasks/{_row.id}"
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import asyncio
+import subprocess
+
+from src.api.core.models.mixins import MemoryCacheBackend, ResultCache
+from src.api.externals.redis import RedisCacheBackend
+
+
+def test_result_cache_lru_ttl_and_invalidation():
+    async def _run():
+        _cache = ResultCache(backend=MemoryCacheBackend(max_size=2))
+        await _cache.async_set_many(
+            items={"t:1": {"id": "1"}, "t:2": {"id": "2"}, "t:3": {"id": "3"}},
+            ttl=60,
+        )
+        assert await _cache.async_get_many(keys=["t:1", "t:2", "t:3"]) == {
+            "t:2": {"id": "2"},
+            "t:3": {"id": "3"},
+        }
+
+        await _cache.async_invalidate(keys=["t:2"])
+        assert await _cache.async_get_many(keys=["t:2"]) == {}
+
+        await _cache.async_invalidate(keys="t:")
+        await _cache.async_set_many(items={"t:4": {"id": "4"}}, ttl=0)
+        assert await _cache.async_get_many(keys=["t:3", "t:4"]) == {}
+
+        _stats = _cache.get_stats()
+        assert (_stats["hits"], _stats["misses"], _stats["size"]) == (2, 4, 0)
+
+    asyncio.run(_run())
+
+
+def test_result_cache_redis_backend():
+    # Fresh interpreter with app imports, `redis` backend is created while `mixins` package is initializing:
+    _env = {
+        **os.environ,
+        "FOT_DB_RESULT_CACHE_BACKEND": "redis",
+        "FOT_DB_RESULT_CACHE_REDIS_URL": "redis://localhost:6379/0",
+    }
+    _code = (
+        "import src;"
+        "from api.core.models.mixins import result_cache;"
+        "print(type(result_cache.backend).__name__, result_cache.get_stats()['backend'])"
+    )
+    _result = subprocess.run(
+        [sys.executable, "-c", _code],
+        env=_env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert _result.returncode == 0, _result.stderr
+    assert _result.stdout.split()[-2:] == ["RedisCacheBackend", "redis"]
+
+    _backend = RedisCacheBackend(url="redis://localhost:6379/0", key_prefix="test:")
+    assert (_backend.name == "redis") and (_backend.get_size() is None)
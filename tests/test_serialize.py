@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+import json
+import importlib
+from datetime import datetime, date, time, timezone
+
+import pytest
+from sqlalchemy import Date, String, Time, inspect
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.api.endpoints.task.model import TaskORM
+
+# Module of `BaseORM` which `TaskORM` is built on (imported without `src.` prefix by app):
+models = importlib.import_module(TaskORM.__mro__[1].__module__)
+
+
+class ScheduleORM(models.BaseORM):
+    name: Mapped[str] = mapped_column(String(64), nullable=False)
+    due_date: Mapped[date] = mapped_column(Date)
+    due_time: Mapped[time] = mapped_column(Time)
+
+
+def _create_tasks(count: int):
+    _now = datetime(2024, 12, 1, tzinfo=timezone.utc)
+    _tasks = [
+        TaskORM(
+            id=f"tas1701388800_{_i:032x}",
+            name=f"Task {_i}",
+            point=_i % 100,
+            updated_at=_now,
+            created_at=_now,
+        )
+        for _i in range(count)
+    ]
+    return _tasks
+
+
+def _to_json_list_baseline(orm_objects) -> str:
+    # Previous implementation: inspect + getattr per column and stdlib JSON.
+    _dict_list = []
+    for _orm_object in orm_objects:
+        _dict = {}
+        for _column in inspect(_orm_object).mapper.column_attrs:
+            _dict[_column.key] = getattr(_orm_object, _column.key)
+
+        _dict_list.append(_dict)
+
+    return json.dumps(_dict_list, default=str, ensure_ascii=False)
+
+
+def test_to_json_keeps_values():
+    _task = _create_tasks(1)[0]
+
+    assert _task.to_dict(excludes=["point"]) == {
+        "id": _task.id,
+        "name": _task.name,
+        "updated_at": _task.updated_at,
+        "created_at": _task.created_at,
+    }
+    _json = json.loads(_task.to_json())
+    assert _json["name"] == _task.name
+    # Datetimes are written by `str()` (space separator):
+    assert _json["created_at"] == str(_task.created_at)
+    assert json.loads(TaskORM.to_json_list(orm_objects=[_task])) == [_json]
+
+
+def test_coerce_column_value():
+    _now = datetime(2024, 12, 1, 9, 30, tzinfo=timezone.utc)
+    _values = {
+        "created_at": (str(_now), _now),
+        "due_date": (str(_now.date()), _now.date()),
+        "due_time": (str(_now.time()), _now.time()),
+    }
+
+    for _column, (_value, _expected) in _values.items():
+        assert ScheduleORM._coerce_column_value(column=_column, value=_value) == (
+            _expected
+        )
+
+
+@pytest.mark.benchmark(group="to_json_list")
+def test_benchmark_to_json_list_baseline(benchmark):
+    _tasks = _create_tasks(5_000)
+    benchmark(_to_json_list_baseline, _tasks)
+
+
+@pytest.mark.benchmark(group="to_json_list")
+def test_benchmark_to_json_list(benchmark):
+    _tasks = _create_tasks(5_000)
+    benchmark(TaskORM.to_json_list, orm_objects=_tasks)
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+from src.api.endpoints.task.model import TaskORM
+
+
+def test_stmt_cache_reuses_statement_by_shape():
+    _stmt_1, _params_1 = TaskORM._get_select_stmt(
+        where=[{"column": "name", "value": "first"}], limit=10
+    )
+    _stats = TaskORM.get_stmt_cache_stats()
+
+    _stmt_2, _params_2 = TaskORM._get_select_stmt(
+        where=[{"column": "name", "value": "second"}], limit=20, offset=5
+    )
+    assert _stmt_2 is _stmt_1
+    assert _params_1 == {"w_0": "first", "limit_": 10, "offset_": 0}
+    assert _params_2 == {"w_0": "second", "limit_": 20, "offset_": 5}
+    assert TaskORM.get_stmt_cache_stats()["hits"] == _stats["hits"] + 1
+
+    _stmt_3, _ = TaskORM._get_select_stmt(
+        where=[{"column": "name", "value": None}], limit=10
+    )
+    assert _stmt_3 is not _stmt_1
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import importlib
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.endpoints.table_stat.cache import RowCountCache
+
+# Model module imported without `src.` prefix (same as app), so table is defined in metadata only once:
+TableStatORM = importlib.import_module("api.endpoints.table_stat.model").TableStatORM
+
+
+@pytest.fixture
+def orm_classes() -> list:
+    return [TableStatORM]
+
+
+async def _async_get_row_counts(async_session: AsyncSession) -> tuple:
+    await TableStatORM.async_bulk_insert(
+        async_session=async_session,
+        raw_data=[
+            {"table_name": "fot_task", "slot": 0, "row_count": 10},
+            {"table_name": "fot_task", "slot": 3, "row_count": 5},
+            {"table_name": "fot_task", "slot": 7, "row_count": -2},
+            {"table_name": "fot_other", "slot": 0, "row_count": 1},
+        ],
+        returning=False,
+        auto_commit=True,
+    )
+
+    _row_counts = (
+        await TableStatORM.async_get_row_count(
+            async_session=async_session, table_name="fot_task"
+        ),
+        await TableStatORM.async_get_row_count(
+            async_session=async_session, table_name="fot_missing"
+        ),
+    )
+    return _row_counts
+
+
+def test_sharded_row_count(event_loop, async_session):
+    _row_counts = event_loop.run_until_complete(_async_get_row_counts(async_session))
+    assert _row_counts == (13, 0)
+
+
+async def _async_get_cached_counts(cache: RowCountCache) -> tuple:
+    _loads = []
+
+    async def _async_load() -> int:
+        _loads.append(1)
+        await asyncio.sleep(0.01)
+        return len(_loads)
+
+    _counts = await asyncio.gather(
+        *[cache.async_get(key="fot_task", loader=_async_load) for _ in range(10)]
+    )
+    _cached_count = await cache.async_get(key="fot_task", loader=_async_load)
+
+    cache.invalidate(key="fot_task")
+    _reloaded_count = await cache.async_get(key="fot_task", loader=_async_load)
+    return _counts, _cached_count, _reloaded_count
+
+
+def test_row_count_cache_single_flight():
+    _cache = RowCountCache(ttl=60)
+    _counts, _cached_count, _reloaded_count = asyncio.run(
+        _async_get_cached_counts(cache=_cache)
+    )
+
+    assert _counts == [1] * 10
+    assert _cached_count == 1
+    assert _reloaded_count == 2
+    assert _cache.get_stats()["refreshes"] == 2
+
+
+async def _async_cancel_leader(cache: RowCountCache) -> tuple:
+    async def _async_load() -> int:
+        await asyncio.sleep(0.01)
+        return 7
+
+    _leader = asyncio.create_task(cache.async_get(key="fot_task", loader=_async_load))
+    await asyncio.sleep(0)
+    _waiter = asyncio.create_task(cache.async_get(key="fot_task", loader=_async_load))
+    await asyncio.sleep(0)
+    _leader.cancel()
+
+    _count = await _waiter
+    _is_leader_cancelled = _leader.cancelled()
+    return _count, _is_leader_cancelled
+
+
+def test_row_count_cache_leader_cancelled():
+    _cache = RowCountCache(ttl=60)
+    _count, _is_leader_cancelled = asyncio.run(_async_cancel_leader(cache=_cache))
+
+    assert (_count, _is_leader_cancelled) == (7, True)
+    # Refresh finished for the waiter and was cached, in-flight slot is cleared:
+    assert _cache.get_stats()["size"] == 1
+    assert not _cache._inflight
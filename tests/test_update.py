@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+from sqlalchemy import Update, create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.endpoints.task.model import TaskORM
+
+
+def test_values_update_stmt():
+    _stmt = TaskORM._get_values_update_stmt(
+        rows=[{"id": 1, "name": "Task A"}, {"id": 2, "name": "Task B"}],
+        columns=["name"],
+        returning=True,
+    )
+    _compiled = _stmt.compile(dialect=postgresql.psycopg.dialect())
+    _sql = str(_compiled)
+
+    assert "FROM (VALUES" in _sql
+    assert "RETURNING" in _sql
+    assert set(_compiled.params.values()) >= {1, 2, "Task A", "Task B"}
+
+
+async def _async_update(
+    monkeypatch, async_session: AsyncSession, update_returning: bool
+) -> tuple:
+    # Databases without `UPDATE ... RETURNING` (e.g. MySQL) re-select updated rows:
+    _engine = async_session.bind
+    _engine.sync_engine.dialect.update_returning = update_returning
+
+    _updates = []
+
+    @event.listens_for(_engine.sync_engine, "before_cursor_execute")
+    def _count_updates(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE"):
+            _updates.append(len(parameters) if executemany else 1)
+
+    # Small bind parameter budget to split updates into chunks:
+    monkeypatch.setattr(
+        TaskORM, "_get_bulk_batch_size", classmethod(lambda cls, num_columns: 3)
+    )
+    await TaskORM.async_bulk_insert(
+        async_session=async_session,
+        raw_data=[{"name": f"Task {_i}", "point": 70} for _i in range(5)],
+        returning=False,
+    )
+
+    # Same values by chunked `UPDATE ... WHERE id IN (...)`:
+    _orm_objects = await TaskORM.async_update_by_where(
+        async_session=async_session,
+        where={"column": "point", "value": 70},
+        orm_way=True,
+        point=80,
+    )
+    _points = {_orm_object.point for _orm_object in _orm_objects}
+    _chunk_updates = list(_updates)
+    _updates.clear()
+
+    # Modified attributes per row are written once, without unit of work flush:
+    for _orm_object in _orm_objects:
+        _orm_object.name = f"{_orm_object.name} (renamed)"
+
+    _orm_objects = await TaskORM.async_update_objects(
+        async_session=async_session, orm_objects=_orm_objects
+    )
+    await async_session.commit()
+    _row_updates = list(_updates)
+
+    _orm_objects = await TaskORM.async_select_by_where(
+        async_session=async_session, where={"column": "point", "value": 80}
+    )
+    _names = sorted(_orm_object.name for _orm_object in _orm_objects)
+
+    return _chunk_updates, _points, _row_updates, _names
+
+
+@pytest.mark.parametrize("update_returning", [True, False])
+def test_update_by_where_orm_way(
+    monkeypatch, event_loop, async_session, update_returning: bool
+):
+    _chunk_updates, _points, _row_updates, _names = event_loop.run_until_complete(
+        _async_update(
+            monkeypatch=monkeypatch,
+            async_session=async_session,
+            update_returning=update_returning,
+        )
+    )
+
+    assert _chunk_updates == [1, 1, 1]
+    assert _points == {80}
+    # Batches of 3 rows (executemany on SQLite):
+    assert _row_updates == [3, 2]
+    assert _names == [f"Task {_i} (renamed)" for _i in range(5)]
+
+
+async def _async_bulk_update_by_id(monkeypatch, async_session: AsyncSession) -> tuple:
+    _batches = []
+    _get_rows_update_stmt = TaskORM._get_rows_update_stmt
+
+    def _get_batch_rows_update_stmt(cls, columns) -> Update:
+        _batches.append(tuple(columns))
+        return _get_rows_update_stmt(columns=columns)
+
+    monkeypatch.setattr(
+        TaskORM, "_get_rows_update_stmt", classmethod(_get_batch_rows_update_stmt)
+    )
+    monkeypatch.setattr(
+        TaskORM, "_get_bulk_batch_size", classmethod(lambda cls, num_columns: 2)
+    )
+    _orm_objects = await TaskORM.async_bulk_insert(
+        async_session=async_session,
+        raw_data=[{"name": f"Task {_i}", "point": 70} for _i in range(5)],
+    )
+    _ids = [_orm_object.id for _orm_object in _orm_objects]
+
+    # Rows are grouped by updated columns, then batched:
+    _raw_data = [{"id": _id, "name": f"Task {_id}"} for _id in _ids[:3]] + [
+        {"id": _id, "name": f"Task {_id}", "point": 80} for _id in _ids[3:]
+    ]
+    _orm_objects = await TaskORM.async_bulk_update_by_id(
+        async_session=async_session, raw_data=_raw_data
+    )
+    _updated = {
+        _orm_object.id: (_orm_object.name, _orm_object.point)
+        for _orm_object in _orm_objects
+    }
+    _update_batches = list(_batches)
+
+    _errors = []
+    for _raw_data in ([{"id": "not_found", "name": "Task"}], [{"name": "Task"}]):
+        try:
+            await TaskORM.async_bulk_update_by_id(
+                async_session=async_session, raw_data=_raw_data
+            )
+        except Exception as err:
+            _errors.append(type(err).__name__)
+
+    return _ids, _update_batches, _updated, _errors
+
+
+def test_bulk_update_by_id(monkeypatch, event_loop, async_session):
+    _ids, _batches, _updated, _errors = event_loop.run_until_complete(
+        _async_bulk_update_by_id(monkeypatch=monkeypatch, async_session=async_session)
+    )
+
+    assert _batches == [("name",), ("name",), ("name", "point")]
+    assert _updated == {
+        **{_id: (f"Task {_id}", 70) for _id in _ids[:3]},
+        **{_id: (f"Task {_id}", 80) for _id in _ids[3:]},
+    }
+    assert _errors == ["NoResultFound", "ValueError"]
+
+
+def test_bulk_update_by_id_sync():
+    _engine = create_engine("sqlite://")
+    with _engine.begin() as _connection:
+        _connection.execute(CreateTable(TaskORM.__table__))
+
+    with Session(_engine) as _session:
+        _orm_objects = TaskORM.bulk_insert(
+            session=_session,
+            raw_data=[{"name": f"Task {_i}", "point": 70} for _i in range(3)],
+        )
+        _ids = [_orm_object.id for _orm_object in _orm_objects]
+        _orm_objects = TaskORM.bulk_update_by_id(
+            session=_session,
+            raw_data=[
+                {"id": _id, "point": 70 + (_i * 10)} for _i, _id in enumerate(_ids)
+            ],
+            auto_commit=True,
+        )
+        _points = {_orm_object.id: _orm_object.point for _orm_object in _orm_objects}
+
+    _engine.dispose()
+    assert _points == {_id: 70 + (_i * 10) for _i, _id in enumerate(_ids)}
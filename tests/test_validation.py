@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+import inspect
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.core.utils import validate_internal_call
+from src.api.endpoints.task import service
+from src.api.endpoints.task.model import TaskORM
+
+_TASK_ID = "tas1701388800_dc2cc6c9033c4837b6c34c8bb19bb289"
+
+
+def _disable_validation(monkeypatch) -> None:
+    # Same functions as installed with `FOT_API_STRICT_VALIDATION=false`:
+    for _name in ("async_get", "async_update"):
+        _func = getattr(service, _name)
+        monkeypatch.setattr(service, _name, _func.__wrapped__)
+
+    for _name, _attr in inspect.getmembers(TaskORM):
+        _func = getattr(_attr, "__func__", None)
+        if hasattr(_func, "__wrapped__") and isinstance(
+            inspect.getattr_static(TaskORM, _name), classmethod
+        ):
+            monkeypatch.setattr(TaskORM, _name, classmethod(_func.__wrapped__))
+
+
+@pytest.fixture
+def task_session(event_loop, async_session: AsyncSession) -> AsyncSession:
+    event_loop.run_until_complete(
+        TaskORM.async_insert(
+            async_session=async_session,
+            auto_commit=True,
+            id=_TASK_ID,
+            name="Task 1",
+            point=70,
+        )
+    )
+    return async_session
+
+
+async def _async_task_path(async_session: AsyncSession) -> None:
+    # Service calls of get and update task endpoints:
+    await service.async_get(
+        async_session=async_session, request_id="bench_request_id", id=_TASK_ID
+    )
+    await service.async_update(
+        async_session=async_session,
+        request_id="bench_request_id",
+        id=_TASK_ID,
+        point=80,
+    )
+    await async_session.rollback()
+
+
+def test_validate_internal_call_strict():
+    @validate_internal_call
+    def _add(a: int, b: int) -> int:
+        return a + b
+
+    assert _add("1", 2) == 3
+    assert _add.__wrapped__("1", "2") == "12"
+
+
+@pytest.mark.benchmark(group="task_validation")
+@pytest.mark.parametrize("strict", [True, False], ids=["strict", "unvalidated"])
+def test_benchmark_task_path_validation(
+    benchmark, monkeypatch, event_loop, task_session, strict: bool
+):
+    if not strict:
+        _disable_validation(monkeypatch)
+
+    benchmark(lambda: event_loop.run_until_complete(_async_task_path(task_session)))